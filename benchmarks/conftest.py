@@ -0,0 +1,104 @@
+"""Configuration of the benchmarks.
+
+The benchmarks use `pytest-benchmark <https://pytest-benchmark.readthedocs.io>`_
+and are run with ``tox -e benchmarks``, which compares the results with a
+local baseline, if there is one, and fails on regressions. See the developer
+documentation.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, make_dataclass
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from cosmology.api._standard import STANDARD_ATTRIBUTES, STANDARD_METHODS
+
+if TYPE_CHECKING:
+    from cosmology.api import CosmologyNamespace, StandardCosmology
+
+# Array sizes for throughput benchmarks, up to the value of ``--max-size``.
+SIZES = (1, 10**2, 10**4, 10**6, 10**8)
+
+
+def pytest_addoption(parser):
+    """Add the benchmark options."""
+    parser.addoption(
+        "--max-size",
+        type=int,
+        default=10**6,
+        help="largest array size of the throughput benchmarks (at most 10**8)",
+    )
+
+
+def pytest_sessionstart(session):
+    """Only check for regressions if there is a baseline to compare with.
+
+    Baselines are saved per machine and interpreter, so that there is none on
+    a fresh checkout or with another Python version.
+    """
+    bs = getattr(session.config, "_benchmarksession", None)
+    if bs is not None and bs.compare_fail and not bs.compared_mapping:
+        bs.compare_fail = None
+        bs.logger.warning(
+            "No baseline to compare with, so regressions are not checked. "
+            "Create one with `tox -e benchmarks-baseline`."
+        )
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize throughput benchmarks over the array sizes."""
+    if "size" in metafunc.fixturenames:
+        max_size = metafunc.config.getoption("--max-size")
+        metafunc.parametrize("size", [n for n in SIZES if n <= max_size])
+
+
+# ==============================================================================
+
+
+def _return_one(self, /):
+    return np.ones(())
+
+
+def _return_1arg(self, z, /):
+    return z
+
+
+@pytest.fixture(scope="session")
+def cosmology_ns() -> CosmologyNamespace:
+    """The cosmology API namespace."""
+    return SimpleNamespace(constants=SimpleNamespace(G=1, c=2))
+
+
+@pytest.fixture(scope="session")
+def standardcosmo(cosmology_ns) -> StandardCosmology:
+    """A minimal, conforming standard cosmology."""
+
+    @dataclass(frozen=True)
+    class Base:
+        name: str | None = None
+
+        @property
+        def __cosmology_namespace__(self) -> CosmologyNamespace:
+            return cosmology_ns
+
+        @property
+        def constants(self):
+            return cosmology_ns.constants
+
+        @property
+        def not_cosmology_api(self) -> int:
+            return 1
+
+    cls = make_dataclass(
+        "BenchmarkStandardCosmology",
+        [],
+        bases=(Base,),
+        namespace={n: property(_return_one) for n in STANDARD_ATTRIBUTES}
+        | dict.fromkeys(STANDARD_METHODS, _return_1arg),
+        frozen=True,
+    )
+    return cls()
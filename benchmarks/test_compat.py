@@ -0,0 +1,50 @@
+"""Benchmark the compatibility wrappers and helpers."""
+
+from __future__ import annotations
+
+import array
+from dataclasses import dataclass
+
+import numpy as np
+import pytest
+
+from cosmology.api import CosmologyNamespace, CosmologyWrapper
+from cosmology.api.compat import to_array
+
+
+@pytest.fixture(scope="module")
+def wrapper(standardcosmo, cosmology_ns):
+    @dataclass(frozen=True)
+    class ExampleCosmologyWrapper(CosmologyWrapper):
+        cosmo: object
+
+        @property
+        def __cosmology_namespace__(self) -> CosmologyNamespace:
+            return cosmology_ns
+
+        @property
+        def name(self) -> str | None:
+            return None
+
+    return ExampleCosmologyWrapper(standardcosmo)
+
+
+def test_wrapper_api_attribute(benchmark, wrapper):
+    """Access of an attribute defined on the wrapper."""
+    benchmark(getattr, wrapper, "name")
+
+
+def test_wrapper_forwarded_attribute(benchmark, wrapper):
+    """Access of an attribute forwarded to the wrapped object."""
+    benchmark(getattr, wrapper, "not_cosmology_api")
+
+
+def test_wrapper_forwarded_method(benchmark, wrapper):
+    """Call of a method forwarded to the wrapped object."""
+    benchmark(wrapper.comoving_distance, 0.5)
+
+
+def test_to_array_buffer(benchmark, size):
+    """Zero-copy conversion of a buffer."""
+    buffer = array.array("d", bytes(8 * size))
+    benchmark(to_array, buffer, np)
@@ -0,0 +1,30 @@
+"""Benchmark the import time of the package."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+
+import pytest
+
+
+@pytest.fixture
+def clean_modules():
+    """Restore the imported modules after the benchmark."""
+    modules = dict(sys.modules)
+    yield
+    sys.modules.clear()
+    sys.modules.update(modules)
+
+
+def _unimport():
+    for name in list(sys.modules):
+        if name == "cosmology.api" or name.startswith("cosmology.api."):
+            del sys.modules[name]
+    return ("cosmology.api",), {}
+
+
+@pytest.mark.usefixtures("clean_modules")
+def test_import(benchmark):
+    """Import of ``cosmology.api``, without the interpreter start-up."""
+    benchmark.pedantic(importlib.import_module, setup=_unimport, rounds=50)
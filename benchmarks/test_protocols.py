@@ -0,0 +1,30 @@
+"""Benchmark the run-time protocol checks."""
+
+from __future__ import annotations
+
+from typing import Protocol
+
+import pytest
+
+import cosmology.api
+
+PROTOCOLS = [
+    name
+    for name in cosmology.api.__all__
+    if isinstance(obj := getattr(cosmology.api, name), type)
+    and issubclass(obj, Protocol)
+]
+
+
+@pytest.mark.parametrize("name", PROTOCOLS)
+def test_isinstance(benchmark, standardcosmo, name):
+    """Cost of ``isinstance`` for a conforming cosmology."""
+    protocol = getattr(cosmology.api, name)
+    benchmark(isinstance, standardcosmo, protocol)
+
+
+@pytest.mark.parametrize("name", PROTOCOLS)
+def test_isinstance_nonconforming(benchmark, name):
+    """Cost of ``isinstance`` for an object that does not conform."""
+    protocol = getattr(cosmology.api, name)
+    benchmark(isinstance, object(), protocol)
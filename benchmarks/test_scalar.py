@@ -0,0 +1,60 @@
+"""Benchmark the latency of single-redshift calls.
+
+Calls such as ``cosmo.comoving_distance(0.5)`` are dominated by fixed costs,
+not by the evaluation itself. These benchmarks measure the fixed cost of the
+wrappers for Python ``float`` input, compared with calling the wrapped
+cosmology directly, and of the integrals of the utilities for ``float`` input,
+which take a fast path, compared with 0-d arrays.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from cosmology.api.compat import (
+    InstrumentedCosmology,
+    NoOpSpanSink,
+    TracingCosmology,
+)
+from cosmology.api.utils import comoving_distance
+
+Z = 0.5
+
+
+@pytest.fixture(
+    params=["direct", "instrumented", "instrumented-disabled", "tracing"],
+)
+def cosmo(request, standardcosmo):
+    if request.param == "direct":
+        return standardcosmo
+    if request.param == "instrumented":
+        return InstrumentedCosmology(standardcosmo)
+    if request.param == "instrumented-disabled":
+        return InstrumentedCosmology(standardcosmo, enabled=False)
+    return TracingCosmology(standardcosmo, sink=NoOpSpanSink())
+
+
+def test_scalar_one_redshift(benchmark, cosmo):
+    """Call of a method with one ``float`` redshift."""
+    benchmark(cosmo.comoving_distance, Z)
+
+
+def test_scalar_method_lookup_and_call(benchmark, cosmo):
+    """Lookup and call of a method with one ``float`` redshift."""
+
+    def call():
+        return cosmo.comoving_distance(Z)
+
+    benchmark(call)
+
+
+@pytest.mark.parametrize("z", [Z, np.asarray(Z)], ids=["float", "0-d"])
+def test_scalar_comoving_distance(benchmark, z):
+    """Integral of the comoving distance for one redshift."""
+    eds = SimpleNamespace(
+        H_over_H0=lambda z: (1 + z) ** 1.5, hubble_distance=np.asarray(4000.0)
+    )
+    benchmark(comoving_distance, eds, z)
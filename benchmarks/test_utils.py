@@ -0,0 +1,118 @@
+"""Benchmark the utilities."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from cosmology.api.utils import (
+    EisensteinHuPowerSpectrum,
+    MassVariance,
+    RedshiftSampler,
+    T_cmb,
+    cartesian_to_sky,
+    parameter_fingerprint,
+    scale_factor,
+    sky_to_cartesian,
+)
+
+
+def test_parameter_fingerprint(benchmark, standardcosmo):
+    """Fingerprint of a cosmology, which is meant to be cheap enough per call."""
+    benchmark(parameter_fingerprint, standardcosmo)
+
+
+@pytest.fixture
+def z(size):
+    return np.linspace(0.0, 10.0, size)
+
+
+def test_scale_factor_naive(benchmark, z):
+    """Scale factor as ``1 / (1 + z)``, for comparison."""
+    benchmark(lambda z: 1 / (1 + z), z)
+
+
+def test_scale_factor(benchmark, z):
+    """Scale factor in a single new array."""
+    benchmark(scale_factor, z)
+
+
+def test_scale_factor_out(benchmark, z):
+    """Scale factor in a preallocated array."""
+    out = np.empty_like(z)
+    benchmark(scale_factor, z, out=out)
+
+
+def test_T_cmb_out(benchmark, z):
+    """CMB temperature in a preallocated array."""
+    cosmo = SimpleNamespace(T_cmb0=np.asarray(2.7255))
+    out = np.empty_like(z)
+    benchmark(T_cmb, cosmo, z, out=out)
+
+
+@pytest.fixture(scope="module")
+def power_cosmo():
+    return SimpleNamespace(
+        H0=np.asarray(67.74),
+        Omega_m0=np.asarray(0.3089),
+        Omega_b0=np.asarray(0.0486),
+        T_cmb0=np.asarray(2.7255),
+        critical_density0=np.asarray(1.273e11),
+        growth_factor=lambda z: 1 / (1 + np.asarray(z)),
+    )
+
+
+def test_mass_variance_table(benchmark, power_cosmo):
+    """Variance for all radii of the grid, with one FFT."""
+    power = EisensteinHuPowerSpectrum(power_cosmo, sigma8=0.8159, n_s=0.9667)
+    benchmark(MassVariance, power_cosmo, power)
+
+
+def test_sigma_mass(benchmark, power_cosmo, size):
+    """Variance of a tabulated power spectrum for many masses."""
+    power = EisensteinHuPowerSpectrum(power_cosmo, sigma8=0.8159, n_s=0.9667)
+    variance = MassVariance(power_cosmo, power)
+    m = np.geomspace(1e8, 1e16, size)
+    benchmark(variance.sigma_mass, m)
+
+
+@pytest.fixture
+def sky(size):
+    rng = np.random.default_rng(42)
+    ra = rng.uniform(0, 360, size)
+    dec = np.degrees(np.arcsin(rng.uniform(-1, 1, size)))
+    return ra, dec, rng.uniform(0.01, 3.0, size)
+
+
+@pytest.fixture(scope="module")
+def distance_cosmo():
+    """Einstein-de Sitter distances in Mpc."""
+    d_h = 4282.7494
+
+    return SimpleNamespace(
+        comoving_distance=lambda z: 2 * d_h * (1 - (1 + z) ** -0.5),
+        inv_comoving_distance=lambda d: (1 - d / (2 * d_h)) ** -2 - 1,
+        differential_comoving_volume=lambda z: (
+            d_h * (2 * d_h * (1 - (1 + np.asarray(z)) ** -0.5)) ** 2 * (1 + z) ** -1.5
+        ),
+    )
+
+
+def test_sky_to_cartesian(benchmark, distance_cosmo, sky):
+    """Comoving positions of a catalogue in single precision."""
+    benchmark(sky_to_cartesian, distance_cosmo, *sky, dtype=np.float32)
+
+
+def test_cartesian_to_sky(benchmark, distance_cosmo, sky):
+    """Sky coordinates and redshifts of a catalogue."""
+    xyz = sky_to_cartesian(distance_cosmo, *sky)
+    benchmark(cartesian_to_sky, distance_cosmo, xyz)
+
+
+def test_redshift_sampler(benchmark, distance_cosmo, size):
+    """Redshifts of a random catalogue in single precision."""
+    sampler = RedshiftSampler(distance_cosmo, 0.0, 3.0)
+    out = np.empty(size, dtype=np.float32)
+    benchmark(sampler.sample, size, rng=42, out=out)
@@ -39,7 +39,9 @@ from cosmology.api._distances import (
     HasAngularDiameterDistance,
     HasComovingDistance,
     HasComovingVolume,
+    HasConformalTime,
     HasDifferentialComovingVolume,
+    HasDistanceModulus,
     HasInverseComovingDistance,
     HasLookbackDistance,
     HasLookbackTime,
@@ -48,6 +50,7 @@ from cosmology.api._distances import (
     HasProperTime,
     HasScaleFactor,
     HasScaleFactor0,
+    HasSoundHorizon,
     HasTCMB,
     HasTCMB0,
     HasTransverseComovingDistance,
@@ -71,6 +74,7 @@ from cosmology.api._extras import (
 from cosmology.api._namespace import CosmologyNamespace
 from cosmology.api._perturbations import (
     HasGrowthFactor,
+    HasLinearPowerSpectrum,
 )
 from cosmology.api._standard import StandardCosmology
 from cosmology.api.compat import (
@@ -156,8 +160,11 @@ __all__ = [
     "LookbackDistanceMeasures",
     # other distances
     "HasLuminosityDistance",
+    "HasDistanceModulus",
     "HasAngularDiameterDistance",
     "HasAge",
+    "HasConformalTime",
+    "HasSoundHorizon",
     # -- Wrappers --
     "CosmologyWrapper",
     "StandardCosmologyWrapper",
@@ -166,4 +173,5 @@ __all__ = [
     "CosmologyConstantsNamespace",
     # --- Perturbations ---
     "HasGrowthFactor",
+    "HasLinearPowerSpectrum",
 ]
@@ -0,0 +1,96 @@
+"""Array API functions with fallbacks for older versions of the standard.
+
+Namespaces that implement an older version of the standard, such as
+``numpy.array_api``, lack some of the functions used by the utilities. Each
+function here uses the function of the namespace if it exists, and otherwise
+computes the same result with the functions of the 2021.12 standard.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Literal
+
+__all__: list[str] = []
+
+
+def cumulative_sum(x: Any, /) -> Any:  # noqa: ANN401
+    """The cumulative sum of an array along its last axis.
+
+    Uses ``cumulative_sum`` of the namespace, or ``cumsum`` if it has that
+    instead, and otherwise :func:`_prefix_sum`.
+    """
+    xp = x.__array_namespace__()
+    cumsum = getattr(xp, "cumulative_sum", None) or getattr(xp, "cumsum", None)
+    if cumsum is None:
+        return _prefix_sum(xp, x)
+    return cumsum(x, axis=-1)
+
+
+def searchsorted(
+    x1: Any,  # noqa: ANN401
+    x2: Any,  # noqa: ANN401
+    /,
+    *,
+    side: Literal["left", "right"] = "left",
+) -> Any:  # noqa: ANN401
+    """The indices at which to insert ``x2`` into the sorted 1-d ``x1``.
+
+    Uses ``searchsorted`` of the namespace if it exists, and otherwise
+    :func:`_bisect`.
+    """
+    xp = x1.__array_namespace__()
+    if hasattr(xp, "searchsorted"):
+        return xp.searchsorted(x1, x2, side=side)
+    return _bisect(xp, x1, x2, side)
+
+
+def clip(x: Any, lo: float, hi: float, /) -> Any:  # noqa: ANN401
+    """Clamp the elements of ``x`` to the range ``[lo, hi]``.
+
+    Uses ``clip`` of the namespace if it exists, and otherwise ``where``.
+    """
+    xp = x.__array_namespace__()
+    if hasattr(xp, "clip"):
+        return xp.clip(x, lo, hi)
+
+    lo_, hi_ = xp.asarray(lo, dtype=x.dtype), xp.asarray(hi, dtype=x.dtype)
+    return xp.where(x < lo_, lo_, xp.where(x > hi_, hi_, x))
+
+
+# ==============================================================================
+
+
+def _prefix_sum(xp: Any, x: Any, /) -> Any:  # noqa: ANN401
+    """The cumulative sum along the last axis, from shifted partial sums.
+
+    After the step with shift ``k``, each element is the sum of up to ``2*k``
+    elements, so that ``log2(n)`` steps are needed.
+    """
+    n = x.shape[-1]
+    k = 1
+    while k < n:
+        pad = xp.zeros((*x.shape[:-1], k), dtype=x.dtype)
+        x = x + xp.concat([pad, x[..., :-k]], axis=-1)
+        k *= 2
+    return x
+
+
+def _bisect(xp: Any, x1: Any, x2: Any, side: str, /) -> Any:  # noqa: ANN401
+    """The insertion indices, by a simultaneous bisection for all of ``x2``.
+
+    This needs ``log2(len(x1))`` steps and memory of the size of ``x2``.
+    """
+    n = x1.shape[0]
+    lo = xp.zeros(x2.shape, dtype=xp.int64)
+    hi = xp.full(x2.shape, n, dtype=xp.int64)
+    last = xp.asarray(max(n - 1, 0), dtype=xp.int64)
+    for _ in range(n.bit_length()):
+        mid = (lo + hi) // 2
+        # Where the bisection is done, ``mid`` can be ``n``.
+        index = xp.reshape(xp.where(mid < n, mid, last), (-1,))
+        value = xp.reshape(xp.take(x1, index), x2.shape)
+        right = (value < x2) if side == "left" else (value <= x2)
+        active = lo < hi
+        lo = xp.where(active & right, mid + 1, lo)
+        hi = xp.where(active & ~right, mid, hi)
+    return lo
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from typing import Any
+
+__all__: list[str] = []
+
+
+def array_namespace(*xs: object) -> Any:  # noqa: ANN401
+    """
+    Returns the array API namespace of the first argument that has one.
+
+    Python scalars (and any other object without ``__array_namespace__``) are
+    skipped, so that ``float`` inputs can be mixed with arrays.
+
+    Raises
+    ------
+    TypeError
+        If none of the arguments has an ``__array_namespace__`` method.
+
+    """
+    for x in xs:
+        get_namespace = getattr(x, "__array_namespace__", None)
+        if get_namespace is not None:
+            return get_namespace()
+
+    msg = "none of the inputs are arrays with an `__array_namespace__`"
+    raise TypeError(msg)
@@ -433,6 +433,29 @@ class HasAge(Protocol[Array, InputT]):
         """
 
 
+@runtime_checkable
+class HasConformalTime(Protocol[Array, InputT]):
+    """The object has a conformal time method."""
+
+    def conformal_time(self, z: InputT, /) -> Array:
+        r"""Conformal time :math:`\eta` at redshift ``z`` in Gyr.
+
+        The conformal time is :math:`\eta(z) = \int_z^\infty dz' / H(z')`,
+        i.e. the comoving distance of the particle horizon in units of
+        :math:`c`.
+
+        Parameters
+        ----------
+        z : Array or float, positional-only
+            Input redshift.
+
+        Returns
+        -------
+        Array
+
+        """
+
+
 @runtime_checkable
 class HasAngularDiameterDistance(Protocol[Array, InputT]):
     """The object has an angular diameter distance method."""
@@ -510,6 +533,64 @@ class HasLuminosityDistance(Protocol[Array, InputT]):
         """
 
 
+@runtime_checkable
+class HasDistanceModulus(Protocol[Array, InputT]):
+    """The object has a distance modulus method."""
+
+    @overload
+    def distance_modulus(self, z: InputT, /) -> Array: ...
+
+    @overload
+    def distance_modulus(self, z1: InputT, z2: InputT, /) -> Array: ...
+
+    def distance_modulus(self, z1: InputT, z2: InputT | None = None, /) -> Array:
+        r"""Distance modulus :math:`\mu` in magnitudes.
+
+        The distance modulus is the difference between the apparent and the
+        absolute magnitude of an object, :math:`\mu = 5 \log_{10}(d_L / 10
+        \,\mathrm{pc})`, where :math:`d_L` is the luminosity distance.
+
+        Parameters
+        ----------
+        z : Array, positional-only
+        z1, z2 : Array, positional-only
+            Input redshifts. If one argument ``z`` is given, the modulus
+            :math:`\mu(0, z)` is returned. If two arguments ``z1, z2`` are
+            given, the modulus :math:`\mu(z_1, z_2)` is returned.
+
+        Returns
+        -------
+        Array
+            The distance modulus :math:`\mu` in mag.
+
+        """
+
+
+@runtime_checkable
+class HasSoundHorizon(Protocol[Array, InputT]):
+    """The object has a sound horizon method."""
+
+    def sound_horizon(self, z: InputT, /) -> Array:
+        r"""Comoving sound horizon :math:`r_s` at redshift ``z`` in Mpc.
+
+        The sound horizon is the comoving distance that sound travels in the
+        photon--baryon fluid by redshift ``z``, :math:`r_s(z) = \int_z^\infty
+        c_s(z') \, dz' / H(z')`, with the sound speed :math:`c_s = c /
+        \sqrt{3 (1 + R)}` and the baryon loading :math:`R = 3 \rho_b / (4
+        \rho_\gamma)`.
+
+        Parameters
+        ----------
+        z : Array or float, positional-only
+            Input redshift.
+
+        Returns
+        -------
+        Array
+
+        """
+
+
 ##############################################################################
 # Total
 
@@ -32,3 +32,28 @@ class HasGrowthFactor(Protocol[Array, InputT]):
            with respect to initial conditions.
 
         """
+
+
+@runtime_checkable
+class HasLinearPowerSpectrum(Protocol[Array, InputT]):
+    r"""Cosmology has a linear matter power spectrum :math:`P(k, z)`."""
+
+    def linear_power_spectrum(self, k: InputT, z: InputT, /) -> Array:
+        r"""Linear matter power spectrum :math:`P(k, z)` in Mpc\ :sup:`3`.
+
+        The arguments are broadcast against each other, so that the power
+        spectrum on a grid of wavenumbers and redshifts is computed in one
+        call, e.g. with ``k[:, None]`` and ``z[None, :]``.
+
+        Parameters
+        ----------
+        k : Array, positional-only
+            Input wavenumber in Mpc\ :sup:`-1`.
+        z : Array, positional-only
+            Input redshift.
+
+        Returns
+        -------
+        Array
+
+        """
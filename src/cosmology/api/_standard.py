@@ -86,3 +86,35 @@ class StandardCosmology(
 
         """
         ...
+
+
+# ==============================================================================
+# Protocol members
+
+
+def _get_protocol_members(
+    protocol: type, /, base: type = Cosmology
+) -> tuple[frozenset[str], frozenset[str]]:
+    """Get the public attributes and methods of a protocol.
+
+    Parameters
+    ----------
+    protocol : type
+        The protocol class to inspect.
+    base : type, optional
+        Members of this protocol are excluded. Defaults to
+        :class:`~cosmology.api.Cosmology`.
+
+    Returns
+    -------
+    frozenset[str], frozenset[str]
+        The names of the attributes (properties) and methods.
+
+    """
+    public = {k for k in set(dir(protocol)) - set(dir(base)) if not k.startswith("_")}
+    attrs = frozenset(k for k in public if not callable(getattr(protocol, k)))
+    meths = frozenset(k for k in public if callable(getattr(protocol, k)))
+    return attrs, meths
+
+
+STANDARD_ATTRIBUTES, STANDARD_METHODS = _get_protocol_members(StandardCosmology)
@@ -2,10 +2,27 @@
 
 from __future__ import annotations
 
+from cosmology.api.compat._array import to_array
 from cosmology.api.compat._core import CosmologyWrapper
+from cosmology.api.compat._instrument import InstrumentedCosmology, MethodProfile
 from cosmology.api.compat._standard import StandardCosmologyWrapper
+from cosmology.api.compat._tracing import (
+    InMemorySpanSink,
+    NoOpSpanSink,
+    Span,
+    SpanSink,
+    TracingCosmology,
+)
 
 __all__ = [
     "CosmologyWrapper",
+    "InMemorySpanSink",
+    "InstrumentedCosmology",
+    "MethodProfile",
+    "NoOpSpanSink",
+    "Span",
+    "SpanSink",
     "StandardCosmologyWrapper",
+    "TracingCosmology",
+    "to_array",
 ]
@@ -0,0 +1,121 @@
+"""Array interchange for compatability wrappers."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, cast
+
+if TYPE_CHECKING:
+    from cosmology.api._array_api.array import Array
+
+__all__: list[str] = []
+
+
+def to_array(obj: object, /, xp: Any, *, copy: bool | None = None) -> Array:  # noqa: ANN401
+    """Convert the output of a wrapped library to an array, without copying.
+
+    Wrappers around libraries with their own buffer types (e.g. C extensions)
+    would normally convert the library's outputs by copying them into a new
+    array. Instead, if the output supports DLPack (``__dlpack__``) or the Python
+    buffer protocol, this function returns an array of the namespace ``xp``
+    that is a view of the same memory. A wrapped method then costs no more
+    memory than the call to the wrapped library.
+
+    Parameters
+    ----------
+    obj : object, positional-only
+        The output of the wrapped library.
+    xp : namespace
+        The Array API namespace of the returned array, e.g. ``numpy``.
+    copy : bool or None, optional, keyword-only
+        Whether to copy, following the Array API ``asarray`` semantics. If
+        `None` (default), the memory is shared if possible and copied
+        otherwise. If `False`, the memory must be shared and a `ValueError`
+        is raised if that is not possible. If `True`, the data are always
+        copied.
+
+    Returns
+    -------
+    Array
+        An array of namespace ``xp``.
+
+    Raises
+    ------
+    ValueError
+        If ``copy=False`` and ``obj`` cannot be converted without copying.
+
+    Examples
+    --------
+    A buffer from the standard library is converted without copying:
+
+    >>> import array
+    >>> import numpy as np
+    >>> from cosmology.api.compat import to_array
+    >>> buffer = array.array("d", [1.0, 2.0, 3.0])
+    >>> x = to_array(buffer, np, copy=False)
+    >>> buffer[0] = 10.0
+    >>> x
+    array([10.,  2.,  3.])
+
+    """
+    if copy:
+        return _copy(obj, xp)
+
+    # DLPack: the Array API standard guarantees that ``from_dlpack`` does not
+    # copy unless it has to, e.g. across devices.
+    if hasattr(obj, "__dlpack__") and hasattr(xp, "from_dlpack"):
+        try:
+            return cast("Array", xp.from_dlpack(obj))
+        except (BufferError, RuntimeError, TypeError):
+            pass
+
+    # Buffer protocol.
+    try:
+        view = memoryview(obj)  # type: ignore[arg-type]
+    except TypeError:
+        pass
+    else:
+        x = _from_buffer(view, xp)
+        if x is not None:
+            return x
+
+    if copy is False:
+        msg = f"cannot convert {type(obj).__name__!r} to an array without copying"
+        raise ValueError(msg)
+
+    return cast("Array", xp.asarray(obj))
+
+
+# ==============================================================================
+
+
+def _copy(obj: object, xp: Any, /) -> Array:  # noqa: ANN401
+    """Convert to an array of namespace ``xp``, always copying."""
+    try:
+        return cast("Array", xp.asarray(obj, copy=True))
+    except TypeError:
+        # NumPy < 2 has no ``copy`` keyword in ``asarray``.
+        x = xp.asarray(obj)
+        out = xp.empty_like(x)
+        out[...] = x
+        return cast("Array", out)
+
+
+def _from_buffer(view: memoryview, xp: Any, /) -> Array | None:  # noqa: ANN401
+    """An array of namespace ``xp`` sharing the memory of a buffer, if possible."""
+    try:
+        return cast("Array", xp.asarray(view, copy=False))
+    except (NotImplementedError, TypeError):
+        pass
+    except (BufferError, ValueError):
+        return None
+    # NumPy < 2 has no ``copy=False`` in ``asarray``, but it shares the memory
+    # of buffer-protocol objects anyway. Other namespaces may copy instead, so
+    # the array is only returned if it is known to share the memory.
+    try:
+        x = xp.asarray(view)
+    except (BufferError, TypeError, ValueError):
+        return None
+    shares_memory = getattr(xp, "shares_memory", None)
+    if shares_memory is None or not shares_memory(x, view):
+        return None
+    return cast("Array", x)
@@ -0,0 +1,165 @@
+"""Instrumenting wrapper that profiles calls to cosmology methods."""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import time
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+
+from cosmology.api.compat._proxy import _input_size, _MethodProxy
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+__all__: list[str] = []
+
+
+@dataclass
+class MethodProfile:
+    """The accumulated profile of the calls to a method.
+
+    Parameters
+    ----------
+    calls : int
+        The number of calls.
+    elements : int
+        The total number of input elements over all calls. Python scalars
+        count as one element; for methods with two redshift arguments the
+        size of the larger one is counted.
+    max_elements : int
+        The largest number of input elements of any call.
+    time : float
+        The total wall time of all calls, in seconds.
+
+    """
+
+    calls: int = 0
+    elements: int = 0
+    max_elements: int = 0
+    time: float = 0.0
+
+    @property
+    def mean_time(self) -> float:
+        """The mean wall time per call, in seconds."""
+        return self.time / self.calls if self.calls else 0.0
+
+
+class InstrumentedCosmology(_MethodProxy):
+    """Wrap a cosmology to profile the calls to its methods.
+
+    For each method of :class:`~cosmology.api.StandardCosmology`, the number
+    of calls, the number of input elements, and the wall time are recorded in
+    :attr:`profile`. All other attributes are those of the wrapped cosmology,
+    so the instrumented cosmology can be used in its place.
+
+    Instrumentation can be switched off and on by setting :attr:`enabled`.
+    While disabled, methods are returned unwrapped and the overhead is one
+    attribute lookup.
+
+    Parameters
+    ----------
+    cosmo : object, positional-only
+        The cosmology to wrap.
+    methods : iterable of str or None, optional keyword-only
+        The names of the methods to profile. Defaults to all the methods of
+        :class:`~cosmology.api.StandardCosmology`.
+    enabled : bool, optional keyword-only
+        Whether calls are profiled.
+
+    Examples
+    --------
+    >>> from types import SimpleNamespace
+    >>> cosmo = InstrumentedCosmology(
+    ...     SimpleNamespace(comoving_distance=lambda z: 4_000 * z)
+    ... )
+    >>> cosmo.comoving_distance(0.5)
+    2000.0
+    >>> cosmo.profile["comoving_distance"].calls
+    1
+
+    """
+
+    def __init__(
+        self,
+        cosmo: object,
+        /,
+        *,
+        methods: Iterable[str] | None = None,
+        enabled: bool = True,
+    ) -> None:
+        super().__init__(cosmo, methods=methods, enabled=enabled)
+        self.profile: dict[str, MethodProfile] = {}
+
+    def _call(
+        self,
+        name: str,
+        method: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Any:  # noqa: ANN401
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            prof = self.profile.get(name)
+            if prof is None:
+                prof = self.profile[name] = MethodProfile()
+            n = _input_size(args)
+            prof.calls += 1
+            prof.elements += n
+            prof.max_elements = max(prof.max_elements, n)
+            prof.time += elapsed
+
+    def reset_profile(self) -> None:
+        """Discard the recorded profile."""
+        self.profile.clear()
+
+    def profile_to_dict(self) -> dict[str, dict[str, Any]]:
+        """The profile as a dictionary, sorted by descending total time.
+
+        Returns
+        -------
+        dict[str, dict[str, Any]]
+            For each profiled method, the fields of its `MethodProfile` and
+            the mean time per call.
+
+        """
+        items = sorted(self.profile.items(), key=lambda kv: -kv[1].time)
+        return {
+            name: {**asdict(prof), "mean_time": prof.mean_time} for name, prof in items
+        }
+
+    def profile_to_json(self, **kwargs: Any) -> str:  # noqa: ANN401
+        """The profile as JSON.
+
+        Parameters
+        ----------
+        **kwargs : Any
+            Keyword arguments for :func:`json.dumps`.
+
+        Returns
+        -------
+        str
+
+        """
+        return json.dumps(self.profile_to_dict(), **kwargs)
+
+    def profile_to_csv(self) -> str:
+        """The profile as CSV, with one row per method.
+
+        Returns
+        -------
+        str
+
+        """
+        fields = ["method", "calls", "elements", "max_elements", "time", "mean_time"]
+        buf = io.StringIO()
+        writer = csv.DictWriter(buf, fieldnames=fields, lineterminator="\n")
+        writer.writeheader()
+        for name, row in self.profile_to_dict().items():
+            writer.writerow({"method": name, **row})
+        return buf.getvalue()
@@ -0,0 +1,196 @@
+"""Base class for wrappers that intercept calls to cosmology methods."""
+
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING, Any
+
+from cosmology.api._standard import STANDARD_ATTRIBUTES, STANDARD_METHODS
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from typing_extensions import Self
+
+    from cosmology.api._namespace import CosmologyNamespace
+
+__all__: list[str] = []
+
+
+class _MethodProxy:
+    """Wrap a cosmology and intercept calls to selected methods.
+
+    Calls to the selected methods are routed through :meth:`_call` while
+    :attr:`enabled` is true. All other attributes, and all methods while
+    disabled, are the attributes of the wrapped cosmology, so a disabled proxy
+    only costs the attribute forwarding.
+
+    The proxy is an instance of a subclass that has a forwarding attribute
+    for each public attribute of the wrapped cosmology. This is needed for
+    ``isinstance`` checks against runtime-checkable protocols, which look up
+    the attributes statically and so never call :meth:`__getattr__`.
+
+    Parameters
+    ----------
+    cosmo : object, positional-only
+        The cosmology to wrap.
+    methods : iterable of str or None, optional keyword-only
+        The names of the methods to intercept. Defaults to all the methods of
+        :class:`~cosmology.api.StandardCosmology`.
+    enabled : bool, optional keyword-only
+        Whether calls are intercepted.
+
+    """
+
+    def __new__(cls, cosmo: object, /, **kwargs: Any) -> Self:  # noqa: ANN401, ARG004
+        """Create the proxy as an instance of the forwarding subclass."""
+        names = {n for n in dir(cosmo) if not n.startswith("_")}
+        names |= {
+            n for n in STANDARD_ATTRIBUTES | STANDARD_METHODS if hasattr(cosmo, n)
+        }
+        base: type = cls
+        proxy: Self = object.__new__(_forwarding_class(base, frozenset(names)))
+        return proxy
+
+    def __init__(
+        self,
+        cosmo: object,
+        /,
+        *,
+        methods: Iterable[str] | None = None,
+        enabled: bool = True,
+    ) -> None:
+        self.cosmo = cosmo
+        self.methods = frozenset(STANDARD_METHODS if methods is None else methods)
+        self._enabled = enabled
+
+    @property
+    def enabled(self) -> bool:
+        """Whether calls are intercepted."""
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self._enabled = value
+        # Drop the cached methods, so that they are looked up anew.
+        for name in self.methods:
+            self.__dict__.pop(name, None)
+
+    @property
+    def __cosmology_namespace__(self) -> CosmologyNamespace:
+        """The namespace of the wrapped cosmology."""
+        ns: CosmologyNamespace = self.cosmo.__cosmology_namespace__  # type: ignore[attr-defined]
+        return ns
+
+    @property
+    def name(self) -> str | None:
+        """The name of the wrapped cosmology."""
+        name: str | None = getattr(self.cosmo, "name", None)
+        return name
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        """Get an attribute of the wrapped cosmology.
+
+        Parameters
+        ----------
+        name : str
+            The name of the attribute to get.
+
+        Returns
+        -------
+        Any
+            The attribute of the wrapped cosmology, or an intercepting wrapper
+            around it if it is one of the selected methods and the proxy is
+            enabled.
+
+        """
+        # Guard against recursion before ``__init__`` has run, e.g. when
+        # unpickling.
+        if "cosmo" not in self.__dict__:
+            raise AttributeError(name)
+
+        attr = getattr(self.cosmo, name)
+        if name not in self.methods or not callable(attr):
+            return attr
+
+        if self._enabled:
+            attr = self._wrap(name, attr)
+
+        # Cache the method on the proxy, so that later lookups do not go
+        # through ``__getattr__``. This matters for single-redshift calls.
+        self.__dict__[name] = attr
+        return attr
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.cosmo!r})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # The forwarding subclass cannot be pickled by name, so the proxy is
+        # recreated from its base class. The cached methods are not pickled.
+        base = type(self).__bases__[0]
+        state = {k: v for k, v in self.__dict__.items() if k not in self.methods}
+        return (base.__new__, (base, self.cosmo), state)
+
+    def _wrap(self, name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap a method so that calls go through :meth:`_call`."""
+
+        @functools.wraps(method)
+        def wrapped(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            return self._call(name, method, args, kwargs)
+
+        return wrapped
+
+    def _call(
+        self,
+        name: str,
+        method: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Any:  # noqa: ANN401
+        """Call an intercepted method. Subclasses override this."""
+        return method(*args, **kwargs)
+
+
+# ===================================================================
+
+
+class _Forward:
+    """Forward an attribute lookup to :meth:`_MethodProxy.__getattr__`.
+
+    This is a non-data descriptor, so that the methods cached in the instance
+    dictionary take precedence.
+    """
+
+    def __init__(self, name: str, /) -> None:
+        self.name = name
+
+    def __get__(self, obj: _MethodProxy | None, objtype: type | None = None) -> Any:  # noqa: ANN401
+        if obj is None:
+            return self
+        return obj.__getattr__(self.name)
+
+
+@functools.lru_cache(maxsize=128)
+def _forwarding_class(cls: type, names: frozenset[str], /) -> type:
+    """The subclass of a proxy class that forwards the given attributes."""
+    namespace: dict[str, Any] = {
+        name: _Forward(name) for name in names if not hasattr(cls, name)
+    }
+    namespace["__qualname__"] = cls.__qualname__
+    namespace["__module__"] = cls.__module__
+    namespace["__doc__"] = cls.__doc__
+    return type(cls.__name__, (cls,), namespace)
+
+
+def _input_size(args: tuple[Any, ...], /) -> int:
+    """The number of elements of the (broadcast) redshift inputs."""
+    size = 1
+    for arg in args:
+        if isinstance(arg, (float, int)):  # fast path for Python scalars
+            continue
+        shape = getattr(arg, "shape", ())
+        n = 1
+        for s in shape:
+            n *= s if s is not None else 0
+        size = max(size, n)
+    return size
@@ -0,0 +1,192 @@
+"""Tracing wrapper that emits spans around calls to cosmology methods."""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+
+from cosmology.api.compat._proxy import _MethodProxy
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+__all__: list[str] = []
+
+
+# The default maximum number of spans kept by an `InMemorySpanSink`.
+_MAXLEN = 10_000
+
+
+@dataclass(frozen=True)
+class Span:
+    """A timed call to a cosmology method.
+
+    The fields follow the conventions of OpenTelemetry spans, so that a sink
+    can forward spans to a tracing backend.
+
+    Parameters
+    ----------
+    name : str
+        The name of the span, ``"cosmology.<method>"``.
+    start_time_ns : int
+        The start time of the call, in nanoseconds since the epoch.
+    duration_ns : int
+        The duration of the call, in nanoseconds, from a monotonic clock.
+    attributes : dict[str, Any]
+        The attributes of the call: the method name (``"cosmology.method"``),
+        the name of the cosmology (``"cosmology.name"``), and the shape
+        (``"array.shape"``) and dtype (``"array.dtype"``) of the result.
+    error : str or None
+        The type and message of the exception raised by the call, if any.
+
+    """
+
+    name: str
+    start_time_ns: int
+    duration_ns: int
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+    @property
+    def end_time_ns(self) -> int:
+        """The end time of the call, in nanoseconds since the epoch."""
+        return self.start_time_ns + self.duration_ns
+
+
+@runtime_checkable
+class SpanSink(Protocol):
+    """The protocol for receivers of the spans of a `TracingCosmology`."""
+
+    def emit(self, span: Span, /) -> None:
+        """Receive a span.
+
+        Parameters
+        ----------
+        span : Span, positional-only
+            The span of a finished call.
+
+        """
+        ...
+
+
+class NoOpSpanSink:
+    """A span sink that discards all spans."""
+
+    def emit(self, span: Span, /) -> None:
+        """Discard the span."""
+
+
+class InMemorySpanSink:
+    """A span sink that keeps the latest spans in a deque.
+
+    Parameters
+    ----------
+    maxlen : int or None, optional keyword-only
+        The maximum number of spans to keep, 10 000 by default. Once full, the
+        oldest spans are discarded. If `None`, all spans are kept, so that
+        memory grows with every call.
+
+    """
+
+    def __init__(self, *, maxlen: int | None = _MAXLEN) -> None:
+        self.maxlen = maxlen
+        self.spans: deque[Span] = deque(maxlen=maxlen)
+
+    def emit(self, span: Span, /) -> None:
+        """Append the span, discarding the oldest if full."""
+        self.spans.append(span)
+
+    def clear(self) -> None:
+        """Discard all spans."""
+        self.spans.clear()
+
+
+class TracingCosmology(_MethodProxy):
+    """Wrap a cosmology to emit a tracing span for each method call.
+
+    Each call to a method of :class:`~cosmology.api.StandardCosmology` emits a
+    `Span` with the method name, the shape and dtype of the result, and the
+    duration to :attr:`sink`. All other attributes are those of the wrapped
+    cosmology, so the tracing cosmology can be used in its place.
+
+    Tracing can be switched off and on by setting :attr:`enabled`. While
+    disabled, methods are returned unwrapped.
+
+    The tracing cosmology is a :class:`~cosmology.api.CosmologyWrapper` of the
+    wrapped cosmology, which can itself be a wrapper, so that tracing can be
+    added to any wrapper without changing it.
+
+    Parameters
+    ----------
+    cosmo : object, positional-only
+        The cosmology to wrap.
+    sink : SpanSink or None, optional keyword-only
+        The receiver of the spans. Defaults to a new `InMemorySpanSink`, which
+        keeps the latest spans.
+    methods : iterable of str or None, optional keyword-only
+        The names of the methods to trace. Defaults to all the methods of
+        :class:`~cosmology.api.StandardCosmology`.
+    enabled : bool, optional keyword-only
+        Whether calls are traced.
+
+    Examples
+    --------
+    >>> from types import SimpleNamespace
+    >>> cosmo = TracingCosmology(
+    ...     SimpleNamespace(name="example", comoving_distance=lambda z: 4_000 * z)
+    ... )
+    >>> cosmo.comoving_distance(0.5)
+    2000.0
+    >>> cosmo.sink.spans[0].name
+    'cosmology.comoving_distance'
+
+    """
+
+    def __init__(
+        self,
+        cosmo: object,
+        /,
+        *,
+        sink: SpanSink | None = None,
+        methods: Iterable[str] | None = None,
+        enabled: bool = True,
+    ) -> None:
+        super().__init__(cosmo, methods=methods, enabled=enabled)
+        self.sink: SpanSink = InMemorySpanSink() if sink is None else sink
+
+    def _call(
+        self,
+        name: str,
+        method: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Any:  # noqa: ANN401
+        start_ns = time.time_ns()
+        start = time.perf_counter_ns()
+        result = error = None
+        try:
+            result = method(*args, **kwargs)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            duration = time.perf_counter_ns() - start
+            shape = getattr(result, "shape", None)
+            dtype = getattr(result, "dtype", None)
+            self.sink.emit(
+                Span(
+                    name=f"cosmology.{name}",
+                    start_time_ns=start_ns,
+                    duration_ns=duration,
+                    attributes={
+                        "cosmology.method": name,
+                        "cosmology.name": self.name,
+                        "array.shape": None if shape is None else tuple(shape),
+                        "array.dtype": None if dtype is None else str(dtype),
+                    },
+                    error=error,
+                )
+            )
+        return result
@@ -0,0 +1,18 @@
+"""Tools for checking implementations of the Cosmology API."""
+
+from __future__ import annotations
+
+from cosmology.api.testing._harness import (
+    CosmologyReport,
+    MethodTiming,
+    benchmark_cosmology,
+)
+from cosmology.api.testing._precision import PrecisionResult, precision_report
+
+__all__ = [
+    "CosmologyReport",
+    "MethodTiming",
+    "benchmark_cosmology",
+    "PrecisionResult",
+    "precision_report",
+]
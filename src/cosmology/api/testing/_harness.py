@@ -0,0 +1,317 @@
+"""Conformance and performance harness for Cosmology API implementations."""
+
+from __future__ import annotations
+
+import inspect
+import json
+import platform
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import cosmology.api
+from cosmology.api._array_api.namespace import array_namespace
+from cosmology.api._standard import (
+    STANDARD_ATTRIBUTES,
+    STANDARD_METHODS,
+    StandardCosmology,
+)
+from cosmology.api.testing._precision import _INPUT_FROM_REDSHIFT
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+__all__: list[str] = []
+
+
+@dataclass(frozen=True)
+class MethodTiming:
+    """Timing of a cosmology method for one kind of input.
+
+    Parameters
+    ----------
+    method : str
+        The name of the method.
+    nargs : int
+        The number of redshift arguments, 1 or 2 (e.g. ``d(z)`` or
+        ``d(z1, z2)``).
+    size : int or None
+        The size of the input arrays, or `None` for Python ``float`` input.
+    calls : int
+        The number of calls per timing repeat.
+    best : float
+        The best time per call over all repeats, in seconds.
+    mean : float
+        The mean time per call over all repeats, in seconds.
+
+    """
+
+    method: str
+    nargs: int
+    size: int | None
+    calls: int
+    best: float
+    mean: float
+
+    @property
+    def throughput(self) -> float:
+        """The number of evaluated elements per second, from the best time."""
+        return (1 if self.size is None else self.size) / self.best
+
+
+@dataclass(frozen=True)
+class CosmologyReport:
+    """Report of the conformance and performance of a cosmology.
+
+    Parameters
+    ----------
+    cosmology : str
+        The type and name of the cosmology.
+    protocols : dict[str, bool]
+        For each protocol exported by :mod:`cosmology.api`, whether the
+        cosmology is an instance of it.
+    missing : tuple[str, ...]
+        The attributes and methods of :class:`~cosmology.api.StandardCosmology`
+        that the cosmology does not have.
+    errors : dict[str, str]
+        Conformance errors found by calling the methods, keyed by method name.
+        Checked are that methods accept ``float`` and array input (and two
+        redshifts, where the API has that overload) and return arrays of the
+        expected shape.
+    timings : tuple[MethodTiming, ...]
+        The timings of all methods that passed the conformance checks.
+    environment : dict[str, str]
+        The Python version and platform.
+
+    """
+
+    cosmology: str
+    protocols: dict[str, bool]
+    missing: tuple[str, ...]
+    errors: dict[str, str]
+    timings: tuple[MethodTiming, ...]
+    environment: dict[str, str] = field(
+        default_factory=lambda: {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+        }
+    )
+
+    @property
+    def conformant(self) -> bool:
+        """Whether the cosmology is a conformant standard cosmology."""
+        return not self.missing and not self.errors
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the report to a dictionary of JSON-serialisable values."""
+        out = asdict(self)
+        out["conformant"] = self.conformant
+        out["timings"] = [
+            {**asdict(t), "throughput": t.throughput} for t in self.timings
+        ]
+        return out
+
+    def to_json(self, **kwargs: Any) -> str:  # noqa: ANN401
+        """Convert the report to JSON.
+
+        Parameters
+        ----------
+        **kwargs : Any
+            Keyword arguments for :func:`json.dumps`.
+
+        Returns
+        -------
+        str
+
+        """
+        return json.dumps(self.to_dict(), **kwargs)
+
+
+def benchmark_cosmology(  # noqa: PLR0913
+    cosmo: object,
+    /,
+    *,
+    sizes: Sequence[int] = (1, 1_000, 1_000_000),
+    zmax: float = 10.0,
+    methods: Iterable[str] | None = None,
+    repeat: int = 5,
+    min_time: float = 0.01,
+    xp: Any = None,  # noqa: ANN401
+) -> CosmologyReport:
+    """Check the conformance and measure the performance of a cosmology.
+
+    This harness takes any object that claims to be a
+    :class:`~cosmology.api.StandardCosmology` (or any part of it) and
+
+    1. checks which protocols of the Cosmology API it conforms to, and which
+       attributes and methods of the standard cosmology it is missing;
+    2. calls each of its methods to check that it accepts ``float`` and array
+       input, and two redshifts for methods with the two-argument overload,
+       and that it returns arrays of the right shape;
+    3. times each conforming method for ``float`` input and for arrays of
+       each of the ``sizes``, with one and (where applicable) two redshift
+       arguments.
+
+    The returned report can be converted to JSON with
+    :meth:`CosmologyReport.to_json`, so that different implementations can be
+    compared objectively.
+
+    Parameters
+    ----------
+    cosmo : object, positional-only
+        The cosmology to check.
+    sizes : sequence of int, optional keyword-only
+        The sizes of the input arrays for the timings.
+    zmax : float, optional keyword-only
+        The maximum redshift of the inputs. Inputs are evenly spaced between
+        ``zmax / size`` and ``zmax``.
+    methods : iterable of str or None, optional keyword-only
+        The methods to check and time. Defaults to all the methods of
+        :class:`~cosmology.api.StandardCosmology`.
+    repeat : int, optional keyword-only
+        The number of timing repeats.
+    min_time : float, optional keyword-only
+        The minimum duration of each timing repeat, in seconds. The number of
+        calls per repeat is increased until this is reached.
+    xp : namespace or None, optional keyword-only
+        The Array API namespace for creating input arrays. Defaults to the
+        namespace of the arrays returned by the cosmology.
+
+    Returns
+    -------
+    CosmologyReport
+
+    """
+    names = sorted(STANDARD_METHODS if methods is None else methods)
+    members = STANDARD_ATTRIBUTES | STANDARD_METHODS
+    missing = tuple(sorted(n for n in members if not hasattr(cosmo, n)))
+    protocols = {
+        name: isinstance(cosmo, getattr(cosmology.api, name))
+        for name in cosmology.api.__all__
+    }
+
+    # The input namespace defaults to the one of the outputs of the first
+    # method that can be called; the methods that fail are errors.
+    present = [n for n in names if hasattr(cosmo, n)]
+    errors: dict[str, str] = {}
+    for name in present:
+        if xp is not None:
+            break
+        try:
+            xp = array_namespace(getattr(cosmo, name)(0.5))
+        except Exception as e:  # noqa: BLE001
+            errors[name] = f"{type(e).__name__}: {e}"
+
+    timings: list[MethodTiming] = []
+    for name in present:
+        if name in errors:
+            continue
+        method = getattr(cosmo, name)
+        nargs = 2 if _takes_two_redshifts(name) else 1
+
+        try:
+            _check_method(cosmo, name, nargs, xp)
+        except Exception as e:  # noqa: BLE001
+            errors[name] = f"{type(e).__name__}: {e}"
+            continue
+
+        for size in (None, *sizes):
+            for n in range(1, nargs + 1):
+                args = _inputs(cosmo, name, n, size=size, zmax=zmax, xp=xp)
+                calls, times = _time(method, args, repeat, min_time)
+                timings.append(
+                    MethodTiming(
+                        method=name,
+                        nargs=n,
+                        size=size,
+                        calls=calls,
+                        best=min(times),
+                        mean=sum(times) / len(times),
+                    )
+                )
+
+    cosmo_name = getattr(cosmo, "name", None)
+    label = type(cosmo).__name__
+    if cosmo_name is not None:
+        label += f"({cosmo_name!r})"
+    return CosmologyReport(
+        cosmology=label,
+        protocols=protocols,
+        missing=missing,
+        errors=errors,
+        timings=tuple(timings),
+    )
+
+
+# ==============================================================================
+
+
+def _takes_two_redshifts(name: str, /) -> bool:
+    """Whether a standard cosmology method has a two-redshift overload."""
+    meth = getattr(StandardCosmology, name, None)
+    if meth is None:
+        return False
+    return len(inspect.signature(meth).parameters) == 3  # noqa: PLR2004
+
+
+def _inputs(  # noqa: PLR0913
+    cosmo: object,
+    name: str,
+    nargs: int,
+    /,
+    *,
+    size: int | None,
+    zmax: float,
+    xp: Any,  # noqa: ANN401
+) -> tuple[Any, ...]:
+    """The inputs for a method call."""
+    if size is None:
+        z = zmax / 2
+    else:
+        z = xp.linspace(zmax / size, zmax, size, dtype=xp.float64)
+
+    if name in _INPUT_FROM_REDSHIFT:
+        z = getattr(cosmo, _INPUT_FROM_REDSHIFT[name])(z)
+    return (z,) if nargs == 1 else (z / 2, z)
+
+
+def _check_method(cosmo: object, name: str, nargs: int, xp: Any) -> None:  # noqa: ANN401
+    """Check that a method accepts the API inputs and returns arrays."""
+    method = getattr(cosmo, name)
+    for n in range(1, nargs + 1):
+        for size in (None, 3):
+            out = method(*_inputs(cosmo, name, n, size=size, zmax=1.0, xp=xp))
+            # Not ``isinstance(out, Array)``, which evaluates properties such as
+            # ``T`` that raise for some valid arrays, and is false for the array
+            # scalars returned by NumPy for 0-d results.
+            if not hasattr(out, "__array_namespace__"):
+                msg = f"returned {type(out).__name__}, not an array"
+                raise TypeError(msg)
+            shape = () if size is None else (size,)
+            if tuple(out.shape) != shape:
+                msg = f"returned shape {tuple(out.shape)} for input shape {shape}"
+                raise ValueError(msg)
+
+
+def _time(
+    method: Callable[..., Any], args: tuple[Any, ...], repeat: int, min_time: float
+) -> tuple[int, list[float]]:
+    """Time a method call, like :mod:`timeit` with auto-ranging."""
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            method(*args)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        calls *= 2 if elapsed == 0 else max(2, int(min_time / elapsed) + 1)
+
+    times = [elapsed / calls]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(calls):
+            method(*args)
+        times.append((time.perf_counter() - start) / calls)
+    return calls, times
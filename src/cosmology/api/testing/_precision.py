@@ -0,0 +1,122 @@
+"""Floating-point precision of Cosmology API implementations."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from cosmology.api._array_api.namespace import array_namespace
+from cosmology.api._standard import STANDARD_METHODS
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from cosmology.api._array_api.array import Array
+
+__all__: list[str] = []
+
+
+# Methods whose input is not a redshift, mapped to the method that computes
+# their input from a redshift.
+_INPUT_FROM_REDSHIFT = {"inv_comoving_distance": "comoving_distance"}
+
+
+@dataclass(frozen=True)
+class PrecisionResult:
+    """Accuracy of a method evaluated at reduced floating-point precision.
+
+    Parameters
+    ----------
+    method : str
+        The name of the cosmology method.
+    dtype : object
+        The data type of the output for the reduced-precision input.
+    dtype_preserved : bool
+        Whether the output has the same data type as the reduced-precision
+        input, i.e. whether the computation stayed in reduced precision.
+    max_rel_error : float
+        The maximum relative error of the reduced-precision output with respect
+        to the reference-precision output. Where the reference output is zero
+        the absolute error is used instead.
+
+    """
+
+    method: str
+    dtype: object
+    dtype_preserved: bool
+    max_rel_error: float
+
+
+def precision_report(
+    cosmo: object,
+    z: Array,
+    /,
+    *,
+    dtype: object | None = None,
+    methods: Iterable[str] | None = None,
+) -> dict[str, PrecisionResult]:
+    """Compare cosmology methods at reduced and reference precision.
+
+    Each method is evaluated once with the redshifts ``z`` as given (the
+    reference, normally ``float64``) and once with ``z`` cast to ``dtype``. The
+    report contains the output data type for the reduced-precision input and
+    the maximum relative error, which together give the accuracy envelope of
+    a "fast mode" in which a conformant implementation keeps all of its
+    computation in the data type of its input.
+
+    Parameters
+    ----------
+    cosmo : object
+        The cosmology to check. Only methods that it has are evaluated, so any
+        subset of :class:`~cosmology.api.StandardCosmology` can be checked.
+    z : Array, positional-only
+        The redshifts at which to evaluate the methods, in the reference
+        precision. Must be an Array API array.
+    dtype : dtype, optional
+        The reduced-precision data type. Defaults to ``float32`` from the array
+        namespace of ``z``.
+    methods : iterable of str, optional
+        The names of the methods to check. Defaults to all methods of
+        :class:`~cosmology.api.StandardCosmology`. Each method is called with a
+        single redshift argument, except ``inv_comoving_distance`` which is
+        called with the comoving distance at ``z``.
+
+    Returns
+    -------
+    dict[str, PrecisionResult]
+        The results, keyed and sorted by method name.
+
+    """
+    xp = array_namespace(z)
+    dtype = xp.float32 if dtype is None else dtype
+    names = sorted(STANDARD_METHODS if methods is None else methods)
+
+    report = {}
+    for name in names:
+        method = getattr(cosmo, name, None)
+        if method is None:
+            continue
+
+        x = z
+        if name in _INPUT_FROM_REDSHIFT:
+            x = getattr(cosmo, _INPUT_FROM_REDSHIFT[name])(z)
+
+        ref = _asfloat64(xp, method(x))
+        out = method(xp.astype(x, dtype))
+        err = xp.abs(_asfloat64(xp, out) - ref)
+        scale = xp.abs(ref)
+        scale = xp.where(scale == 0, xp.ones_like(scale), scale)
+
+        report[name] = PrecisionResult(
+            method=name,
+            dtype=out.dtype,
+            dtype_preserved=out.dtype == dtype,
+            max_rel_error=float(xp.max(err / scale)),
+        )
+
+    return report
+
+
+def _asfloat64(xp: Any, x: Array, /) -> Array:  # noqa: ANN401
+    out: Array = xp.astype(xp.asarray(x), xp.float64)
+    return out
@@ -0,0 +1,76 @@
+"""Utilities built on the Cosmology API."""
+
+from __future__ import annotations
+
+from cosmology.api.utils._background import T_cmb, scale_factor
+from cosmology.api.utils._bao import (
+    BAOObservables,
+    bao_observables,
+    sound_horizon_drag,
+)
+from cosmology.api.utils._cache import TableCache
+from cosmology.api.utils._coordinates import cartesian_to_sky, sky_to_cartesian
+from cosmology.api.utils._fingerprint import (
+    FINGERPRINT_PARAMETERS,
+    parameter_fingerprint,
+)
+from cosmology.api.utils._halo import (
+    HaloMass,
+    convert_halo_mass,
+    spherical_overdensity,
+)
+from cosmology.api.utils._horizon import HorizonTable, horizon_table
+from cosmology.api.utils._integrate import comoving_distance, lookback_time
+from cosmology.api.utils._lensing import (
+    LensDistances,
+    critical_surface_density,
+    critical_surface_density_blocks,
+    lens_distances,
+    time_delay_distance,
+)
+from cosmology.api.utils._lightcone import LightconeShells, lightcone_shells
+from cosmology.api.utils._limber import LimberIntegrator
+from cosmology.api.utils._photometry import distance_modulus
+from cosmology.api.utils._power import (
+    EisensteinHuPowerSpectrum,
+    eisenstein_hu_transfer,
+)
+from cosmology.api.utils._randoms import RedshiftSampler
+from cosmology.api.utils._shared import SharedTables, SharedTablesHandle
+from cosmology.api.utils._variance import MassVariance, mass_variance
+
+__all__ = [
+    "FINGERPRINT_PARAMETERS",
+    "parameter_fingerprint",
+    "TableCache",
+    "SharedTables",
+    "SharedTablesHandle",
+    "comoving_distance",
+    "lookback_time",
+    "LightconeShells",
+    "lightcone_shells",
+    "distance_modulus",
+    "scale_factor",
+    "T_cmb",
+    "critical_surface_density",
+    "critical_surface_density_blocks",
+    "LensDistances",
+    "lens_distances",
+    "time_delay_distance",
+    "BAOObservables",
+    "bao_observables",
+    "sound_horizon_drag",
+    "HorizonTable",
+    "horizon_table",
+    "eisenstein_hu_transfer",
+    "EisensteinHuPowerSpectrum",
+    "MassVariance",
+    "mass_variance",
+    "HaloMass",
+    "convert_halo_mass",
+    "spherical_overdensity",
+    "LimberIntegrator",
+    "sky_to_cartesian",
+    "cartesian_to_sky",
+    "RedshiftSampler",
+]
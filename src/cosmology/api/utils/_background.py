@@ -0,0 +1,111 @@
+"""Allocation-free scale factor and CMB temperature."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, cast
+
+from cosmology.api._array_api.namespace import array_namespace
+
+if TYPE_CHECKING:
+    from cosmology.api._array_api.array import Array
+    from cosmology.api._distances import HasTCMB0
+
+__all__: list[str] = []
+
+
+def scale_factor(z: Array | float, /, *, out: Array | None = None) -> Array:
+    r"""Scale factor :math:`a = 1 / (1 + z)`.
+
+    This is a reference implementation of
+    :meth:`~cosmology.api.HasScaleFactor.scale_factor`. The result is computed
+    in place, in a single new array or in ``out``.
+
+    Parameters
+    ----------
+    z : Array or float, positional-only
+        The redshifts. A Python scalar without ``out`` gives a 0-d NumPy
+        array, as there is no other array namespace to use.
+    out : Array or None, optional keyword-only
+        The array in which to store the result. It must have the shape of
+        ``z`` and a real floating-point data type, and may be ``z`` itself.
+
+    Returns
+    -------
+    Array
+        The scale factor, which is ``out`` if given. It has the data type of
+        ``z`` (or ``out``), or ``float64`` for integer redshifts.
+
+    Raises
+    ------
+    TypeError
+        If ``out`` does not have a real floating-point data type.
+
+    """
+    try:
+        xp = array_namespace(z, out)
+    except TypeError:
+        import numpy as np  # noqa: PLC0415
+
+        return cast("Array", np.asarray(1 / (1 + float(z))))
+    a = _plus_one(xp, z, out)
+    a **= -1
+    return a
+
+
+def T_cmb(
+    cosmo: HasTCMB0[Array], z: Array | float, /, *, out: Array | None = None
+) -> Array:
+    r"""CMB temperature :math:`T_{\rm CMB}(z) = T_{\rm CMB,0} (1 + z)` in K.
+
+    This is a reference implementation of :meth:`~cosmology.api.HasTCMB.T_cmb`.
+    The result is computed in place, in a single new array or in ``out``.
+
+    Parameters
+    ----------
+    cosmo : `~cosmology.api.HasTCMB0`, positional-only
+        The cosmology.
+    z : Array or float, positional-only
+        The redshifts.
+    out : Array or None, optional keyword-only
+        The array in which to store the result. It must have the shape of
+        ``z`` and a real floating-point data type, and may be ``z`` itself.
+
+    Returns
+    -------
+    Array
+        The CMB temperature, which is ``out`` if given. It has the data type
+        of ``z`` (or ``out``), or ``float64`` for integer redshifts.
+
+    Raises
+    ------
+    TypeError
+        If ``out`` does not have a real floating-point data type.
+
+    """
+    xp = array_namespace(z, out, cosmo.T_cmb0)
+    t = _plus_one(xp, z, out)
+    # A Python float, so that the data type of the result is not promoted.
+    t *= float(cosmo.T_cmb0)
+    return t
+
+
+# ==============================================================================
+
+
+def _plus_one(xp: Any, z: Array | float, out: Array | None, /) -> Array:  # noqa: ANN401
+    """``1 + z``, in a new floating-point array or in ``out``."""
+    if out is None:
+        za = xp.asarray(z)
+        if xp.isdtype(za.dtype, "real floating"):
+            return cast("Array", za + 1)
+        # The converted array is new, so it can be changed in place.
+        za = xp.astype(za, xp.float64)
+        za += 1
+        return cast("Array", za)
+    if not xp.isdtype(out.dtype, "real floating"):
+        msg = f"out must have a real floating-point data type, not {out.dtype}"
+        raise TypeError(msg)
+    if out is not z:
+        out[...] = z
+    out += 1
+    return out
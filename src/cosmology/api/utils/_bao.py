@@ -0,0 +1,192 @@
+"""Baryon acoustic oscillation observables."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Protocol, cast
+
+from cosmology.api._array_api.namespace import array_namespace
+from cosmology.api._components import HasMNu, HasOmegaB0, HasOmegaDM0, HasOmegaK0
+from cosmology.api._distances import HasComovingDistance
+from cosmology.api._extras import HasHoverH0, HasHubbleDistance, HasLittleH
+
+if TYPE_CHECKING:
+    from cosmology.api._array_api.array import Array
+
+__all__: list[str] = []
+
+
+# The neutrino mass in eV for a neutrino density omega_nu = Omega_nu0 h^2 of 1.
+_EV_PER_OMEGA_NU = 93.14
+
+
+class _BAOCosmology(
+    HasComovingDistance[Any, Any],
+    HasHoverH0[Any, Any],
+    HasHubbleDistance[Any],
+    HasOmegaK0[Any],
+    Protocol,
+):
+    """The cosmology attributes needed for BAO observables."""
+
+
+class _SoundHorizonCosmology(
+    HasOmegaDM0[Any],
+    HasOmegaB0[Any],
+    HasLittleH[Any],
+    HasMNu[Any],
+    Protocol,
+):
+    """The cosmology attributes needed for the sound horizon."""
+
+
+@dataclass(frozen=True)
+class BAOObservables:
+    """The distances measured by baryon acoustic oscillations.
+
+    Parameters
+    ----------
+    D_M : Array
+        The transverse comoving distance, in Mpc.
+    D_H : Array
+        The Hubble distance :math:`c / H(z)`, in Mpc.
+    D_V : Array
+        The spherically averaged distance :math:`(z D_M^2 D_H)^{1/3}`, in Mpc.
+    r_d : Array or float or None
+        The sound horizon at the drag epoch, in Mpc, if given.
+
+    """
+
+    D_M: Array
+    D_H: Array
+    D_V: Array
+    r_d: Array | float | None = None
+
+    @property
+    def DM_over_rd(self) -> Array:
+        """The ratio :math:`D_M / r_d`."""
+        return self._over_rd(self.D_M)
+
+    @property
+    def DH_over_rd(self) -> Array:
+        """The ratio :math:`D_H / r_d`."""
+        return self._over_rd(self.D_H)
+
+    @property
+    def DV_over_rd(self) -> Array:
+        """The ratio :math:`D_V / r_d`."""
+        return self._over_rd(self.D_V)
+
+    def _over_rd(self, d: Array, /) -> Array:
+        if self.r_d is None:
+            msg = "the sound horizon r_d is not known"
+            raise ValueError(msg)
+        return d / self.r_d
+
+
+def bao_observables(
+    cosmo: _BAOCosmology, z: Array | float, /, *, r_d: Array | float | None = None
+) -> BAOObservables:
+    r"""BAO distances from a single comoving distance evaluation.
+
+    The transverse comoving distance :math:`D_M`, the Hubble distance
+    :math:`D_H = c / H(z)`, and the spherically averaged distance
+    :math:`D_V = (z D_M^2 D_H)^{1/3}` are all computed from one evaluation
+    of the comoving distance, which is usually an integral, and one of the
+    Hubble parameter. The transverse comoving distance follows from the
+    comoving distance and the curvature.
+
+    Redshifts and the parameters of the cosmology are broadcast against each
+    other, so that a cosmology with arrays of parameter samples gives the
+    observables of all samples at once.
+
+    Parameters
+    ----------
+    cosmo : object, positional-only
+        The cosmology, with ``comoving_distance``, ``H_over_H0``,
+        ``hubble_distance``, and ``Omega_k0``.
+    z : Array or float, positional-only
+        The redshifts.
+    r_d : Array or float or None, optional keyword-only
+        The sound horizon at the drag epoch, in Mpc, for the ratios to the
+        distances, e.g. from :func:`sound_horizon_drag`.
+
+    Returns
+    -------
+    BAOObservables
+
+    """
+    d_c = cosmo.comoving_distance(z)
+    e = cosmo.H_over_H0(z)
+    xp = array_namespace(d_c)
+    d_h0 = xp.astype(cosmo.hubble_distance, d_c.dtype)
+    omega_k = xp.astype(cosmo.Omega_k0, d_c.dtype)
+
+    d_m = _transverse_comoving_distance(xp, d_c, d_h0, omega_k)
+    d_h = d_h0 / e
+    d_v = (xp.asarray(z, dtype=d_c.dtype) * d_m**2 * d_h) ** (1 / 3)
+    return BAOObservables(D_M=d_m, D_H=d_h, D_V=d_v, r_d=r_d)
+
+
+def sound_horizon_drag(cosmo: _SoundHorizonCosmology, /) -> Array:
+    r"""The sound horizon at the drag epoch :math:`r_d`, from a fitting formula.
+
+    Uses the fitting formula of [1]_, eq. (16),
+
+    .. math::
+
+        r_d = \frac{55.154 \, e^{-72.3 (\omega_\nu + 0.0006)^2}}
+                   {\omega_{cb}^{0.25351} \, \omega_b^{0.12807}} \, \mathrm{Mpc}
+
+    where :math:`\omega_{cb} = (\Omega_{dm,0} + \Omega_{b,0}) h^2`,
+    :math:`\omega_b = \Omega_{b,0} h^2`, and :math:`\omega_\nu = \sum m_\nu /
+    93.14 \, \mathrm{eV}`. It is accurate to 0.1% for standard cosmologies.
+    Parameters that are arrays of samples are broadcast.
+
+    Parameters
+    ----------
+    cosmo : object, positional-only
+        The cosmology, with ``Omega_dm0``, ``Omega_b0``, ``h``, and ``m_nu``.
+
+    Returns
+    -------
+    Array
+        The sound horizon at the drag epoch in Mpc.
+
+    References
+    ----------
+    .. [1] Aubourg et al., 2015, Phys. Rev. D 92, 123516.
+
+    """
+    h2 = cosmo.h**2
+    omega_b = cosmo.Omega_b0 * h2
+    omega_cb = cosmo.Omega_dm0 * h2 + omega_b
+    omega_nu = sum(cosmo.m_nu) / _EV_PER_OMEGA_NU
+    xp = array_namespace(omega_cb, omega_b)
+    return cast(
+        "Array",
+        55.154
+        * xp.exp(-72.3 * (omega_nu + 0.0006) ** 2)
+        / (omega_cb**0.25351 * omega_b**0.12807),
+    )
+
+
+# ==============================================================================
+
+
+def _transverse_comoving_distance(
+    xp: Any,  # noqa: ANN401
+    d_c: Any,  # noqa: ANN401
+    d_h0: Any,  # noqa: ANN401
+    omega_k: Any,  # noqa: ANN401
+    /,
+) -> Any:  # noqa: ANN401
+    """The transverse comoving distance from the comoving distance."""
+    # Separate branches for open, closed, and flat universes, with a safe
+    # denominator for the flat case where both others are discarded.
+    sqrt_ok = xp.sqrt(xp.abs(omega_k))
+    safe = xp.where(sqrt_ok > 0, sqrt_ok, xp.asarray(1, dtype=sqrt_ok.dtype))
+    x = safe * d_c / d_h0
+    open_ = d_h0 / safe * xp.sinh(x)
+    closed = d_h0 / safe * xp.sin(x)
+    return xp.where(omega_k > 0, open_, xp.where(omega_k < 0, closed, d_c))
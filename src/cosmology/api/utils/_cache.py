@@ -0,0 +1,313 @@
+"""Persistent on-disk cache of precomputed tables."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from cosmology.api.utils._fingerprint import _flatten, parameter_fingerprint
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from cosmology.api._array_api.array import Array
+
+__all__: list[str] = []
+
+
+_TMP_PREFIX = ".tmp-"
+_SPEC_FILE = "spec.json"
+
+
+class TableCache:
+    """Persistent cache of precomputed tables in a local directory.
+
+    Implementations that tabulate e.g. distances or the growth factor on a grid
+    can consult this cache before integrating, so that the tables for a given
+    cosmology are computed once and then shared between processes and runs.
+    Entries are keyed by the type and the parameters of the cosmology, and by
+    a table specification, e.g. the quantity, grid, and version of the
+    implementation. The parameters are all public attributes of the cosmology
+    with numeric values, e.g. also ``w0`` and ``wa`` of a dark energy model,
+    not only the :data:`~cosmology.api.utils.FINGERPRINT_PARAMETERS`. Tables
+    that depend on anything else, e.g. on a method that is not determined by
+    the type and the parameters, must include it in the specification.
+
+    Each entry is a directory of ``.npy`` files, which are memory-mapped when
+    read, so that processes reading the same entry share its memory through the
+    operating system's page cache. Writes are atomic: an entry is written to a
+    temporary directory which is then renamed, so readers never see partial
+    entries and concurrent writers of the same entry are safe (the first
+    writer wins). If ``max_bytes`` is given, the least recently used entries
+    are evicted after each write until the cache fits.
+
+    This requires NumPy, which is used to read and write the ``.npy`` files.
+
+    Parameters
+    ----------
+    directory : path-like
+        The cache directory. It is created if it does not exist.
+    max_bytes : int or None, optional keyword-only
+        The maximum total size of the cached tables in bytes. `None` (default)
+        means the cache is unbounded.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> import numpy as np
+    >>> from types import SimpleNamespace
+    >>> from cosmology.api.utils import TableCache
+
+    >>> cosmo = SimpleNamespace(H0=70.0, Omega_m0=0.3)
+    >>> spec = {"table": "comoving_distance", "zmax": 10.0, "size": 1024}
+
+    >>> def compute():
+    ...     z = np.linspace(0, spec["zmax"], spec["size"])
+    ...     return {"z": z, "dc": 4000 * z / (1 + z)}  # some expensive table
+
+    >>> with tempfile.TemporaryDirectory() as directory:
+    ...     cache = TableCache(directory)
+    ...     tables = cache.get_or_compute(cosmo, spec, compute)  # computed
+    ...     tables = cache.get_or_compute(cosmo, spec, compute)  # from disk
+    ...     print(sorted(tables), tables["dc"].shape)
+    ['dc', 'z'] (1024,)
+
+    """
+
+    def __init__(
+        self, directory: str | os.PathLike[str], *, max_bytes: int | None = None
+    ) -> None:
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+    @property
+    def directory(self) -> Path:
+        """The cache directory."""
+        return self._directory
+
+    def key(self, cosmo: object, spec: Mapping[str, Any], /) -> str:
+        """The key of the entry for a cosmology and table specification.
+
+        This is a hash of the module and qualified name of the type of the
+        cosmology, of the :func:`~cosmology.api.utils.parameter_fingerprint`
+        of all its parameters, and of the specification.
+
+        Parameters
+        ----------
+        cosmo : object, positional-only
+            The cosmology.
+        spec : Mapping[str, Any], positional-only
+            The table specification. Its values must be serializable to JSON.
+
+        Returns
+        -------
+        str
+
+        """
+        spec_json = json.dumps(spec, sort_keys=True, separators=(",", ":"))
+        spec_hash = hashlib.blake2b(spec_json.encode(), digest_size=8).hexdigest()
+        cls = type(cosmo)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{cls.__module__}.{cls.__qualname__}".encode())
+        digest.update(parameter_fingerprint(cosmo, _parameters(cosmo)).encode())
+        return f"{digest.hexdigest()}-{spec_hash}"
+
+    def get(self, cosmo: object, spec: Mapping[str, Any], /) -> dict[str, Array] | None:
+        """Get the cached tables, if any.
+
+        Parameters
+        ----------
+        cosmo : object, positional-only
+            The cosmology.
+        spec : Mapping[str, Any], positional-only
+            The table specification.
+
+        Returns
+        -------
+        dict[str, Array] or None
+            The read-only, memory-mapped tables, or `None` if there is no
+            entry for ``cosmo`` and ``spec``.
+
+        """
+        return self._load(self._directory / self.key(cosmo, spec))
+
+    def put(
+        self, cosmo: object, spec: Mapping[str, Any], tables: Mapping[str, Any], /
+    ) -> dict[str, Array]:
+        """Store tables in the cache.
+
+        If there already is an entry for ``cosmo`` and ``spec``, e.g. because
+        another process stored it concurrently, the existing entry is kept.
+
+        Parameters
+        ----------
+        cosmo : object, positional-only
+            The cosmology.
+        spec : Mapping[str, Any], positional-only
+            The table specification.
+        tables : Mapping[str, Array], positional-only
+            The tables, keyed by name. The names must be valid file names.
+
+        Returns
+        -------
+        dict[str, Array]
+            The read-only, memory-mapped tables of the entry.
+
+        """
+        import numpy as np  # noqa: PLC0415
+
+        key = self.key(cosmo, spec)
+        path = self._directory / key
+
+        tmp = Path(tempfile.mkdtemp(prefix=_TMP_PREFIX, dir=self._directory))
+        try:
+            for name, table in tables.items():
+                np.save(tmp / f"{name}.npy", np.asarray(table), allow_pickle=False)
+            (tmp / _SPEC_FILE).write_text(json.dumps(spec, sort_keys=True))
+            try:
+                tmp.rename(path)
+            except OSError:
+                # Another process stored the entry first.
+                if not path.is_dir():
+                    raise
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+        if self.max_bytes is not None:
+            self.evict(keep=key)
+
+        stored = self._load(path)
+        if stored is None:  # evicted straight away
+            return {name: np.asarray(table) for name, table in tables.items()}
+        return stored
+
+    def get_or_compute(
+        self,
+        cosmo: object,
+        spec: Mapping[str, Any],
+        compute: Callable[[], Mapping[str, Any]],
+        /,
+    ) -> dict[str, Array]:
+        """Get the cached tables, computing and storing them if necessary.
+
+        Parameters
+        ----------
+        cosmo : object, positional-only
+            The cosmology.
+        spec : Mapping[str, Any], positional-only
+            The table specification.
+        compute : callable, positional-only
+            Function without arguments that computes the tables, returning a
+            mapping of names to arrays. Only called if there is no entry.
+
+        Returns
+        -------
+        dict[str, Array]
+            The read-only, memory-mapped tables.
+
+        """
+        tables = self.get(cosmo, spec)
+        if tables is None:
+            tables = self.put(cosmo, spec, compute())
+        return tables
+
+    def evict(self, *, keep: str | None = None) -> None:
+        """Evict least recently used entries until the cache fits.
+
+        Parameters
+        ----------
+        keep : str or None, optional keyword-only
+            The key of an entry that is never evicted.
+
+        """
+        if self.max_bytes is None:
+            return
+
+        entries = []
+        total = 0
+        for path in self._entries():
+            try:
+                size = sum(f.stat().st_size for f in path.iterdir())
+                used = path.stat().st_mtime
+            except FileNotFoundError:  # evicted by another process
+                continue
+            entries.append((used, size, path))
+            total += size
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path.name == keep:
+                continue
+            self._remove(path)
+            total -= size
+
+    def clear(self) -> None:
+        """Remove all entries.
+
+        Only entries that have been stored are removed. The temporary
+        directories of writes in progress, e.g. in other processes, are kept.
+        """
+        for path in self._entries():
+            self._remove(path)
+
+    # ---------------------------------------------------------------
+
+    def _entries(self) -> list[Path]:
+        return [
+            p
+            for p in self._directory.iterdir()
+            if p.is_dir() and not p.name.startswith(_TMP_PREFIX)
+        ]
+
+    @staticmethod
+    def _load(path: Path) -> dict[str, Array] | None:
+        import numpy as np  # noqa: PLC0415
+
+        try:
+            tables = {
+                f.stem: np.load(f, mmap_mode="r", allow_pickle=False)
+                for f in path.glob("*.npy")
+            }
+            # Mark the entry as recently used.
+            now = time.time()
+            os.utime(path, (now, now))
+        except FileNotFoundError:  # missing, or evicted while loading
+            return None
+        return tables
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        # Rename first, so that the entry disappears atomically for readers.
+        tmp = path.with_name(f"{_TMP_PREFIX}evict-{path.name}-{os.getpid()}")
+        with contextlib.suppress(OSError):
+            path.rename(tmp)
+            shutil.rmtree(tmp, ignore_errors=True)
+
+
+# ==============================================================================
+
+
+def _parameters(cosmo: object, /) -> list[str]:
+    """The names of the public attributes of a cosmology with numeric values."""
+    names = []
+    for name in dir(cosmo):
+        if name.startswith("_"):
+            continue
+        value = getattr(cosmo, name, None)
+        if value is None or callable(value):
+            continue
+        try:
+            list(_flatten(value))
+        except (TypeError, ValueError):  # not numeric, e.g. a name
+            continue
+        names.append(name)
+    return names
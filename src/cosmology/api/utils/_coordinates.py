@@ -0,0 +1,190 @@
+"""Conversions between sky coordinates and comoving Cartesian positions."""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Any, cast
+
+from cosmology.api._array_api.namespace import array_namespace
+
+if TYPE_CHECKING:
+    from cosmology.api._array_api.array import Array
+    from cosmology.api._distances import (
+        HasComovingDistance,
+        HasInverseComovingDistance,
+    )
+
+__all__: list[str] = []
+
+
+# The default number of rows per chunk.
+_CHUNK_SIZE = 2**20
+
+_DEG = math.pi / 180
+
+
+def sky_to_cartesian(  # noqa: PLR0913
+    cosmo: HasComovingDistance[Any, Any],
+    ra: Array,
+    dec: Array,
+    z: Array,
+    /,
+    *,
+    dtype: Any = None,  # noqa: ANN401
+    out: Array | None = None,
+    chunk_size: int = _CHUNK_SIZE,
+) -> Array:
+    """Convert sky coordinates and redshifts to comoving Cartesian positions.
+
+    The position of an object at right ascension ``ra``, declination ``dec``,
+    and redshift ``z`` is its comoving distance times the unit vector towards
+    it, with the x-axis towards ``ra = dec = 0`` and the z-axis towards
+    ``dec = 90``.
+
+    The input is processed in chunks of ``chunk_size`` rows, each with one
+    call to ``comoving_distance``, which are written to the output array, so
+    that the temporary arrays are bounded for catalogues of any size, e.g.
+    memory-mapped ones.
+
+    Parameters
+    ----------
+    cosmo : `~cosmology.api.HasComovingDistance`, positional-only
+        The cosmology.
+    ra, dec : Array, positional-only
+        The right ascensions and declinations in degrees, one-dimensional.
+    z : Array, positional-only
+        The redshifts, one-dimensional.
+    dtype : dtype, optional keyword-only
+        The data type of the output, e.g. ``float32`` to halve its memory. The
+        computation is done in the data type of the input. If `None`
+        (default), the floating-point data type of ``z``. Ignored if ``out``
+        is given.
+    out : Array, optional keyword-only
+        A preallocated output array of shape ``(len(z), 3)``.
+    chunk_size : int, optional keyword-only
+        The number of rows per chunk.
+
+    Returns
+    -------
+    Array
+        The positions in Mpc, with shape ``(len(z), 3)``. This is ``out`` if
+        given.
+
+    Raises
+    ------
+    ValueError
+        If the shapes of the input or output do not match.
+
+    """
+    xp = array_namespace(ra, dec, z)
+    n = _rows(z, ra, dec)
+    ra, dec, z = (_floating(xp, x) for x in (ra, dec, z))
+    out = _output(xp, out, (n, 3), z.dtype if dtype is None else dtype)
+
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        d = cosmo.comoving_distance(z[start:stop])
+        ra_c = ra[start:stop] * _DEG
+        dec_c = dec[start:stop] * _DEG
+        d_cos_dec = d * xp.cos(dec_c)
+        out[start:stop, 0] = xp.astype(d_cos_dec * xp.cos(ra_c), out.dtype)
+        out[start:stop, 1] = xp.astype(d_cos_dec * xp.sin(ra_c), out.dtype)
+        out[start:stop, 2] = xp.astype(d * xp.sin(dec_c), out.dtype)
+    return out
+
+
+def cartesian_to_sky(
+    cosmo: HasInverseComovingDistance[Any, Any],
+    xyz: Array,
+    /,
+    *,
+    dtype: Any = None,  # noqa: ANN401
+    out: Array | None = None,
+    chunk_size: int = _CHUNK_SIZE,
+) -> Array:
+    """Convert comoving Cartesian positions to sky coordinates and redshifts.
+
+    This is the inverse of :func:`sky_to_cartesian`, using
+    ``inv_comoving_distance`` for the redshifts. The input is processed in
+    chunks in the same way.
+
+    Parameters
+    ----------
+    cosmo : `~cosmology.api.HasInverseComovingDistance`, positional-only
+        The cosmology.
+    xyz : Array, positional-only
+        The positions in Mpc, with shape ``(n, 3)``.
+    dtype : dtype, optional keyword-only
+        The data type of the output. If `None` (default), the floating-point
+        data type of ``xyz``. Ignored if ``out`` is given.
+    out : Array, optional keyword-only
+        A preallocated output array of shape ``(n, 3)``.
+    chunk_size : int, optional keyword-only
+        The number of rows per chunk.
+
+    Returns
+    -------
+    Array
+        The right ascensions in degrees in ``[0, 360)``, the declinations in
+        degrees, and the redshifts, as the columns of an array of shape
+        ``(n, 3)``. This is ``out`` if given.
+
+    Raises
+    ------
+    ValueError
+        If the shapes of the input or output do not match.
+
+    """
+    xp = array_namespace(xyz)
+    if xyz.ndim != 2 or xyz.shape[1] != 3:  # noqa: PLR2004
+        msg = f"positions must have shape (n, 3), not {xyz.shape}"
+        raise ValueError(msg)
+    n = int(xyz.shape[0] or 0)
+    out = _output(xp, out, (n, 3), xyz.dtype if dtype is None else dtype)
+
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        x, y, z = xyz[start:stop, 0], xyz[start:stop, 1], xyz[start:stop, 2]
+        rho2 = x**2 + y**2
+        ra = xp.atan2(y, x) / _DEG
+        out[start:stop, 0] = xp.astype(xp.where(ra < 0, ra + 360, ra), out.dtype)
+        out[start:stop, 1] = xp.astype(xp.atan2(z, xp.sqrt(rho2)) / _DEG, out.dtype)
+        d = xp.sqrt(rho2 + z**2)
+        out[start:stop, 2] = xp.astype(cosmo.inv_comoving_distance(d), out.dtype)
+    return out
+
+
+# ==============================================================================
+
+
+def _rows(*arrays: Array) -> int:
+    """The common length of one-dimensional arrays."""
+    shapes = {a.shape for a in arrays}
+    if len(shapes) != 1 or arrays[0].ndim != 1:
+        msg = "coordinates must be one-dimensional arrays of the same length"
+        raise ValueError(msg)
+    return int(arrays[0].shape[0] or 0)
+
+
+def _floating(xp: Any, x: Array, /) -> Array:  # noqa: ANN401
+    """The array, converted to ``float64`` if not real floating-point."""
+    if xp.isdtype(x.dtype, "real floating"):
+        return x
+    return cast("Array", xp.astype(x, xp.float64))
+
+
+def _output(
+    xp: Any,  # noqa: ANN401
+    out: Array | None,
+    shape: tuple[int, int],
+    dtype: Any,  # noqa: ANN401
+) -> Array:
+    """Check or allocate the output array."""
+    if out is None:
+        if not xp.isdtype(dtype, "real floating"):
+            dtype = xp.float64
+        return cast("Array", xp.empty(shape, dtype=dtype))
+    if out.shape != shape:
+        msg = f"output must have shape {shape}, not {out.shape}"
+        raise ValueError(msg)
+    return out
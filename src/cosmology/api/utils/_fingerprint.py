@@ -0,0 +1,115 @@
+"""Parameter fingerprints for cosmology identity."""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import struct
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+__all__: list[str] = []
+
+
+FINGERPRINT_PARAMETERS: tuple[str, ...] = (
+    "H0",
+    "Omega_m0",
+    "Omega_b0",
+    "Omega_de0",
+    "Omega_k0",
+    "T_cmb0",
+    "Neff",
+    "m_nu",
+)
+"""The scalar parameters of a standard cosmology used for its fingerprint."""
+
+# Parameters whose values are unordered, e.g. the neutrino masses.
+_UNORDERED = frozenset({"m_nu"})
+
+_DOUBLE = struct.Struct("<d")
+_MISSING = b"\xff"
+_NAN = _DOUBLE.pack(math.nan)
+
+
+def parameter_fingerprint(
+    cosmo: object, /, parameters: Iterable[str] = FINGERPRINT_PARAMETERS
+) -> str:
+    """Compute a stable fingerprint of the parameters of a cosmology.
+
+    The :class:`~cosmology.api.Cosmology` protocol has no notion of identity
+    beyond its ``name``. This function gives cosmologies an identity based on
+    the values of their parameters, e.g. for keys of caches shared between
+    processes. The fingerprint is a hash of the parameter values, so it is
+
+    - stable: the same parameter values give the same fingerprint in any
+      process, on any platform, and for any array library or dtype that
+      represents the values exactly;
+    - canonical: the order of ``parameters`` does not matter, ``-0.0`` equals
+      ``0.0``, all NaN are equal, and the neutrino masses ``m_nu`` are treated
+      as an unordered collection;
+    - cheap: it only reads the scalar attributes, so that it can be computed
+      on every call, e.g. as a dictionary key.
+
+    Only the parameter values enter the fingerprint, not the type of the
+    cosmology. Use ``(type(cosmo), parameter_fingerprint(cosmo))`` if two
+    implementations with the same parameters must be distinguished.
+
+    Parameters
+    ----------
+    cosmo : object, positional-only
+        The cosmology. Parameters that it does not have are recorded as
+        missing, so any subset of :class:`~cosmology.api.StandardCosmology`
+        can be fingerprinted.
+    parameters : iterable of str, optional
+        The names of the parameters. Defaults to
+        :data:`~cosmology.api.utils.FINGERPRINT_PARAMETERS`.
+
+    Returns
+    -------
+    str
+        The fingerprint, as 32 hexadecimal characters.
+
+    Examples
+    --------
+    >>> from types import SimpleNamespace
+    >>> from cosmology.api.utils import parameter_fingerprint
+    >>> cosmo1 = SimpleNamespace(H0=70.0, Omega_m0=0.3, m_nu=(0.06, 0.0, 0.0))
+    >>> cosmo2 = SimpleNamespace(H0=70.0, Omega_m0=0.3, m_nu=(0.0, 0.0, 0.06))
+    >>> parameter_fingerprint(cosmo1) == parameter_fingerprint(cosmo2)
+    True
+
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for name in sorted(set(parameters)):
+        digest.update(name.encode())
+        value = getattr(cosmo, name, None)
+        if value is None:
+            digest.update(_MISSING)
+            continue
+
+        values = list(_flatten(value))
+        if name in _UNORDERED:
+            values.sort()
+        digest.update(len(values).to_bytes(4, "little"))
+        for v in values:
+            digest.update(_NAN if math.isnan(v) else _DOUBLE.pack(v + 0.0))
+
+    return digest.hexdigest()
+
+
+def _flatten(value: object, /) -> Iterator[float]:
+    """Iterate over the values of a scalar, array, or sequence as floats."""
+    if isinstance(value, (tuple, list)):
+        for v in value:
+            yield from _flatten(v)
+        return
+
+    ndim = getattr(value, "ndim", 0)
+    if ndim == 0:
+        yield float(value)  # type: ignore[arg-type]
+        return
+
+    for i in range(value.shape[0]):  # type: ignore[attr-defined]
+        yield from _flatten(value[i])  # type: ignore[index]
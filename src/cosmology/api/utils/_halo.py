@@ -0,0 +1,228 @@
+"""Conversions between spherical-overdensity halo mass definitions."""
+
+from __future__ import annotations
+
+import functools
+import math
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Protocol, cast
+
+from cosmology.api._array_api.fallbacks import clip
+from cosmology.api._array_api.namespace import array_namespace
+from cosmology.api._components import HasOmegaM
+from cosmology.api._extras import HasCriticalDensity
+
+if TYPE_CHECKING:
+    from cosmology.api._array_api.array import Array
+
+__all__: list[str] = []
+
+
+_MDEF = re.compile(r"(?P<delta>\d+(?:\.\d*)?)(?P<ref>[cm])")
+
+# The table of the inverse NFW mean density for the initial guess, and the
+# number of Newton steps to refine it to machine precision.
+_TABLE_X_MIN = 1e-4
+_TABLE_X_MAX = 1e4
+_TABLE_SIZE = 4096
+_TABLE_BISECTIONS = 64
+_NEWTON_STEPS = 2
+
+
+class _HaloCosmology(HasCriticalDensity[Any, Any], HasOmegaM[Any, Any], Protocol):
+    """The cosmology attributes needed for halo mass definitions."""
+
+
+@dataclass(frozen=True)
+class HaloMass:
+    """The mass, radius, and concentration of haloes in a mass definition.
+
+    Parameters
+    ----------
+    mass : Array
+        The mass in Msol.
+    radius : Array
+        The physical radius in Mpc.
+    concentration : Array
+        The NFW concentration.
+
+    """
+
+    mass: Array
+    radius: Array
+    concentration: Array
+
+
+def spherical_overdensity(
+    cosmo: _HaloCosmology, z: Array | float, mdef: str, /
+) -> Array:
+    r"""The mean density within the boundary of a halo.
+
+    The mass definition is ``"<Delta>c"`` for :math:`\Delta` times the
+    critical density, e.g. ``"200c"`` or ``"500c"``, ``"<Delta>m"`` for
+    :math:`\Delta` times the mean matter density :math:`\Omega_m(z)
+    \rho_c(z)`, e.g. ``"200m"``, or ``"vir"`` for the virial overdensity of
+    [1]_, :math:`\Delta_c = 18\pi^2 + 82 x - 39 x^2` with :math:`x =
+    \Omega_m(z) - 1` times the critical density, which holds for flat
+    cosmologies.
+
+    Parameters
+    ----------
+    cosmo : object, positional-only
+        The cosmology, with ``critical_density`` and ``Omega_m``.
+    z : Array or float, positional-only
+        The redshifts.
+    mdef : str, positional-only
+        The mass definition.
+
+    Returns
+    -------
+    Array
+        The density in Msol / Mpc^3.
+
+    Raises
+    ------
+    ValueError
+        If the mass definition is not recognised.
+
+    References
+    ----------
+    .. [1] Bryan & Norman, 1998, ApJ 495, 80.
+
+    """
+    if mdef == "vir":
+        x = cosmo.Omega_m(z) - 1
+        return cast(
+            "Array",
+            (18 * math.pi**2 + 82 * x - 39 * x**2) * cosmo.critical_density(z),
+        )
+    match = _MDEF.fullmatch(mdef)
+    if match is None:
+        msg = f"unknown mass definition {mdef!r}"
+        raise ValueError(msg)
+    delta = float(match["delta"])
+    if match["ref"] == "c":
+        return cast("Array", delta * cosmo.critical_density(z))
+    return cast("Array", delta * cosmo.Omega_m(z) * cosmo.critical_density(z))
+
+
+def convert_halo_mass(  # noqa: PLR0913
+    cosmo: _HaloCosmology,
+    m: Array | float,
+    z: Array | float,
+    c: Array | float,
+    /,
+    *,
+    mdef_in: str,
+    mdef_out: str,
+) -> HaloMass:
+    r"""Convert halo masses between mass definitions, assuming NFW profiles.
+
+    For an NFW profile with concentration :math:`c` in the input definition,
+    the mean density within :math:`x = r / r_s` is proportional to
+    :math:`g(x) = [\ln(1 + x) - x / (1 + x)] / x^3`. The radius in the
+    output definition solves :math:`g(x') = g(c) \, \bar\rho' / \bar\rho`,
+    where :math:`\bar\rho` and :math:`\bar\rho'` are the
+    :func:`spherical_overdensity` of the two definitions.
+
+    All haloes are solved simultaneously: the inverse of :math:`g` is
+    interpolated from a precomputed table for the initial guesses, which are
+    refined with a fixed number of vectorised Newton steps to machine
+    precision. The densities are computed with one call each to
+    ``critical_density`` and, if needed, ``Omega_m``. The arguments are
+    broadcast against each other.
+
+    Parameters
+    ----------
+    cosmo : object, positional-only
+        The cosmology, with ``critical_density`` and ``Omega_m``.
+    m : Array or float, positional-only
+        The halo masses in Msol, in the input definition.
+    z : Array or float, positional-only
+        The redshifts of the haloes.
+    c : Array or float, positional-only
+        The NFW concentrations, in the input definition.
+    mdef_in, mdef_out : str, keyword-only
+        The input and output mass definitions, as for
+        :func:`spherical_overdensity`.
+
+    Returns
+    -------
+    `HaloMass`
+        The mass, radius, and concentration in the output definition.
+
+    """
+    rho_in = spherical_overdensity(cosmo, z, mdef_in)
+    if mdef_out == mdef_in:
+        rho_out = rho_in
+    else:
+        rho_out = spherical_overdensity(cosmo, z, mdef_out)
+
+    xp = array_namespace(m, z, c, rho_in)
+    ma = xp.asarray(m)
+    if not xp.isdtype(ma.dtype, "real floating"):
+        ma = xp.astype(ma, xp.float64)
+    ca = xp.astype(xp.asarray(c), ma.dtype)
+
+    # Solve ln g(x') = target for ln x'.
+    target = _ln_g(xp, ca) + xp.log(rho_out / rho_in)
+    ln_x = _ln_g_inverse(xp, target)
+    for _ in range(_NEWTON_STEPS):
+        x = xp.exp(ln_x)
+        ln_x = ln_x - (_ln_g(xp, x) - target) / _ln_g_slope(xp, x)
+    c_out = xp.exp(ln_x)
+
+    m_out = ma * _nfw_mass(xp, c_out) / _nfw_mass(xp, ca)
+    r_out = (m_out / (rho_out * (4 * math.pi / 3))) ** (1 / 3)
+    return HaloMass(
+        mass=cast("Array", m_out),
+        radius=cast("Array", r_out),
+        concentration=cast("Array", xp.broadcast_to(c_out, m_out.shape)),
+    )
+
+
+# ==============================================================================
+
+
+def _nfw_mass(xp: Any, x: Any, /) -> Any:  # noqa: ANN401
+    """The NFW mass within ``x = r / r_s``, up to a constant."""
+    return xp.log1p(x) - x / (1 + x)
+
+
+def _ln_g(xp: Any, x: Any, /) -> Any:  # noqa: ANN401
+    """The logarithm of the NFW mean density within ``x``, up to a constant."""
+    return xp.log(_nfw_mass(xp, x)) - 3 * xp.log(x)
+
+
+def _ln_g_slope(xp: Any, x: Any, /) -> Any:  # noqa: ANN401
+    """The logarithmic slope of the NFW mean density within ``x``."""
+    return x**2 / ((1 + x) ** 2 * _nfw_mass(xp, x)) - 3
+
+
+@functools.cache
+def _ln_g_table(xp: Any, dtype: Any, /) -> tuple[float, float, Any]:  # noqa: ANN401
+    """The table of ``ln(x)`` on a grid evenly spaced in ``ln g(x)``."""
+    lo = xp.full(_TABLE_SIZE, math.log(_TABLE_X_MIN), dtype=dtype)
+    hi = xp.full(_TABLE_SIZE, math.log(_TABLE_X_MAX), dtype=dtype)
+    y_min = float(_ln_g(xp, xp.exp(hi[0])))
+    y_max = float(_ln_g(xp, xp.exp(lo[0])))
+    y = xp.linspace(y_max, y_min, _TABLE_SIZE, dtype=dtype)
+    # Bisection, as ln g is decreasing.
+    for _ in range(_TABLE_BISECTIONS):
+        mid = (lo + hi) / 2
+        above = _ln_g(xp, xp.exp(mid)) > y
+        lo, hi = xp.where(above, mid, lo), xp.where(above, hi, mid)
+    return y_max, (y_min - y_max) / (_TABLE_SIZE - 1), (lo + hi) / 2
+
+
+def _ln_g_inverse(xp: Any, y: Any, /) -> Any:  # noqa: ANN401
+    """Interpolate the inverse of ``_ln_g`` in ``ln(x)`` from a table."""
+    y0, step, ln_x = _ln_g_table(xp, y.dtype)
+    flat = xp.reshape((y - y0) / step, (-1,))
+    last = _TABLE_SIZE - 2
+    i = xp.astype(xp.floor(flat), xp.int64)
+    i = clip(i, 0, last)
+    x0, x1 = xp.take(ln_x, i), xp.take(ln_x, i + 1)
+    t = flat - xp.astype(i, y.dtype)
+    return xp.reshape(x0 + t * (x1 - x0), y.shape)
@@ -0,0 +1,260 @@
+"""Conformal time and sound horizon from a single integral over the scale factor."""
+
+from __future__ import annotations
+
+import math
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Protocol, cast
+
+from cosmology.api._array_api.fallbacks import clip, searchsorted
+from cosmology.api._array_api.namespace import array_namespace
+from cosmology.api._components import HasOmegaB0, HasOmegaGamma0
+from cosmology.api._extras import HasHoverH0, HasHubbleDistance, HasHubbleTime
+from cosmology.api.utils._integrate import _MIN_SEGMENT_NODES, _adaptive_quad
+from cosmology.api.utils._keys import _cache_key
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from cosmology.api._array_api.array import Array
+
+__all__: list[str] = []
+
+
+# The maximum number of tables kept by `horizon_table`.
+_MAX_TABLES = 16
+
+_TABLES: OrderedDict[tuple[Any, ...], HorizonTable] = OrderedDict()
+
+
+class _HorizonCosmology(
+    HasHoverH0[Any, Any],
+    HasHubbleDistance[Any],
+    HasHubbleTime[Any],
+    HasOmegaB0[Any],
+    HasOmegaGamma0[Any],
+    Protocol,
+):
+    """The cosmology attributes needed for the horizon table."""
+
+
+class HorizonTable:
+    r"""Tabulated conformal time and sound horizon of a cosmology.
+
+    The conformal time :math:`\eta` and the comoving sound horizon :math:`r_s`
+    are integrals from the Big Bang over the same grid in :math:`\ln a`,
+
+    .. math::
+
+        \eta(a) = t_H \int_0^a \frac{da'}{a'^2 E(a')} \;, \qquad
+        r_s(a) = D_H \int_0^a \frac{da'}{a'^2 E(a') \sqrt{3 (1 + R(a'))}} \;,
+
+    with the baryon loading :math:`R = 3 \Omega_{b,0} a / (4 \Omega_{\gamma,0})`.
+    Radiation enters through the Hubble parameter :math:`E(a)` of the
+    cosmology. Both are integrated once, on construction, with the adaptive
+    quadrature of :func:`~cosmology.api.utils.comoving_distance`, accumulated
+    segment by segment over the grid. Below ``a_min``, the expansion is taken
+    to be a power law :math:`E \propto a^{-p}`, with :math:`p` from the first
+    grid segment, which is exact in the radiation era.
+
+    Lookups interpolate the tables with cubic Hermite polynomials, using the
+    integrands as the exact derivatives at the grid points, so that they cost
+    no further evaluations of the Hubble parameter. The table is an object
+    with the :class:`~cosmology.api.HasConformalTime` and
+    :class:`~cosmology.api.HasSoundHorizon` methods. The parameters of the
+    cosmology must be scalars. The quadrature nodes require NumPy.
+
+    Parameters
+    ----------
+    cosmo : object, positional-only
+        The cosmology, with ``H_over_H0``, ``hubble_time``,
+        ``hubble_distance``, ``Omega_b0``, and ``Omega_gamma0``.
+    a_min : float, optional keyword-only
+        The smallest scale factor of the grid. It should be deep in the
+        radiation era.
+    size : int, optional keyword-only
+        The number of grid points, evenly spaced in :math:`\ln a`.
+    rtol : float, optional keyword-only
+        The target relative tolerance of the integrals.
+
+    See Also
+    --------
+    horizon_table
+        Cached tables for cosmologies with the same parameters.
+
+    """
+
+    def __init__(
+        self,
+        cosmo: _HorizonCosmology,
+        /,
+        *,
+        a_min: float = 1e-10,
+        size: int = 1024,
+        rtol: float = 1e-10,
+    ) -> None:
+        xp = array_namespace(cosmo.hubble_time, cosmo.hubble_distance)
+        dtype = xp.float64
+        x = xp.linspace(math.log(a_min), 0.0, size, dtype=dtype)
+
+        # Squared sound speed in units of c^2, without dividing by zero for
+        # cosmologies without photons, where the sound speed vanishes.
+        four_omega_gamma = 4 * xp.astype(xp.asarray(cosmo.Omega_gamma0), dtype)
+        three_omega_b = 3 * xp.astype(xp.asarray(cosmo.Omega_b0), dtype)
+
+        def d_eta(x: Any) -> Any:  # noqa: ANN401
+            return xp.exp(-x) / cosmo.H_over_H0(xp.expm1(-x))
+
+        def d_rs(x: Any) -> Any:  # noqa: ANN401
+            cs2 = four_omega_gamma / (
+                3 * (four_omega_gamma + three_omega_b * xp.exp(x))
+            )
+            return d_eta(x) * xp.sqrt(cs2)
+
+        deta, drs = d_eta(x), d_rs(x)
+
+        # Power law E ~ a^-p before the grid, so that the integrands and
+        # integrals go as a^(p-1), up to the slowly varying sound speed.
+        def slope(d: Any) -> float:  # noqa: ANN401
+            return float((xp.log(d[1]) - xp.log(d[0])) / (x[1] - x[0]))
+
+        s = slope(deta)
+        if s <= 0:
+            msg = f"the expansion is not decelerating at a_min={a_min}"
+            raise ValueError(msg)
+        eta0 = deta[0] / s
+        if bool(drs[0] > 0):
+            # To first order in the baryon loading R ~ a, which is small.
+            r = float(three_omega_b / four_omega_gamma) * a_min
+            rs0 = drs[0] * (1 + r / 2) * (1 / s - r / (2 * (s + 1)))
+            s_rs = float(drs[0] / rs0)
+        else:  # Without photons, the sound speed and horizon vanish.
+            rs0, s_rs = drs[0], s
+
+        kw: dict[str, Any] = {
+            "rtol": rtol,
+            "min_nodes": _MIN_SEGMENT_NODES,
+            "max_nodes": 1024,
+            "cumulative": True,
+        }
+        eta, _ = _adaptive_quad(d_eta, x[:-1], x[1:], **kw)
+        rs, _ = _adaptive_quad(d_rs, x[:-1], x[1:], **kw)
+        eta = xp.concat([xp.zeros(1, dtype=dtype), eta]) + eta0
+        rs = xp.concat([xp.zeros(1, dtype=dtype), rs]) + rs0
+
+        t_h = xp.astype(xp.asarray(cosmo.hubble_time), dtype)
+        d_h = xp.astype(xp.asarray(cosmo.hubble_distance), dtype)
+        self._xp = xp
+        self._x = x
+        self._eta = (t_h * eta, t_h * deta, s)
+        self._rs = (d_h * rs, d_h * drs, s_rs)
+
+    def conformal_time(self, z: Array | float, /) -> Array:
+        """Conformal time at redshift ``z`` in Gyr.
+
+        Parameters
+        ----------
+        z : Array or float, positional-only
+            Input redshift.
+
+        Returns
+        -------
+        Array
+
+        """
+        return self._interpolate(*self._eta, z)
+
+    def sound_horizon(self, z: Array | float, /) -> Array:
+        """Comoving sound horizon at redshift ``z`` in Mpc.
+
+        Parameters
+        ----------
+        z : Array or float, positional-only
+            Input redshift.
+
+        Returns
+        -------
+        Array
+
+        """
+        return self._interpolate(*self._rs, z)
+
+    def _interpolate(
+        self,
+        y: Any,  # noqa: ANN401
+        dy: Any,  # noqa: ANN401
+        slope: float,
+        z: Array | float,
+        /,
+    ) -> Array:
+        """Cubic Hermite interpolation of a table in ln(a)."""
+        xp, grid = self._xp, self._x
+        za = xp.asarray(z)
+        if not xp.isdtype(za.dtype, "real floating"):
+            za = xp.astype(za, xp.float64)
+        x = xp.reshape(-xp.log1p(xp.astype(za, grid.dtype)), (-1,))
+
+        last = grid.shape[0] - 2
+        i = searchsorted(grid, x) - 1
+        i = clip(i, 0, last)
+        x0, x1 = xp.take(grid, i), xp.take(grid, i + 1)
+        h = x1 - x0
+        t = (x - x0) / h
+        s = 1 - t
+        out = (
+            (1 + 2 * t) * s**2 * xp.take(y, i)
+            + t * s**2 * h * xp.take(dy, i)
+            + t**2 * (3 - 2 * t) * xp.take(y, i + 1)
+            - t**2 * s * h * xp.take(dy, i + 1)
+        )
+        # Power law before the first grid point.
+        early = y[0] * xp.exp(slope * (x - grid[0]))
+        out = xp.where(x < grid[0], early, out)
+        return cast("Array", xp.astype(xp.reshape(out, za.shape), za.dtype))
+
+
+def horizon_table(
+    cosmo: _HorizonCosmology,
+    /,
+    *,
+    a_min: float = 1e-10,
+    size: int = 1024,
+    rtol: float = 1e-10,
+    key: Hashable | None = None,
+) -> HorizonTable:
+    """Get the horizon table of a cosmology, reusing a cached table.
+
+    Tables are cached by the cosmology, and by the table arguments. A
+    hashable cosmology, e.g. a frozen dataclass with scalar parameters, shares
+    its tables with all equal cosmologies, and any other cosmology is
+    compared by identity. Cosmologies that are equal in their tables but not
+    otherwise, e.g. those with the same
+    :func:`~cosmology.api.utils.parameter_fingerprint` if it covers all
+    parameters of the Hubble parameter, can share their tables by ``key``.
+    The most recently used tables are kept.
+
+    Parameters
+    ----------
+    cosmo : object, positional-only
+        The cosmology.
+    a_min, size, rtol : optional keyword-only
+        The arguments of :class:`HorizonTable`.
+    key : hashable, optional keyword-only
+        The key of the cosmology in the cache, instead of the cosmology. All
+        cosmologies with the same key must have the same tables.
+
+    Returns
+    -------
+    `HorizonTable`
+
+    """
+    cache_key = (_cache_key(cosmo) if key is None else key, a_min, size, rtol)
+    table = _TABLES.get(cache_key)
+    if table is None:
+        table = HorizonTable(cosmo, a_min=a_min, size=size, rtol=rtol)
+        _TABLES[cache_key] = table
+        while len(_TABLES) > _MAX_TABLES:
+            _TABLES.popitem(last=False)
+    else:
+        _TABLES.move_to_end(cache_key)
+    return table
@@ -0,0 +1,427 @@
+"""Adaptive-accuracy integrals of the Hubble parameter."""
+
+from __future__ import annotations
+
+import functools
+import math
+import warnings
+from typing import TYPE_CHECKING, Any, Literal, overload
+
+from cosmology.api._array_api.fallbacks import cumulative_sum
+from cosmology.api._array_api.namespace import array_namespace
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from cosmology.api._array_api.array import Array
+    from cosmology.api._extras import HubbleParameter
+
+__all__: list[str] = []
+
+
+_MIN_NODES = 8
+_MIN_SEGMENT_NODES = 2
+
+# The default number of redshifts per chunk of the integration from zero.
+_CHUNK_SIZE = 2**12
+
+# The maximum number of Newton steps for the Gauss--Legendre nodes.
+_MAX_NEWTON_STEPS = 16
+
+
+@overload
+def comoving_distance(
+    cosmo: HubbleParameter[Array, Any],
+    z: Array | float,
+    /,
+    *,
+    rtol: float = ...,
+    max_nodes: int = ...,
+    cumulative: bool | None = ...,
+    chunk_size: int = ...,
+    return_error: Literal[False] = ...,
+) -> Array: ...
+
+
+@overload
+def comoving_distance(
+    cosmo: HubbleParameter[Array, Any],
+    z: Array | float,
+    /,
+    *,
+    rtol: float = ...,
+    max_nodes: int = ...,
+    cumulative: bool | None = ...,
+    chunk_size: int = ...,
+    return_error: Literal[True],
+) -> tuple[Array, Array]: ...
+
+
+def comoving_distance(  # noqa: PLR0913
+    cosmo: HubbleParameter[Array, Any],
+    z: Array | float,
+    /,
+    *,
+    rtol: float = 1e-8,
+    max_nodes: int = 1024,
+    cumulative: bool | None = None,
+    chunk_size: int = _CHUNK_SIZE,
+    return_error: bool = False,
+) -> Array | tuple[Array, Array]:
+    r"""Line-of-sight comoving distance with a target relative tolerance.
+
+    Computes :math:`D_C(z) = D_H \int_0^z dz' / E(z')` from the Hubble
+    parameter of the cosmology, using Gauss--Legendre quadrature in
+    :math:`\ln(1+z)`. The number of nodes is doubled, for the whole batch of
+    redshifts, until the estimated relative error is below ``rtol`` for all
+    of them. A Python scalar redshift takes a fast path, which evaluates the
+    Hubble parameter on the nodes only and computes in Python floats
+    otherwise, and returns a 0-d array.
+
+    Parameters
+    ----------
+    cosmo : `~cosmology.api.HubbleParameter`, positional-only
+        The cosmology.
+    z : Array or float, positional-only
+        The redshifts.
+    rtol : float, optional keyword-only
+        The target relative tolerance.
+    max_nodes : int, optional keyword-only
+        The maximum number of quadrature nodes per redshift, at least 2. The
+        Hubble parameter is evaluated on arrays of shape ``(n, nodes)`` for
+        ``n`` redshifts. If the tolerance is not reached with this number of
+        nodes, a `RuntimeWarning` is emitted.
+    cumulative : bool or None, optional keyword-only
+        Whether to integrate cumulatively over sorted redshifts. Each integral
+        is then the sum of the integrals over the segments between
+        consecutive redshifts, which need far fewer nodes than integrals from
+        zero. If `True`, ``z`` must be a one-dimensional array in ascending
+        order (which is not checked). If `None`, cumulative integration is
+        used if ``z`` is a one-dimensional array in ascending order.
+    chunk_size : int, optional keyword-only
+        The number of redshifts per chunk if the integration is not
+        cumulative. The chunks are integrated one after the other, so that
+        the arrays of shape ``(n, nodes)`` have at most ``chunk_size`` rows
+        for any number of redshifts.
+    return_error : bool, optional keyword-only
+        Whether to also return the estimated absolute error.
+
+    Returns
+    -------
+    Array or tuple[Array, Array]
+        The comoving distance in Mpc, and its estimated error if
+        ``return_error`` is true. The result has the floating-point data type
+        of ``z``.
+
+    """
+    return _integrate(
+        cosmo,
+        z,
+        scale=cosmo.hubble_distance,
+        integrand=lambda z, e: (1 + z) / e,
+        rtol=rtol,
+        max_nodes=max_nodes,
+        cumulative=cumulative,
+        chunk_size=chunk_size,
+        return_error=return_error,
+    )
+
+
+@overload
+def lookback_time(
+    cosmo: HubbleParameter[Array, Any],
+    z: Array | float,
+    /,
+    *,
+    rtol: float = ...,
+    max_nodes: int = ...,
+    cumulative: bool | None = ...,
+    chunk_size: int = ...,
+    return_error: Literal[False] = ...,
+) -> Array: ...
+
+
+@overload
+def lookback_time(
+    cosmo: HubbleParameter[Array, Any],
+    z: Array | float,
+    /,
+    *,
+    rtol: float = ...,
+    max_nodes: int = ...,
+    cumulative: bool | None = ...,
+    chunk_size: int = ...,
+    return_error: Literal[True],
+) -> tuple[Array, Array]: ...
+
+
+def lookback_time(  # noqa: PLR0913
+    cosmo: HubbleParameter[Array, Any],
+    z: Array | float,
+    /,
+    *,
+    rtol: float = 1e-8,
+    max_nodes: int = 1024,
+    cumulative: bool | None = None,
+    chunk_size: int = _CHUNK_SIZE,
+    return_error: bool = False,
+) -> Array | tuple[Array, Array]:
+    r"""Lookback time with a target relative tolerance.
+
+    Computes :math:`t_L(z) = t_H \int_0^z dz' / ((1+z') E(z'))` from the
+    Hubble parameter of the cosmology, in the same way as
+    :func:`comoving_distance`. This is also the proper time :math:`t(0, z)`.
+
+    Parameters
+    ----------
+    cosmo : `~cosmology.api.HubbleParameter`, positional-only
+        The cosmology.
+    z : Array or float, positional-only
+        The redshifts.
+    rtol : float, optional keyword-only
+        The target relative tolerance.
+    max_nodes : int, optional keyword-only
+        The maximum number of quadrature nodes per redshift, at least 2.
+    cumulative : bool or None, optional keyword-only
+        Whether to integrate cumulatively over sorted redshifts, as for
+        :func:`comoving_distance`.
+    chunk_size : int, optional keyword-only
+        The number of redshifts per chunk, as for :func:`comoving_distance`.
+    return_error : bool, optional keyword-only
+        Whether to also return the estimated absolute error.
+
+    Returns
+    -------
+    Array or tuple[Array, Array]
+        The lookback time in Gyr, and its estimated error if
+        ``return_error`` is true.
+
+    """
+    return _integrate(
+        cosmo,
+        z,
+        scale=cosmo.hubble_time,
+        integrand=lambda _, e: 1 / e,
+        rtol=rtol,
+        max_nodes=max_nodes,
+        cumulative=cumulative,
+        chunk_size=chunk_size,
+        return_error=return_error,
+    )
+
+
+# ==============================================================================
+
+
+def _integrate(  # noqa: PLR0913
+    cosmo: HubbleParameter[Array, Any],
+    z: Array | float,
+    /,
+    *,
+    scale: Array,
+    integrand: Callable[[Any, Any], Any],
+    rtol: float,
+    max_nodes: int,
+    cumulative: bool | None,
+    chunk_size: int,
+    return_error: bool,
+) -> Array | tuple[Array, Array]:
+    """Integrate ``integrand(z, E(z)) dz / (1+z)`` in ``ln(1+z)`` from 0 to z."""
+    if isinstance(z, (float, int)) and not cumulative:
+        return _integrate_scalar(
+            cosmo,
+            float(z),
+            scale=scale,
+            integrand=integrand,
+            rtol=rtol,
+            max_nodes=max_nodes,
+            return_error=return_error,
+        )
+
+    xp = array_namespace(z, scale)
+    za = xp.asarray(z)
+    if not xp.isdtype(za.dtype, "real floating"):
+        za = xp.astype(za, xp.float64)
+    scale = xp.astype(scale, za.dtype)
+
+    if cumulative is None:
+        cumulative = za.ndim == 1 and bool(xp.all(za[1:] >= za[:-1]))
+    elif cumulative and za.ndim != 1:
+        msg = "cumulative integration requires a one-dimensional array"
+        raise ValueError(msg)
+
+    def f(x: Any) -> Any:  # noqa: ANN401
+        zx = xp.expm1(x)
+        return integrand(zx, cosmo.H_over_H0(zx))
+
+    b = xp.log1p(za)
+    if cumulative:
+        # Integrate over the segments between consecutive redshifts, which
+        # are short and need few nodes, and sum them up.
+        a = xp.concat([xp.zeros(1, dtype=b.dtype), b[:-1]])
+        value, error = _adaptive_quad(
+            f,
+            a,
+            b,
+            rtol=rtol,
+            min_nodes=_MIN_SEGMENT_NODES,
+            max_nodes=max_nodes,
+            cumulative=True,
+        )
+    else:
+        # Integrate from zero in chunks of redshifts, so that the arrays of
+        # shape ``(rows, nodes)`` are bounded for any number of redshifts.
+        flat = xp.reshape(b, (-1,))
+        n = int(flat.shape[0] or 0)
+        value, error = xp.empty_like(flat), xp.empty_like(flat)
+        for start in range(0, n, chunk_size):
+            stop = min(start + chunk_size, n)
+            bc = flat[start:stop]
+            value[start:stop], error[start:stop] = _adaptive_quad(
+                f,
+                xp.zeros_like(bc),
+                bc,
+                rtol=rtol,
+                min_nodes=_MIN_NODES,
+                max_nodes=max_nodes,
+                cumulative=False,
+            )
+        value, error = xp.reshape(value, b.shape), xp.reshape(error, b.shape)
+
+    value, error = scale * value, scale * error
+    return (value, error) if return_error else value
+
+
+def _integrate_scalar(  # noqa: PLR0913
+    cosmo: HubbleParameter[Array, Any],
+    z: float,
+    /,
+    *,
+    scale: Array,
+    integrand: Callable[[Any, Any], Any],
+    rtol: float,
+    max_nodes: int,
+    return_error: bool,
+) -> Array | tuple[Array, Array]:
+    """Integrate as :func:`_integrate` for a Python scalar redshift.
+
+    Only the integrand is evaluated on arrays, namely on the nodes. The
+    adaptive loop is in Python floats, and the result is a 0-d array.
+    """
+    if max_nodes < 2:  # noqa: PLR2004
+        msg = f"max_nodes must be at least 2, not {max_nodes}"
+        raise ValueError(msg)
+
+    xp = array_namespace(scale)
+    b = math.log1p(z)
+
+    def quad(n: int) -> float:
+        x, w = _gauss_legendre(xp, n)
+        zx = xp.expm1(b * x)
+        return float(xp.sum(w * integrand(zx, cosmo.H_over_H0(zx)))) * b
+
+    n = min(_MIN_NODES, max_nodes // 2)
+    prev = quad(n)
+    while True:
+        n *= 2
+        value = quad(n)
+        error = abs(value - prev)
+        if error <= rtol * abs(value):
+            break
+        if 2 * n > max_nodes:
+            msg = (
+                f"relative tolerance {rtol} not reached with {n} nodes; "
+                "increase max_nodes or rtol"
+            )
+            warnings.warn(msg, RuntimeWarning, stacklevel=4)
+            break
+        prev = value
+
+    scale = xp.astype(scale, xp.float64)
+    result = scale * value
+    return (result, scale * error) if return_error else result
+
+
+def _adaptive_quad(  # noqa: PLR0913
+    f: Callable[[Any], Any],
+    a: Any,  # noqa: ANN401
+    b: Any,  # noqa: ANN401
+    /,
+    *,
+    rtol: float,
+    min_nodes: int,
+    max_nodes: int,
+    cumulative: bool,
+) -> tuple[Any, Any]:
+    """Integrate ``f`` from ``a`` to ``b``, doubling the nodes until converged.
+
+    Returns the integral with the larger number of nodes and, as its error
+    estimate, the difference from the integral with half as many nodes. If
+    ``cumulative`` is true, the integrals are summed cumulatively along the
+    last axis, and so are their errors. The number of nodes never exceeds
+    ``max_nodes``, which must be at least 2.
+    """
+    if max_nodes < 2:  # noqa: PLR2004
+        msg = f"max_nodes must be at least 2, not {max_nodes}"
+        raise ValueError(msg)
+
+    xp = b.__array_namespace__()
+    width = b - a
+    aa, ww = xp.expand_dims(a, axis=-1), xp.expand_dims(width, axis=-1)
+
+    def quad(n: int) -> Any:  # noqa: ANN401
+        x, w = (xp.astype(c, b.dtype) for c in _gauss_legendre(xp, n))
+        return xp.sum(w * f(aa + ww * x), axis=-1, dtype=b.dtype) * width
+
+    # Start with fewer nodes if needed, so that the doubling stays within the
+    # maximum number of nodes.
+    n = min(min_nodes, max_nodes // 2)
+    prev = quad(n)
+    while True:
+        n *= 2
+        value = quad(n)
+        error = xp.abs(value - prev)
+        if cumulative:
+            total, total_error = cumulative_sum(value), cumulative_sum(error)
+        else:
+            total, total_error = value, error
+        if bool(xp.all(total_error <= rtol * xp.abs(total))):
+            break
+        if 2 * n > max_nodes:
+            msg = (
+                f"relative tolerance {rtol} not reached with {n} nodes; "
+                "increase max_nodes or rtol"
+            )
+            warnings.warn(msg, RuntimeWarning, stacklevel=4)
+            break
+        prev = value
+    return total, total_error
+
+
+@functools.lru_cache(maxsize=64)
+def _gauss_legendre(xp: Any, n: int, /) -> tuple[Any, Any]:  # noqa: ANN401
+    """Gauss--Legendre nodes and weights on the unit interval, in float64.
+
+    The nodes are the roots of the Legendre polynomial of degree ``n``, which
+    are found all at once by Newton's method from the approximation of
+    Tricomi, and the weights follow from the derivative at the roots.
+    """
+    k = xp.arange(1, n + 1, dtype=xp.float64)
+    x = xp.cos(math.pi * (k - 0.25) / (n + 0.5))
+    for _ in range(_MAX_NEWTON_STEPS):
+        p, dp = _legendre(xp, n, x)
+        dx = p / dp
+        x = x - dx
+        if bool(xp.all(xp.abs(dx) <= 1e-14)):  # noqa: PLR2004
+            break
+    _, dp = _legendre(xp, n, x)
+    w = 2 / ((1 - x**2) * dp**2)
+    return (1 - x) / 2, w / 2
+
+
+def _legendre(xp: Any, n: int, x: Any, /) -> tuple[Any, Any]:  # noqa: ANN401
+    """The Legendre polynomial of degree ``n`` and its derivative."""
+    p0, p1 = xp.ones_like(x), x
+    for j in range(2, n + 1):
+        p0, p1 = p1, ((2 * j - 1) * x * p1 - (j - 1) * p0) / j
+    return p1, n * (x * p1 - p0) / (x**2 - 1)
@@ -0,0 +1,42 @@
+"""Keys of cosmologies in in-memory caches of their tables."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+__all__: list[str] = []
+
+
+def _cache_key(cosmo: object, /) -> Hashable:
+    """The key of a cosmology in a cache of its tables.
+
+    This is the cosmology itself if it is hashable, e.g. a frozen dataclass
+    with scalar parameters, so that equal cosmologies share their tables.
+    Otherwise, the cosmology is compared by identity. Unlike
+    :func:`~cosmology.api.utils.parameter_fingerprint`, this accounts for all
+    parameters and methods of the cosmology. The key refers to the cosmology,
+    so caches must be bounded.
+    """
+    try:
+        hash(cosmo)
+    except TypeError:
+        return _Identity(cosmo)
+    return cosmo
+
+
+class _Identity:
+    """Wrap an object so that it is hashed and compared by identity."""
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: object, /) -> None:
+        self.obj = obj
+
+    def __hash__(self) -> int:
+        return id(self.obj)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Identity) and other.obj is self.obj
@@ -0,0 +1,294 @@
+"""Lensing critical surface density for lens--source pairs."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Protocol, cast
+
+from cosmology.api._array_api.namespace import array_namespace
+from cosmology.api._components import HasOmegaK0
+from cosmology.api._core import Cosmology
+from cosmology.api._distances import (
+    HasAngularDiameterDistance,
+    HasTransverseComovingDistance,
+)
+from cosmology.api._extras import HasHubbleDistance
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from cosmology.api._array_api.array import Array
+
+__all__: list[str] = []
+
+
+_PC_PER_MPC = 1e6
+
+
+class _LensingCosmology(
+    Cosmology[Any, Any], HasAngularDiameterDistance[Any, Any], Protocol
+):
+    """The cosmology attributes needed for the critical surface density."""
+
+
+class _LensingTableCosmology(
+    Cosmology[Any, Any],
+    HasTransverseComovingDistance[Any, Any],
+    HasOmegaK0[Any],
+    HasHubbleDistance[Any],
+    Protocol,
+):
+    """The cosmology attributes needed for tabulated distances."""
+
+
+@dataclass(frozen=True)
+class LensDistances:
+    """The angular diameter distances of lens--source pairs.
+
+    Parameters
+    ----------
+    d_l : Array
+        The angular diameter distance to the lens, in Mpc.
+    d_s : Array
+        The angular diameter distance to the source, in Mpc.
+    d_ls : Array
+        The angular diameter distance from the lens to the source, in Mpc.
+    behind : Array
+        Whether the source is behind the lens.
+
+    """
+
+    d_l: Array
+    d_s: Array
+    d_ls: Array
+    behind: Array
+
+
+def lens_distances(
+    cosmo: HasAngularDiameterDistance[Any, Any],
+    z_lens: Array | float,
+    z_source: Array | float,
+    /,
+) -> LensDistances:
+    """The angular diameter distances of lens--source pairs.
+
+    Each distance is computed with a single call to the cosmology, and the
+    lens and source redshifts are broadcast against each other. Posterior
+    samples of the redshifts and of the cosmological parameters can thus be
+    evaluated in one pass, if the cosmology broadcasts its parameters against
+    the redshifts.
+
+    Parameters
+    ----------
+    cosmo : `~cosmology.api.HasAngularDiameterDistance`, positional-only
+        The cosmology, with the one- and two-redshift angular diameter
+        distance.
+    z_lens, z_source : Array or float, positional-only
+        The lens and source redshifts.
+
+    Returns
+    -------
+    LensDistances
+
+    """
+    d_ls = cosmo.angular_diameter_distance(z_lens, z_source)
+    xp = array_namespace(d_ls)
+    return LensDistances(
+        d_l=cosmo.angular_diameter_distance(z_lens),
+        d_s=cosmo.angular_diameter_distance(z_source),
+        d_ls=d_ls,
+        behind=xp.asarray(z_source) > xp.asarray(z_lens),
+    )
+
+
+def time_delay_distance(
+    cosmo: HasAngularDiameterDistance[Any, Any],
+    z_lens: Array | float,
+    z_source: Array | float,
+    /,
+) -> Array:
+    r"""Time-delay distance :math:`D_{\Delta t}` of strong lenses.
+
+    .. math::
+
+        D_{\Delta t} = (1 + z_l) \frac{D_l D_s}{D_{ls}}
+
+    where :math:`D_l`, :math:`D_s`, and :math:`D_{ls}` are the angular
+    diameter distances to the lens, to the source, and between lens and
+    source. The lens and source redshifts are broadcast against each other,
+    as in :func:`lens_distances`.
+
+    Parameters
+    ----------
+    cosmo : `~cosmology.api.HasAngularDiameterDistance`, positional-only
+        The cosmology, with the one- and two-redshift angular diameter
+        distance.
+    z_lens, z_source : Array or float, positional-only
+        The lens and source redshifts.
+
+    Returns
+    -------
+    Array
+        The time-delay distance in Mpc. Where the source is not behind the
+        lens, it is NaN.
+
+    """
+    dist = lens_distances(cosmo, z_lens, z_source)
+    xp = array_namespace(dist.d_ls)
+    one = xp.asarray(1, dtype=dist.d_ls.dtype)
+    d_ls = xp.where(dist.behind, dist.d_ls, one)
+    d_dt = (xp.asarray(z_lens) + 1) * dist.d_l * dist.d_s / d_ls
+    nan = xp.asarray(xp.nan, dtype=d_dt.dtype)
+    return cast("Array", xp.where(dist.behind, d_dt, nan))
+
+
+def critical_surface_density(
+    cosmo: _LensingCosmology,
+    z_lens: Array | float,
+    z_source: Array | float,
+    /,
+    *,
+    inverse: bool = False,
+) -> Array:
+    r"""Critical surface density for lensing :math:`\Sigma_{\rm cr}`.
+
+    .. math::
+
+        \Sigma_{\rm cr} = \frac{c^2}{4 \pi G} \frac{D_s}{D_l D_{ls}}
+
+    where :math:`D_l`, :math:`D_s`, and :math:`D_{ls}` are the angular
+    diameter distances to the lens, to the source, and between lens and
+    source. The lens and source redshifts are broadcast against each other.
+    For all combinations of many lenses and sources, see
+    :func:`critical_surface_density_blocks`.
+
+    Parameters
+    ----------
+    cosmo : `~cosmology.api.HasAngularDiameterDistance`, positional-only
+        The cosmology, with the one- and two-redshift angular diameter
+        distance, and the constants ``G`` and ``c`` in its namespace.
+    z_lens, z_source : Array or float, positional-only
+        The lens and source redshifts.
+    inverse : bool, optional keyword-only
+        Whether to return :math:`\Sigma_{\rm cr}^{-1}` instead, which is zero
+        where the source is not behind the lens.
+
+    Returns
+    -------
+    Array
+        The critical surface density in Msol pc-2, or its inverse. Where the
+        source is not behind the lens, it is infinite.
+
+    """
+    dist = lens_distances(cosmo, z_lens, z_source)
+    xp = array_namespace(dist.d_ls)
+
+    d_s = xp.where(dist.behind, dist.d_s, xp.asarray(1, dtype=dist.d_s.dtype))
+    inv = dist.d_l * dist.d_ls / d_s
+    inv = xp.where(dist.behind, inv, xp.zeros_like(inv))
+    inv /= _sigma_crit_scale(cosmo)
+    return cast("Array", inv if inverse else _reciprocal(xp, inv))
+
+
+def critical_surface_density_blocks(
+    cosmo: _LensingTableCosmology,
+    z_lens: Array,
+    z_source: Array,
+    /,
+    *,
+    inverse: bool = False,
+    max_elements: int = 2**24,
+) -> Iterator[tuple[int, int, Array]]:
+    r"""Critical surface density for all lens--source pairs, in blocks.
+
+    The transverse comoving distances to all lenses and sources are computed
+    once. The critical surface density of each pair is then computed from
+    this table in blocks of rows, with at most ``max_elements`` pairs per
+    block, so that the memory use is bounded even for billions of pairs.
+    Per pair, the inverse critical surface density is a single multiply--add.
+
+    For a curved universe, the distance between lens and source follows from
+    the distances to lens and source as
+
+    .. math::
+
+        D_M(z_l, z_s) = D_M(z_s) \sqrt{1 + \Omega_k D_M(z_l)^2 / D_H^2}
+                      - D_M(z_l) \sqrt{1 + \Omega_k D_M(z_s)^2 / D_H^2} \;.
+
+    Parameters
+    ----------
+    cosmo : object, positional-only
+        The cosmology, with ``transverse_comoving_distance``, ``Omega_k0``,
+        ``hubble_distance``, and the constants ``G`` and ``c`` in its
+        namespace.
+    z_lens, z_source : Array, positional-only
+        The one-dimensional arrays of lens and source redshifts.
+    inverse : bool, optional keyword-only
+        Whether to return :math:`\Sigma_{\rm cr}^{-1}` instead.
+    max_elements : int, optional keyword-only
+        The maximum number of pairs per block.
+
+    Yields
+    ------
+    start, stop : int
+        The range of lenses of the block.
+    block : Array
+        The critical surface density in Msol pc-2 (or its inverse) of the
+        lenses ``start:stop`` with all sources, of shape ``(stop - start,
+        len(z_source))``.
+
+    See Also
+    --------
+    critical_surface_density : For broadcast lens and source redshifts.
+
+    """
+    xp = array_namespace(z_lens, z_source)
+    dm_l = cosmo.transverse_comoving_distance(z_lens)
+    dm_s = cosmo.transverse_comoving_distance(z_source)
+    dtype = dm_l.dtype
+
+    # sqrt(1 + Omega_k D_M^2 / D_H^2), which is 1 for a flat universe.
+    ok = xp.astype(cosmo.Omega_k0 / cosmo.hubble_distance**2, dtype)
+    s_l = xp.sqrt(1 + ok * dm_l**2)
+    s_s = xp.sqrt(1 + ok * dm_s**2)
+
+    # With D_s / (D_l D_ls) = (1 + z_l) D_M(z_s) / (D_M(z_l) D_M(z_l, z_s)),
+    # the inverse critical surface density of a pair is u_l - v_l w_s.
+    a_l = dm_l / ((z_lens + 1) * _sigma_crit_scale(cosmo))
+    u_l = xp.expand_dims(a_l * s_l, axis=1)
+    v_l = xp.expand_dims(a_l * dm_l, axis=1)
+    has_s = dm_s > 0
+    one, zero = xp.asarray(1, dtype=dtype), xp.asarray(0, dtype=dtype)
+    w_s = xp.where(has_s, s_s / xp.where(has_s, dm_s, one), zero)
+    zs = xp.expand_dims(z_source, axis=0)
+    zl = xp.expand_dims(z_lens, axis=1)
+
+    nl, ns = dm_l.shape[0], dm_s.shape[0]
+    rows = max(1, max_elements // max(ns, 1))
+    for start in range(0, nl, rows):
+        stop = min(start + rows, nl)
+        inv = u_l[start:stop, :] - v_l[start:stop, :] * w_s
+        inv = xp.where(zs > zl[start:stop, :], inv, zero)
+        yield start, stop, inv if inverse else _reciprocal(xp, inv)
+
+
+# ==============================================================================
+
+
+def _sigma_crit_scale(cosmo: Cosmology[Any, Any], /) -> float:
+    """The constant c^2 / (4 pi G), in Msol pc-2 Mpc.
+
+    This is a Python float, so that the data type of the result is not
+    promoted.
+    """
+    constants = cosmo.__cosmology_namespace__.constants
+    c2 = float(constants.c) ** 2
+    return c2 / (4 * math.pi * float(constants.G)) / _PC_PER_MPC
+
+
+def _reciprocal(xp: Any, x: Any, /) -> Any:  # noqa: ANN401
+    """``1 / x`` for positive ``x``, and infinity otherwise."""
+    positive = x > 0
+    one, inf = xp.asarray(1, dtype=x.dtype), xp.asarray(xp.inf, dtype=x.dtype)
+    return xp.where(positive, 1 / xp.where(positive, x, one), inf)
@@ -0,0 +1,186 @@
+"""Lightcone shells of equal comoving thickness or volume."""
+
+from __future__ import annotations
+
+import warnings
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal, Protocol
+
+from cosmology.api._distances import (
+    HasComovingDistance,
+    HasComovingVolume,
+    HasInverseComovingDistance,
+)
+
+if TYPE_CHECKING:
+    from cosmology.api._array_api.array import Array
+
+__all__: list[str] = []
+
+
+# Enough to bisect a double-precision interval down to rounding.
+_MAX_BISECTIONS = 100
+
+
+class _LightconeCosmology(
+    HasComovingDistance[Any, Any],
+    HasInverseComovingDistance[Any, Any],
+    HasComovingVolume[Any, Any],
+    Protocol,
+):
+    """The cosmology methods needed for lightcone shells."""
+
+
+@dataclass(frozen=True)
+class LightconeShells:
+    """The shells of a lightcone.
+
+    Parameters
+    ----------
+    z_edges : Array
+        The redshifts of the ``n + 1`` shell edges, in ascending order.
+    distance_edges : Array
+        The comoving distances of the shell edges, in Mpc.
+    volumes : Array
+        The full-sky comoving volumes of the ``n`` shells, in Mpc^3.
+    z_mid : Array
+        The redshifts at the middle comoving distance of each shell.
+
+    """
+
+    z_edges: Array
+    distance_edges: Array
+    volumes: Array
+    z_mid: Array
+
+
+def lightcone_shells(  # noqa: PLR0913
+    cosmo: _LightconeCosmology,
+    zmax: float,
+    n: int,
+    /,
+    *,
+    zmin: float = 0.0,
+    spacing: Literal["distance", "volume"] = "distance",
+    rtol: float = 1e-10,
+) -> LightconeShells:
+    """Slice a lightcone into shells of equal comoving thickness or volume.
+
+    Parameters
+    ----------
+    cosmo : object, positional-only
+        The cosmology. It must have the ``comoving_distance``,
+        ``inv_comoving_distance`` and ``comoving_volume`` methods (including
+        the two-redshift overload of the latter).
+    zmax : float, positional-only
+        The redshift of the far edge of the lightcone.
+    n : int, positional-only
+        The number of shells.
+    zmin : float, optional keyword-only
+        The redshift of the near edge of the lightcone.
+    spacing : {"distance", "volume"}, optional keyword-only
+        Whether the shells have equal comoving thickness or equal comoving
+        volume.
+    rtol : float, optional keyword-only
+        The relative tolerance of the shell volumes for ``"volume"`` spacing.
+        If it is not reached by bisection, a `RuntimeWarning` is emitted.
+
+    Returns
+    -------
+    LightconeShells
+
+    Raises
+    ------
+    ValueError
+        If ``spacing`` is not ``"distance"`` or ``"volume"``, ``n`` is not
+        positive, or ``zmax`` is not larger than ``zmin``.
+
+    Notes
+    -----
+    For ``"volume"`` spacing, the shell edges are first computed for a flat
+    universe, where the comoving volume is proportional to the cube of the
+    comoving distance. If the shell volumes do not match to ``rtol``, e.g.
+    because the universe is curved, the edges are refined by bisection in
+    comoving distance, all shells at once.
+
+    """
+    if spacing not in {"distance", "volume"}:
+        msg = f"spacing must be 'distance' or 'volume', not {spacing!r}"
+        raise ValueError(msg)
+    if n < 1:
+        msg = f"n must be positive, not {n}"
+        raise ValueError(msg)
+    if not zmax > zmin:
+        msg = f"zmax ({zmax}) must be larger than zmin ({zmin})"
+        raise ValueError(msg)
+
+    dmin = cosmo.comoving_distance(zmin)
+    dmax = cosmo.comoving_distance(zmax)
+    xp = dmax.__array_namespace__()
+    dmin, dmax = (xp.astype(d, xp.float64) for d in (dmin, dmax))
+    frac = xp.arange(n + 1, dtype=xp.float64) / n
+
+    if spacing == "distance":
+        d = dmin + frac * (dmax - dmin)
+        z = _inner(xp, zmin, cosmo.inv_comoving_distance(d[1:-1]), zmax)
+    else:
+        vmin = cosmo.comoving_volume(zmin)
+        vmax = cosmo.comoving_volume(zmax)
+        target = (vmin + frac * (vmax - vmin))[1:-1]
+        # The shell volumes are differences of the volumes at the edges.
+        atol = rtol * (vmax - vmin) / n / 2
+        d = (dmin**3 + frac * (dmax**3 - dmin**3)) ** (1 / 3)
+        z = _inner(xp, zmin, cosmo.inv_comoving_distance(d[1:-1]), zmax)
+
+        v = cosmo.comoving_volume(z[1:-1])
+        if not bool(xp.all(xp.abs(v - target) <= atol)):
+            inner = _bisect_volume(cosmo, xp, target, dmin, dmax, atol=atol)
+            z = _inner(xp, zmin, cosmo.inv_comoving_distance(inner), zmax)
+            d = _inner(xp, dmin, inner, dmax)
+
+    return LightconeShells(
+        z_edges=z,
+        distance_edges=_inner(xp, dmin, d[1:-1], dmax),
+        volumes=cosmo.comoving_volume(z[:-1], z[1:]),
+        z_mid=cosmo.inv_comoving_distance((d[:-1] + d[1:]) / 2),
+    )
+
+
+# ==============================================================================
+
+
+def _inner(xp: Any, first: Any, inner: Array, last: Any) -> Any:  # noqa: ANN401
+    """Concatenate the exact end points and the inner points."""
+    first, last = (
+        xp.reshape(xp.asarray(x, dtype=xp.float64), (1,)) for x in (first, last)
+    )
+    return xp.concat([first, xp.astype(inner, xp.float64), last])
+
+
+def _bisect_volume(  # noqa: PLR0913
+    cosmo: _LightconeCosmology,
+    xp: Any,  # noqa: ANN401
+    target: Any,  # noqa: ANN401
+    dmin: Any,  # noqa: ANN401
+    dmax: Any,  # noqa: ANN401
+    /,
+    *,
+    atol: Any,  # noqa: ANN401
+) -> Any:  # noqa: ANN401
+    """The comoving distances at which the comoving volume is ``target``."""
+    lo = xp.full(target.shape, float(dmin), dtype=xp.float64)
+    hi = xp.full(target.shape, float(dmax), dtype=xp.float64)
+    for _ in range(_MAX_BISECTIONS):
+        mid = (lo + hi) / 2
+        v = cosmo.comoving_volume(cosmo.inv_comoving_distance(mid))
+        if bool(xp.all(xp.abs(v - target) <= atol)):
+            break
+        lo = xp.where(v < target, mid, lo)
+        hi = xp.where(v < target, hi, mid)
+    else:
+        msg = (
+            f"shell volumes not matched to rtol after {_MAX_BISECTIONS} "
+            "bisections; increase rtol"
+        )
+        warnings.warn(msg, RuntimeWarning, stacklevel=3)
+    return mid
@@ -0,0 +1,188 @@
+"""Angular power spectra in the Limber approximation."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Protocol, cast
+
+from cosmology.api._array_api.namespace import array_namespace
+from cosmology.api._components import HasOmegaM0
+from cosmology.api._distances import HasComovingDistance
+from cosmology.api._extras import HasHoverH0, HasHubbleDistance
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from cosmology.api._array_api.array import Array
+
+__all__: list[str] = []
+
+
+class _LimberCosmology(
+    HasComovingDistance[Any, Any],
+    HasHoverH0[Any, Any],
+    HasHubbleDistance[Any],
+    HasOmegaM0[Any],
+    Protocol,
+):
+    """The cosmology attributes needed for the Limber integrals."""
+
+
+class LimberIntegrator:
+    r"""Angular power spectra in the Limber approximation on a redshift grid.
+
+    In the Limber approximation, the angular cross-power spectrum of two
+    tracers with radial kernels :math:`q_i(\chi)` is
+
+    .. math::
+
+        C_\ell^{ij} = \int \! d\chi \, \frac{q_i(\chi) \, q_j(\chi)}{\chi^2}
+            \, P\Bigl(\frac{\ell + 1/2}{\chi}, z(\chi)\Bigr) \;.
+
+    The comoving distance :math:`\chi(z)` and the Hubble parameter
+    :math:`E(z)` are computed once, on construction, on a grid of redshifts,
+    which is shared by the kernels of all tracers and the integrals for all
+    multipoles. The integrals use the trapezoidal rule in :math:`z`, with
+    :math:`d\chi = D_H \, dz / E(z)`, so that the grid should resolve the
+    kernels. The kernels assume a flat cosmology.
+
+    Parameters
+    ----------
+    cosmo : object, positional-only
+        The cosmology, with ``comoving_distance``, ``H_over_H0``,
+        ``hubble_distance``, and ``Omega_m0``.
+    z : Array, positional-only
+        The redshift grid, one-dimensional, positive, and in ascending order.
+
+    Raises
+    ------
+    ValueError
+        If the redshift grid is not one-dimensional or not positive.
+
+    """
+
+    def __init__(self, cosmo: _LimberCosmology, z: Array, /) -> None:
+        xp = array_namespace(z)
+        if z.ndim != 1 or not bool(z[0] > 0):
+            msg = "the redshift grid must be one-dimensional and positive"
+            raise ValueError(msg)
+        if not xp.isdtype(z.dtype, "real floating"):
+            z = xp.astype(z, xp.float64)
+
+        dz = z[1:] - z[:-1]
+        self.cosmo = cosmo
+        self.z = z
+        self.chi = cosmo.comoving_distance(z)
+        self._xp = xp
+        self._e = cosmo.H_over_H0(z)
+        self._d_h = cosmo.hubble_distance
+        self._weights = xp.concat([dz[:1], dz[1:] + dz[:-1], dz[-1:]]) / 2
+
+    def galaxy_kernel(self, nz: Array, /) -> Array:
+        r"""Radial kernels of galaxy number counts.
+
+        The kernel is the normalised redshift distribution per comoving
+        distance, :math:`q(\chi) = n(z) \, E(z) / D_H`.
+
+        Parameters
+        ----------
+        nz : Array, positional-only
+            The redshift distributions on the grid, with shape ``(..., z.size)``.
+            They are normalised on the grid.
+
+        Returns
+        -------
+        Array
+            The kernels in 1/Mpc, with the shape of ``nz``.
+
+        """
+        nz = self._normalise(nz)
+        return cast("Array", nz * self._e / self._d_h)
+
+    def lensing_kernel(self, nz: Array, /) -> Array:
+        r"""Radial kernels of weak lensing convergence.
+
+        The kernel for sources with redshift distribution :math:`n(z)` is
+
+        .. math::
+
+            q(\chi) = \frac{3}{2} \, \Omega_{m,0} \, \frac{\chi}{a \, D_H^2}
+                \int_{z(\chi)}^\infty \! dz' \, n(z') \,
+                \frac{\chi' - \chi}{\chi'} \;.
+
+        Parameters
+        ----------
+        nz : Array, positional-only
+            The source redshift distributions on the grid, with shape
+            ``(..., z.size)``. They are normalised on the grid.
+
+        Returns
+        -------
+        Array
+            The kernels, dimensionless, with the shape of ``nz``.
+
+        """
+        xp, chi = self._xp, self.chi
+        nz = self._normalise(nz)
+        # efficiency[a] = sum_b w_b n_b (1 - chi_a / chi_b) for b >= a.
+        ratio = 1 - xp.reshape(chi, (-1, 1)) / xp.reshape(chi, (1, -1))
+        ratio = xp.where(ratio > 0, ratio, xp.zeros_like(ratio))
+        efficiency = xp.matmul(nz * self._weights, xp.matrix_transpose(ratio))
+        scale = 1.5 * self.cosmo.Omega_m0 / self._d_h**2
+        return cast("Array", scale * chi * (self.z + 1) * efficiency)
+
+    def angular_power(
+        self,
+        ell: Array,
+        kernels: Array,
+        power: Callable[[Any, Any], Any],
+        /,
+        *,
+        pairs: Sequence[tuple[int, int]] | None = None,
+    ) -> Array:
+        """Angular power spectra of pairs of tracers.
+
+        All multipoles and pairs are computed with one call to the power
+        spectrum, on wavenumbers of shape ``(ell.size, z.size)`` and redshifts
+        of shape ``(1, z.size)``, and one matrix product.
+
+        Parameters
+        ----------
+        ell : Array, positional-only
+            The multipoles, one-dimensional.
+        kernels : Array, positional-only
+            The radial kernels of the tracers on the grid, with shape
+            ``(tracers, z.size)``, e.g. from :meth:`galaxy_kernel` or
+            :meth:`lensing_kernel`.
+        power : callable, positional-only
+            The matter power spectrum in Mpc^3 as a function of wavenumber in
+            1/Mpc and redshift, broadcasting its arguments, e.g. the
+            ``linear_power_spectrum`` method of a
+            :class:`~cosmology.api.HasLinearPowerSpectrum`.
+        pairs : sequence of (int, int), optional keyword-only
+            The pairs of tracers. If `None` (default), all pairs ``(i, j)``
+            with ``i <= j``, in row-major order.
+
+        Returns
+        -------
+        Array
+            The angular power spectra, with shape ``(len(pairs), ell.size)``.
+
+        """
+        xp, chi = self._xp, self.chi
+        if pairs is None:
+            n = int(kernels.shape[0] or 0)
+            pairs = [(i, j) for i in range(n) for j in range(i, n)]
+        first = xp.asarray([i for i, _ in pairs])
+        second = xp.asarray([j for _, j in pairs])
+        qq = xp.take(kernels, first, axis=0) * xp.take(kernels, second, axis=0)
+
+        ell_col = xp.reshape(xp.astype(ell, chi.dtype), (-1, 1))
+        k = (ell_col + 0.5) / xp.reshape(chi, (1, -1))
+        p = power(k, xp.reshape(self.z, (1, -1)))
+        dchi = self._weights * self._d_h / self._e
+        return cast("Array", xp.matmul(qq, xp.matrix_transpose(p * dchi / chi**2)))
+
+    def _normalise(self, nz: Array, /) -> Any:  # noqa: ANN401
+        """Normalise distributions on the grid."""
+        xp = self._xp
+        return nz / xp.sum(nz * self._weights, axis=-1, keepdims=True)
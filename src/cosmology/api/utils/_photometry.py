@@ -0,0 +1,57 @@
+"""Photometric quantities from cosmological distances."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, cast
+
+from cosmology.api._array_api.namespace import array_namespace
+
+if TYPE_CHECKING:
+    from cosmology.api._array_api.array import Array
+    from cosmology.api._distances import HasLuminosityDistance
+
+__all__: list[str] = []
+
+
+# The distance modulus of 1 Mpc, i.e. 5 log10(1 Mpc / 10 pc).
+_MU_MPC = 25.0
+
+
+def distance_modulus(
+    cosmo: HasLuminosityDistance[Array, Any],
+    z1: Any,  # noqa: ANN401
+    z2: Any = None,  # noqa: ANN401
+    /,
+) -> Array:
+    r"""Distance modulus :math:`\mu = 5 \log_{10}(d_L / 10 \,\mathrm{pc})`.
+
+    This is a reference implementation of
+    :meth:`~cosmology.api.HasDistanceModulus.distance_modulus` for any
+    cosmology with a luminosity distance. Apart from the luminosity distance
+    itself, only the result is allocated: the scaling and offset are applied
+    in place.
+
+    Parameters
+    ----------
+    cosmo : `~cosmology.api.HasLuminosityDistance`, positional-only
+        The cosmology.
+    z1, z2 : Array, positional-only
+        Input redshifts. If one argument ``z`` is given, the modulus
+        :math:`\mu(0, z)` is returned. If two arguments ``z1, z2`` are given,
+        the modulus :math:`\mu(z_1, z_2)` is returned.
+
+    Returns
+    -------
+    Array
+        The distance modulus in mag.
+
+    """
+    if z2 is None:
+        d = cosmo.luminosity_distance(z1)
+    else:
+        d = cosmo.luminosity_distance(z1, z2)
+    xp = array_namespace(d)
+    mu = xp.log10(d)
+    mu *= 5
+    mu += _MU_MPC
+    return cast("Array", mu)
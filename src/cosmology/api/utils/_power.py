@@ -0,0 +1,324 @@
+"""Linear matter power spectrum from the Eisenstein--Hu transfer function."""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Any, Protocol, cast
+
+from cosmology.api._array_api.namespace import array_namespace
+from cosmology.api._components import HasOmegaB0, HasOmegaM0
+from cosmology.api._distances import HasTCMB0
+from cosmology.api._extras import HasH0
+from cosmology.api._perturbations import HasGrowthFactor
+from cosmology.api.utils._integrate import _MIN_NODES, _adaptive_quad
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from cosmology.api._array_api.array import Array
+
+__all__: list[str] = []
+
+
+# The range of wavenumbers in 1/Mpc and the number of segments in ln(k) for
+# the normalisation of the power spectrum.
+_K_MIN = 1e-5
+_K_MAX = 1e2
+_SIGMA_SEGMENTS = 64
+
+# Below this argument, the top-hat window is computed from its Taylor series.
+_TOP_HAT_SERIES = 1e-3
+
+
+class _TransferCosmology(
+    HasH0[Any],
+    HasOmegaM0[Any],
+    HasOmegaB0[Any],
+    HasTCMB0[Any],
+    Protocol,
+):
+    """The cosmology attributes needed for the transfer function."""
+
+
+class _PowerSpectrumCosmology(
+    _TransferCosmology,
+    HasGrowthFactor[Any, Any],
+    Protocol,
+):
+    """The cosmology attributes needed for the power spectrum."""
+
+
+def eisenstein_hu_transfer(
+    cosmo: _TransferCosmology, k: Array | float, /, *, wiggles: bool = True
+) -> Array:
+    r"""The matter transfer function of Eisenstein & Hu.
+
+    Computes the fitting formula of [1]_ for the transfer function :math:`T(k)`
+    of cold dark matter and baryons, with the baryon acoustic oscillations
+    (``wiggles=True``, their eqs. 16--24) or only the baryon suppression of
+    the zero-baryon form (``wiggles=False``, their eqs. 29--31). The formula
+    is a closed-form expression, so it is evaluated in one array operation
+    for any shape of ``k``.
+
+    Parameters
+    ----------
+    cosmo : object, positional-only
+        The cosmology, with ``H0``, ``Omega_m0``, ``Omega_b0``, and
+        ``T_cmb0``.
+    k : Array or float, positional-only
+        The wavenumbers in 1/Mpc. They must be positive.
+    wiggles : bool, optional keyword-only
+        Whether to include the baryon acoustic oscillations.
+
+    Returns
+    -------
+    Array
+        The transfer function, normalised to 1 on large scales, with the
+        floating dtype of ``k`` (or float64 for integer ``k``).
+
+    References
+    ----------
+    .. [1] Eisenstein & Hu, 1998, ApJ 496, 605.
+
+    """
+    xp = array_namespace(k, cosmo.H0)
+    ka = xp.asarray(k)
+    if not xp.isdtype(ka.dtype, "real floating"):
+        ka = xp.astype(ka, xp.float64)
+
+    h = cosmo.H0 / 100
+    omega_m = cosmo.Omega_m0 * h**2
+    omega_b = cosmo.Omega_b0 * h**2
+    f_b = cosmo.Omega_b0 / cosmo.Omega_m0
+    theta = cosmo.T_cmb0 / 2.7
+
+    if not wiggles:
+        # Sound horizon and shape parameter, eqs. 26, 30, 31.
+        s = 44.5 * xp.log(9.83 / omega_m) / xp.sqrt(1 + 10 * omega_b**0.75)
+        alpha_gamma = (
+            1
+            - 0.328 * xp.log(431 * omega_m) * f_b
+            + 0.38 * xp.log(22.3 * omega_m) * f_b**2
+        )
+        s, alpha_gamma, omega_h, theta2_h = _astype(
+            xp, ka.dtype, s, alpha_gamma, cosmo.Omega_m0 * h, theta**2 / h
+        )
+        gamma_eff = omega_h * (
+            alpha_gamma + (1 - alpha_gamma) / (1 + (0.43 * ka * s) ** 4)
+        )
+        q = ka * theta2_h / gamma_eff
+        return cast("Array", _t0(xp, q, 1, 1, e_factor=2))
+
+    # Matter--radiation equality and the drag epoch, eqs. 2--5.
+    z_eq = 2.50e4 * omega_m * theta**-4
+    k_eq = 7.46e-2 * omega_m * theta**-2
+    b1 = 0.313 * omega_m**-0.419 * (1 + 0.607 * omega_m**0.674)
+    b2 = 0.238 * omega_m**0.223
+    z_d = 1291 * omega_m**0.251 / (1 + 0.659 * omega_m**0.828) * (1 + b1 * omega_b**b2)
+
+    # Sound horizon at the drag epoch and Silk damping scale, eqs. 5--7.
+    r_d = 31.5 * omega_b * theta**-4 * (1000 / z_d)
+    r_eq = 31.5 * omega_b * theta**-4 * (1000 / z_eq)
+    s = (
+        2
+        / (3 * k_eq)
+        * xp.sqrt(6 / r_eq)
+        * xp.log((xp.sqrt(1 + r_d) + xp.sqrt(r_d + r_eq)) / (1 + xp.sqrt(r_eq)))
+    )
+    k_silk = 1.6 * omega_b**0.52 * omega_m**0.73 * (1 + (10.4 * omega_m) ** -0.95)
+
+    # Cold dark matter, eqs. 9--12.
+    f_c = 1 - f_b
+    a1 = (46.9 * omega_m) ** 0.670 * (1 + (32.1 * omega_m) ** -0.532)
+    a2 = (12.0 * omega_m) ** 0.424 * (1 + (45.0 * omega_m) ** -0.582)
+    alpha_c = a1**-f_b * a2 ** -(f_b**3)
+    bb1 = 0.944 / (1 + (458 * omega_m) ** -0.708)
+    bb2 = (0.395 * omega_m) ** -0.0266
+    beta_c = 1 / (1 + bb1 * (f_c**bb2 - 1))
+
+    # Baryons, eqs. 14--15 and 23--24.
+    y = (1 + z_eq) / (1 + z_d)
+    sqrt_y = xp.sqrt(1 + y)
+    g = y * (-6 * sqrt_y + (2 + 3 * y) * xp.log((sqrt_y + 1) / (sqrt_y - 1)))
+    alpha_b = 2.07 * k_eq * s * (1 + r_d) ** -0.75 * g
+    beta_node = 8.41 * omega_m**0.435
+    beta_b = 0.5 + f_b + (3 - 2 * f_b) * xp.sqrt((17.2 * omega_m) ** 2 + 1)
+
+    # The coefficients are computed in the precision of the parameters and
+    # then cast, so that the wavenumbers set the precision of the result.
+    s, k_eq, k_silk, f_b, f_c, alpha_c, beta_c, alpha_b, beta_node, beta_b = _astype(
+        xp,
+        ka.dtype,
+        s,
+        k_eq,
+        k_silk,
+        f_b,
+        f_c,
+        alpha_c,
+        beta_c,
+        alpha_b,
+        beta_node,
+        beta_b,
+    )
+    q = ka / (13.41 * k_eq)
+    ks = ka * s
+
+    # Transfer functions of cold dark matter and baryons, eqs. 17--18 and 21--22.
+    f = 1 / (1 + (ks / 5.4) ** 4)
+    t_c = f * _t0(xp, q, 1, beta_c) + (1 - f) * _t0(xp, q, alpha_c, beta_c)
+    ks_tilde = ks / (1 + (beta_node / ks) ** 3) ** (1 / 3)
+    t_b = (
+        _t0(xp, q, 1, 1) / (1 + (ks / 5.2) ** 2)
+        + alpha_b / (1 + (beta_b / ks) ** 3) * xp.exp(-((ka / k_silk) ** 1.4))
+    ) * (xp.sin(ks_tilde) / ks_tilde)
+
+    return cast("Array", f_b * t_b + f_c * t_c)
+
+
+class EisensteinHuPowerSpectrum:
+    r"""Linear matter power spectrum with the Eisenstein--Hu transfer function.
+
+    The power spectrum is :math:`P(k, z) = A \, k^{n_s} \, T(k)^2 \, D(z)^2`,
+    with the transfer function :math:`T(k)` of
+    :func:`eisenstein_hu_transfer`, the growth factor :math:`D(z)` of the
+    cosmology, and the amplitude :math:`A` normalised to ``sigma8`` at
+    redshift zero. The normalisation is computed once, on construction, so
+    the parameters of the cosmology must be scalars.
+
+    The wavenumbers and redshifts are broadcast against each other, and the
+    transfer function depends only on the wavenumbers and the growth factor
+    only on the redshifts, so that the power spectrum on a grid is an outer
+    product computed in one call, e.g. with ``k[:, None]`` and ``z[None, :]``.
+    The power spectrum is an object with the
+    :class:`~cosmology.api.HasLinearPowerSpectrum` method.
+
+    Parameters
+    ----------
+    cosmo : object, positional-only
+        The cosmology, with ``H0``, ``Omega_m0``, ``Omega_b0``, ``T_cmb0``,
+        and ``growth_factor``.
+    sigma8 : float, keyword-only
+        The amplitude of matter fluctuations in spheres of radius
+        :math:`8 \, h^{-1} \, \mathrm{Mpc}` today.
+    n_s : float, keyword-only
+        The spectral index of the primordial power spectrum.
+    wiggles : bool, optional keyword-only
+        Whether to include the baryon acoustic oscillations.
+
+    """
+
+    def __init__(
+        self,
+        cosmo: _PowerSpectrumCosmology,
+        /,
+        *,
+        sigma8: float,
+        n_s: float,
+        wiggles: bool = True,
+    ) -> None:
+        self.cosmo = cosmo
+        self.sigma8 = sigma8
+        self.n_s = n_s
+        self.wiggles = wiggles
+        radius = 8 / (float(cosmo.H0) / 100)
+        xp = array_namespace(cosmo.H0)
+        self._amplitude = sigma8**2 / _sigma2(xp, self._shape, radius)
+
+    def transfer(self, k: Array | float, /) -> Array:
+        """The transfer function.
+
+        Parameters
+        ----------
+        k : Array or float, positional-only
+            The wavenumbers in 1/Mpc.
+
+        Returns
+        -------
+        Array
+
+        """
+        return eisenstein_hu_transfer(self.cosmo, k, wiggles=self.wiggles)
+
+    def linear_power_spectrum(self, k: Array | float, z: Array | float, /) -> Array:
+        """Linear matter power spectrum in Mpc^3.
+
+        Parameters
+        ----------
+        k : Array or float, positional-only
+            The wavenumbers in 1/Mpc.
+        z : Array or float, positional-only
+            The redshifts, broadcast against ``k``.
+
+        Returns
+        -------
+        Array
+
+        """
+        d = self.cosmo.growth_factor(z)
+        return cast("Array", self._amplitude * self._shape(k) * d**2)
+
+    def _shape(self, k: Array | float, /) -> Any:  # noqa: ANN401
+        """The unnormalised power spectrum today."""
+        t = self.transfer(k)
+        xp = array_namespace(t)
+        return xp.astype(xp.asarray(k), t.dtype) ** self.n_s * t**2
+
+
+# ==============================================================================
+
+
+def _astype(xp: Any, dtype: Any, /, *xs: Any) -> tuple[Any, ...]:  # noqa: ANN401
+    """Cast scalars or arrays to arrays of the given dtype."""
+    return tuple(xp.astype(xp.asarray(x), dtype) for x in xs)
+
+
+def _t0(
+    xp: Any,  # noqa: ANN401
+    q: Any,  # noqa: ANN401
+    alpha: Any,  # noqa: ANN401
+    beta: Any,  # noqa: ANN401
+    /,
+    *,
+    e_factor: float = 1,
+) -> Any:  # noqa: ANN401
+    """The pressureless transfer function, eqs. 19--20 and 29."""
+    log = xp.log(e_factor * math.e + 1.8 * beta * q)
+    if e_factor == 1:
+        c = 14.2 / alpha + 386 / (1 + 69.9 * q**1.08)
+    else:
+        c = 14.2 + 731 / (1 + 62.5 * q)
+    return log / (log + c * q**2)
+
+
+def _top_hat(xp: Any, x: Any, /) -> Any:  # noqa: ANN401
+    """The Fourier transform of the spherical top-hat window."""
+    safe = xp.where(x < _TOP_HAT_SERIES, xp.asarray(1.0, dtype=x.dtype), x)
+    w = 3 * (xp.sin(safe) - safe * xp.cos(safe)) / safe**3
+    return xp.where(x < _TOP_HAT_SERIES, 1 - x**2 / 10, w)
+
+
+def _sigma2(
+    xp: Any,  # noqa: ANN401
+    power: Callable[[Any], Any],
+    radius: float,
+    /,
+) -> float:
+    """The variance of a power spectrum in spheres of the given radius in Mpc."""
+    edges = xp.linspace(
+        math.log(_K_MIN), math.log(_K_MAX), _SIGMA_SEGMENTS + 1, dtype=xp.float64
+    )
+
+    def f(lnk: Any) -> Any:  # noqa: ANN401
+        k = xp.exp(lnk)
+        return k**3 * power(k) * _top_hat(xp, k * radius) ** 2 / (2 * math.pi**2)
+
+    total, _ = _adaptive_quad(
+        f,
+        edges[:-1],
+        edges[1:],
+        rtol=1e-8,
+        min_nodes=_MIN_NODES,
+        max_nodes=1024,
+        cumulative=True,
+    )
+    return float(total[-1])
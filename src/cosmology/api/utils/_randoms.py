@@ -0,0 +1,225 @@
+"""Redshifts of random catalogues by inverse transform sampling."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, cast
+
+from cosmology.api._array_api.fallbacks import clip, cumulative_sum, searchsorted
+from cosmology.api._array_api.namespace import array_namespace
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from cosmology.api._array_api.array import Array
+    from cosmology.api._distances import HasDifferentialComovingVolume
+
+__all__: list[str] = []
+
+
+# The default number of samples per chunk.
+_CHUNK_SIZE = 2**20
+
+
+class RedshiftSampler:
+    r"""Sample redshifts uniformly in comoving volume, times a selection.
+
+    The redshifts of a random catalogue follow the distribution
+
+    .. math::
+
+        p(z) \propto \frac{dV_c}{d\Omega \, dz}(z) \, S(z)
+
+    between ``z_min`` and ``z_max``, where :math:`S(z)` is the selection
+    function of the survey. The density is tabulated once, on construction,
+    on a grid of redshifts, and is linear between the grid points. Samples
+    are drawn by inverting the cumulative distribution of the tabulated
+    density exactly, so that every uniform variate gives one redshift,
+    without rejection. The grid and the normalised density are the ``z`` and
+    ``density`` attributes, and the integral of the unnormalised density in
+    Mpc^3 per steradian is the ``effective_volume``.
+
+    Parameters
+    ----------
+    cosmo : `~cosmology.api.HasDifferentialComovingVolume`, positional-only
+        The cosmology.
+    z_min, z_max : float, positional-only
+        The range of redshifts.
+    selection : callable, optional keyword-only
+        The selection function, evaluated on the grid of redshifts. It must be
+        non-negative. If `None` (default), the redshifts are uniform in
+        comoving volume.
+    size : int, optional keyword-only
+        The number of grid points.
+
+    Raises
+    ------
+    ValueError
+        If the range is empty or the density is negative or zero everywhere.
+
+    """
+
+    def __init__(
+        self,
+        cosmo: HasDifferentialComovingVolume[Any, Any],
+        z_min: float,
+        z_max: float,
+        /,
+        *,
+        selection: Callable[[Any], Any] | None = None,
+        size: int = 4096,
+    ) -> None:
+        if not 0 <= z_min < z_max:
+            msg = f"invalid redshift range [{z_min}, {z_max}]"
+            raise ValueError(msg)
+
+        dv = cosmo.differential_comoving_volume
+        xp = array_namespace(dv(z_min))
+        z = xp.linspace(z_min, z_max, size, dtype=xp.float64)
+        density = dv(z)
+        if selection is not None:
+            density = density * selection(z)
+
+        # The integral of the linear density over each interval.
+        mass = (density[1:] + density[:-1]) * (z[1:] - z[:-1]) / 2
+        total = xp.sum(mass)
+        if bool(xp.any(density < 0)) or not bool(total > 0):
+            msg = "the density must be non-negative and not zero everywhere"
+            raise ValueError(msg)
+
+        self.cosmo = cosmo
+        self.z = z
+        self.density = density / total
+        self.effective_volume = total
+        self._xp = xp
+        self._cdf = xp.concat([xp.zeros(1, dtype=z.dtype), cumulative_sum(mass)])
+        self._cdf = self._cdf / self._cdf[-1]
+
+    def cdf(self, z: Array | float, /) -> Array:
+        """The cumulative distribution of the redshifts.
+
+        Parameters
+        ----------
+        z : Array or float, positional-only
+            The redshifts.
+
+        Returns
+        -------
+        Array
+
+        """
+        xp = self._xp
+        za = xp.astype(xp.asarray(z), self.z.dtype)
+        flat = xp.reshape(za, (-1,))
+        i, h = self._interval(searchsorted(self.z, flat, side="right"))
+        t = clip((flat - xp.take(self.z, i)) / h, 0.0, 1.0)
+        f0 = xp.take(self.density, i)
+        f1 = xp.take(self.density, i + 1)
+        c = xp.take(self._cdf, i) + h * t * (f0 + (f1 - f0) * t / 2)
+        return cast("Array", xp.reshape(c, za.shape))
+
+    def ppf(self, u: Array | float, /) -> Array:
+        r"""The inverse of the cumulative distribution of the redshifts.
+
+        Within each interval of the grid, the cumulative distribution of the
+        linear density is a quadratic, which is inverted in closed form.
+
+        Parameters
+        ----------
+        u : Array or float, positional-only
+            The probabilities, between 0 and 1.
+
+        Returns
+        -------
+        Array
+            The redshifts.
+
+        """
+        xp = self._xp
+        ua = xp.astype(xp.asarray(u), self.z.dtype)
+        flat = xp.reshape(ua, (-1,))
+        i, h = self._interval(searchsorted(self._cdf, flat, side="right"))
+        c0 = xp.take(self._cdf, i)
+        f0 = xp.take(self.density, i)
+        f1 = xp.take(self.density, i + 1)
+        # Solve h t (f0 + (f1 - f0) t / 2) = u - c0 for t, with the form of the
+        # quadratic formula that is stable for any slope.
+        zero, one = xp.asarray(0.0, dtype=h.dtype), xp.asarray(1.0, dtype=h.dtype)
+        q = flat - c0
+        q = 2 * xp.where(q > 0, q, zero) / h
+        den = f0 + xp.sqrt(f0**2 + q * (f1 - f0))
+        t = xp.where(den > 0, q / xp.where(den > 0, den, one), zero)
+        z = xp.take(self.z, i) + h * clip(t, 0.0, 1.0)
+        return cast("Array", xp.reshape(z, ua.shape))
+
+    def sample(
+        self,
+        n: int,
+        /,
+        *,
+        rng: Any = None,  # noqa: ANN401
+        dtype: Any = None,  # noqa: ANN401
+        out: Array | None = None,
+        chunk_size: int = _CHUNK_SIZE,
+    ) -> Array:
+        """Draw random redshifts.
+
+        The samples are drawn in chunks of ``chunk_size``, which are written to
+        the output array, so that the temporary arrays are bounded for any
+        number of samples. The uniform variates are drawn from a NumPy random
+        generator, in the same sequence for any chunk size, so that the
+        samples are reproducible from the seed alone.
+
+        Parameters
+        ----------
+        n : int, positional-only
+            The number of samples.
+        rng : int or `numpy.random.Generator`, optional keyword-only
+            The random generator, or a seed for a new one. If `None`
+            (default), a generator with fresh entropy from the operating
+            system.
+        dtype : dtype, optional keyword-only
+            The data type of the output, e.g. ``float32`` to halve its memory.
+            The computation is done in double precision. If `None` (default),
+            ``float64``. Ignored if ``out`` is given.
+        out : Array, optional keyword-only
+            A preallocated output array of shape ``(n,)``.
+        chunk_size : int, optional keyword-only
+            The number of samples per chunk.
+
+        Returns
+        -------
+        Array
+            The redshifts. This is ``out`` if given.
+
+        Raises
+        ------
+        ValueError
+            If the shape of the output does not match.
+
+        """
+        import numpy as np  # noqa: PLC0415
+
+        xp = self._xp
+        rng = np.random.default_rng(rng)
+        if out is None:
+            out = cast(
+                "Array", xp.empty(n, dtype=xp.float64 if dtype is None else dtype)
+            )
+        elif out.shape != (n,):
+            msg = f"output must have shape {(n,)}, not {out.shape}"
+            raise ValueError(msg)
+
+        for start in range(0, n, chunk_size):
+            stop = min(start + chunk_size, n)
+            u = xp.asarray(rng.random(stop - start))
+            out[start:stop] = xp.astype(self.ppf(u), out.dtype)
+        return out
+
+    def _interval(self, index: Any, /) -> tuple[Any, Any]:  # noqa: ANN401
+        """The grid interval left of the insertion indices, and its width."""
+        xp = self._xp
+        last = self.z.shape[0] - 2
+        i = xp.reshape(index, (-1,)) - 1
+        i = clip(i, 0, last)
+        h = xp.take(self.z, i + 1) - xp.take(self.z, i)
+        return i, h
@@ -0,0 +1,274 @@
+"""Tables in shared memory for process pools."""
+
+from __future__ import annotations
+
+import contextlib
+import ctypes
+import math
+import os
+import warnings
+from collections.abc import Mapping
+from dataclasses import dataclass
+from multiprocessing import resource_tracker, shared_memory
+from typing import TYPE_CHECKING, Any, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from typing_extensions import Self
+
+    from cosmology.api._array_api.array import Array
+
+__all__: list[str] = []
+
+
+_ALIGN = 64  # bytes, alignment of each table in the shared memory block
+
+# The names of the blocks published by this process, which are registered
+# with the resource tracker for cleanup.
+_PUBLISHED: set[str] = set()
+
+
+@dataclass(frozen=True)
+class SharedTablesHandle:
+    """The name and layout of tables in shared memory.
+
+    A handle is small and picklable; it is what is sent to other processes,
+    which then attach to the shared memory block by name.
+
+    Parameters
+    ----------
+    name : str
+        The name of the shared memory block.
+    layout : tuple[tuple[str, str, tuple[int, ...], int], ...]
+        For each table, its name, data type string, shape, and byte offset
+        into the shared memory block.
+
+    """
+
+    name: str
+    layout: tuple[tuple[str, str, tuple[int, ...], int], ...]
+
+
+class SharedTables(Mapping[str, "Array"]):
+    """Read-only tables in a single shared memory block.
+
+    Implementations that tabulate e.g. distances on a grid are often used
+    in a :class:`~concurrent.futures.ProcessPoolExecutor` or similar, where
+    each worker would otherwise rebuild the tables or unpickle its own copy.
+    Instead, the tables can be published once into shared memory with
+    :meth:`publish`. Pickling a `SharedTables` only pickles its
+    :class:`SharedTablesHandle`, so that objects holding shared tables can be
+    sent to workers at negligible cost, where they are reattached to the same
+    memory by name. N workers then share one copy of the tables.
+
+    Use :meth:`publish` and :meth:`attach` to create instances. The process
+    that publishes the tables owns the shared memory and must :meth:`unlink`
+    it when the tables are no longer needed, which is done automatically when
+    the owner is used as a context manager. Views of the tables that are
+    still in use keep the shared memory mapped after closing, until they are
+    deleted.
+
+    This requires NumPy.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import pickle
+    >>> from cosmology.api.utils import SharedTables
+
+    >>> z = np.linspace(0, 10, 100_000)
+    >>> with SharedTables.publish({"z": z, "dc": 4000 * z / (1 + z)}) as tables:
+    ...     data = pickle.dumps(tables)  # e.g. sent to a worker process
+    ...     attached = pickle.loads(data)
+    ...     print(len(data) < 1000, np.all(attached["dc"] == tables["dc"]))
+    ...     attached.close()
+    True True
+
+    """
+
+    def __init__(
+        self,
+        shm: shared_memory.SharedMemory,
+        handle: SharedTablesHandle,
+        *,
+        owner: bool,
+    ) -> None:
+        self._shm = shm
+        self._handle = handle
+        self._owner = owner
+        self._tables = self._views()
+
+    @classmethod
+    def publish(cls, tables: Mapping[str, Any], /) -> Self:
+        """Copy tables into a new shared memory block.
+
+        Parameters
+        ----------
+        tables : Mapping[str, Array], positional-only
+            The tables, keyed by name.
+
+        Returns
+        -------
+        SharedTables
+            The shared tables, owned by this process.
+
+        """
+        import numpy as np  # noqa: PLC0415
+
+        arrays = {name: np.asarray(table) for name, table in tables.items()}
+
+        layout = []
+        size = 0
+        for name, array in arrays.items():
+            offset = math.ceil(size / _ALIGN) * _ALIGN
+            layout.append((name, array.dtype.str, array.shape, offset))
+            size = offset + array.nbytes
+
+        shm = _SharedMemory(create=True, size=max(size, 1))
+        for name, dtype, shape, offset in layout:
+            out = np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset)
+            out[...] = arrays[name]
+            del out  # release the buffer
+
+        _PUBLISHED.add(shm.name)
+        handle = SharedTablesHandle(name=shm.name, layout=tuple(layout))
+        return cls(shm, handle, owner=True)
+
+    @classmethod
+    def attach(cls, handle: SharedTablesHandle, /) -> Self:
+        """Attach to tables published by another process.
+
+        Parameters
+        ----------
+        handle : SharedTablesHandle, positional-only
+            The handle of the published tables.
+
+        Returns
+        -------
+        SharedTables
+            The shared tables, not owned by this process.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the shared memory block does not exist (anymore).
+
+        """
+        # Attaching must not register the block for cleanup by this process,
+        # which would destroy it when the process exits.
+        try:
+            shm = _SharedMemory(handle.name, track=False)  # type: ignore[call-arg,unused-ignore]
+        except TypeError:
+            # Python < 3.13 always registers the block, which is only undone if
+            # it was not published by this process, as the registrations are
+            # shared.
+            shm = _SharedMemory(handle.name)
+            if os.name == "posix" and handle.name not in _PUBLISHED:
+                resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]  # noqa: SLF001
+        return cls(shm, handle, owner=False)
+
+    @property
+    def handle(self) -> SharedTablesHandle:
+        """The handle for attaching to the tables from other processes."""
+        return self._handle
+
+    @property
+    def owner(self) -> bool:
+        """Whether the tables were published (and are owned) by this object."""
+        return self._owner
+
+    def close(self) -> None:
+        """Close access to the shared memory from this object.
+
+        Views of the tables that are still in use remain valid, and the memory
+        is released when the last of them is deleted. A `ResourceWarning` is
+        emitted if that is the case, since the memory then stays mapped.
+        """
+        self._tables = {}
+        try:
+            self._shm.close()
+        except BufferError:
+            msg = (
+                f"shared memory {self._handle.name!r} stays mapped until the "
+                "views of its tables are deleted"
+            )
+            warnings.warn(msg, ResourceWarning, stacklevel=2)
+
+    def unlink(self) -> None:
+        """Destroy and close the shared memory block.
+
+        Only the owner should unlink the tables, after all processes are done
+        with them. Processes that still have the block mapped can keep using
+        it until they close it.
+        """
+        self._shm.unlink()
+        _PUBLISHED.discard(self._shm.name)
+        self.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._owner:
+            self.unlink()
+        else:
+            self.close()
+
+    def __reduce__(self) -> tuple[Any, tuple[SharedTablesHandle]]:
+        return (type(self).attach, (self._handle,))
+
+    def _views(self) -> dict[str, Any]:
+        """Read-only views of the tables in the shared memory block."""
+        import numpy as np  # noqa: PLC0415
+
+        # The views are created from a ctypes array, which holds on to the
+        # buffer for as long as any of them is in use, so that the memory is
+        # not unmapped under them. Older NumPy does not do that by itself.
+        buffer = cast("memoryview", self._shm.buf)
+        data = memoryview((ctypes.c_char * buffer.nbytes).from_buffer(buffer))
+        tables = {}
+        for name, dtype, shape, offset in self._handle.layout:
+            count = math.prod(shape)
+            table = np.frombuffer(data, dtype=dtype, count=count, offset=offset)
+            table = table.reshape(shape)
+            table.flags.writeable = False
+            tables[name] = table
+        return tables
+
+    # Mapping interface
+
+    def __getitem__(self, name: str) -> Array:
+        return self._tables[name]  # type: ignore[no-any-return]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._tables)
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._handle.name!r}, {list(self._tables)})"
+
+
+class _SharedMemory(shared_memory.SharedMemory):
+    """Shared memory that stays open when deleted while it is in use.
+
+    The memory is then released with the last view of it.
+    """
+
+    def close(self) -> None:
+        try:
+            super().close()
+        except BufferError:
+            # The memory map is still in use, but it has its own duplicate of
+            # the file descriptor, so this one can be closed anyway.
+            fd: int = getattr(self, "_fd", -1)
+            if fd >= 0:
+                os.close(fd)
+                self._fd = -1
+            raise
+
+    def __del__(self) -> None:
+        with contextlib.suppress(BufferError):
+            super().__del__()
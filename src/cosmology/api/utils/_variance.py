@@ -0,0 +1,244 @@
+"""Variance of the linear matter density field by FFT in log space."""
+
+from __future__ import annotations
+
+import math
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Protocol, cast
+
+from cosmology.api._array_api.fallbacks import clip
+from cosmology.api._array_api.namespace import array_namespace
+from cosmology.api._components import HasOmegaM0
+from cosmology.api._extras import HasCriticalDensity0, HasH0
+from cosmology.api._perturbations import HasGrowthFactor
+from cosmology.api.utils._keys import _cache_key
+from cosmology.api.utils._power import EisensteinHuPowerSpectrum, _top_hat
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from cosmology.api._array_api.array import Array
+    from cosmology.api._perturbations import HasLinearPowerSpectrum
+
+__all__: list[str] = []
+
+
+# The maximum number of tables kept by `mass_variance`.
+_MAX_TABLES = 16
+
+_TABLES: OrderedDict[tuple[Any, ...], MassVariance] = OrderedDict()
+
+# The radii are valid where the wavenumbers of the grid extend this factor
+# beyond the scale of the top-hat window on either side.
+_MARGIN = 100.0
+
+
+class _VarianceCosmology(
+    HasH0[Any],
+    HasOmegaM0[Any],
+    HasCriticalDensity0[Any],
+    HasGrowthFactor[Any, Any],
+    Protocol,
+):
+    """The cosmology attributes needed for the mass variance."""
+
+
+class MassVariance:
+    r"""Variance of the linear matter density in spheres, for all radii at once.
+
+    The variance of the linear density field smoothed with a spherical top-hat
+    window of radius :math:`R` is
+
+    .. math::
+
+        \sigma^2(R, z) = D(z)^2 \int \frac{k^3 P(k, 0)}{2\pi^2} \,
+            W^2(kR) \, d\ln k \;.
+
+    On a grid evenly spaced in :math:`\ln k`, this integral is a correlation
+    of the power spectrum with the window for radii evenly spaced in
+    :math:`\ln R`, which is computed for all radii of the grid with one fast
+    Fourier transform in :math:`O(N \log N)` operations, instead of one
+    integral per radius. Other radii are interpolated in :math:`\ln \sigma^2`,
+    with a relative accuracy of about :math:`10^{-5}`.
+
+    The power spectrum is evaluated once, on construction. Lookups for any
+    radii and masses only call the growth factor of the cosmology. The FFT
+    requires the ``fft`` extension of the array API, e.g. NumPy.
+
+    Parameters
+    ----------
+    cosmo : object, positional-only
+        The cosmology, with ``H0``, ``Omega_m0``, ``critical_density0``, and
+        ``growth_factor``. The parameters must be scalars.
+    power : `~cosmology.api.HasLinearPowerSpectrum`, positional-only
+        The linear matter power spectrum.
+    k_min, k_max : float, optional keyword-only
+        The range of wavenumbers in 1/Mpc. Radii are valid between
+        ``100 / k_max`` and ``1 / (100 k_min)``.
+    size : int, optional keyword-only
+        The number of grid points.
+
+    See Also
+    --------
+    mass_variance
+        Cached variances for cosmologies with the same parameters.
+
+    """
+
+    def __init__(
+        self,
+        cosmo: _VarianceCosmology,
+        power: HasLinearPowerSpectrum[Any, Any],
+        /,
+        *,
+        k_min: float = 1e-5,
+        k_max: float = 1e3,
+        size: int = 4096,
+    ) -> None:
+        xp = array_namespace(cosmo.H0)
+        dtype = xp.float64
+        ln_k_min, ln_k_max = math.log(k_min), math.log(k_max)
+        step = (ln_k_max - ln_k_min) / (size - 1)
+
+        k = xp.exp(xp.linspace(ln_k_min, ln_k_max, size, dtype=dtype))
+        f = k**3 * power.linear_power_spectrum(k, 0.0) / (2 * math.pi**2)
+
+        # The radii of the grid are the inverse wavenumbers, so that the window
+        # is needed for the products kR of all pairs, which are evenly spaced
+        # in ln(kR) from k_min/k_max to k_max/k_min.
+        ln_r_min = -ln_k_max
+        m = xp.arange(2 * size - 1, dtype=dtype)
+        window = _top_hat(xp, xp.exp(ln_k_min + ln_r_min + m * step)) ** 2
+
+        # sigma^2(R_j) = step * sum_i f_i window_{i+j}, as a convolution of the
+        # reversed power spectrum with the window.
+        n = 4 * size
+        fft = xp.fft
+        conv = fft.irfft(fft.rfft(xp.flip(f), n=n) * fft.rfft(window, n=n), n=n)
+        sigma2 = step * conv[size - 1 : 2 * size - 1]
+        # Far outside the valid range, round-off can make the variance negative.
+        sigma2 = xp.where(sigma2 > 0, sigma2, xp.asarray(xp.nan, dtype=dtype))
+
+        self.cosmo = cosmo
+        self.power = power
+        self.r_min = _MARGIN / k_max
+        self.r_max = 1 / (_MARGIN * k_min)
+        self._xp = xp
+        self._ln_r_min = ln_r_min
+        self._step = step
+        self._ln_sigma2 = xp.log(sigma2)
+        self._rho_m0 = float(cosmo.Omega_m0 * cosmo.critical_density0)
+
+    def sigma(self, r: Array | float, z: Array | float = 0.0, /) -> Array:
+        """The root mean square of the density in spheres of radius ``r``.
+
+        Parameters
+        ----------
+        r : Array or float, positional-only
+            The radii in Mpc. Radii outside the valid range give NaN.
+        z : Array or float, optional positional-only
+            The redshifts, broadcast against ``r``.
+
+        Returns
+        -------
+        Array
+
+        """
+        xp = self._xp
+        ra = xp.asarray(r)
+        if not xp.isdtype(ra.dtype, "real floating"):
+            ra = xp.astype(ra, xp.float64)
+
+        table = self._ln_sigma2
+        x = (xp.log(xp.astype(ra, table.dtype)) - self._ln_r_min) / self._step
+        last = table.shape[0] - 2
+        i = xp.astype(xp.floor(x), xp.int64)
+        i = clip(i, 0, last)
+        flat_i, flat_x = xp.reshape(i, (-1,)), xp.reshape(x, (-1,))
+        t = flat_x - xp.astype(flat_i, table.dtype)
+        ln_sigma2 = (1 - t) * xp.take(table, flat_i) + t * xp.take(table, flat_i + 1)
+        sigma0 = xp.reshape(xp.exp(ln_sigma2 / 2), ra.shape)
+        valid = (ra >= self.r_min) & (ra <= self.r_max)
+        sigma0 = xp.where(valid, sigma0, xp.asarray(xp.nan, dtype=sigma0.dtype))
+
+        d = self.cosmo.growth_factor(z)
+        return cast("Array", xp.astype(sigma0, ra.dtype) * d)
+
+    def sigma_mass(self, m: Array | float, z: Array | float = 0.0, /) -> Array:
+        r"""The root mean square of the density in spheres of mass ``m``.
+
+        The radius of a sphere of mass :math:`M` is :math:`R = (3 M / (4 \pi
+        \bar\rho_{m,0}))^{1/3}`, with the mean comoving matter density
+        :math:`\bar\rho_{m,0} = \Omega_{m,0} \rho_{c,0}`.
+
+        Parameters
+        ----------
+        m : Array or float, positional-only
+            The masses in Msol.
+        z : Array or float, optional positional-only
+            The redshifts, broadcast against ``m``.
+
+        Returns
+        -------
+        Array
+
+        """
+        xp = self._xp
+        ma = xp.asarray(m)
+        if not xp.isdtype(ma.dtype, "real floating"):
+            ma = xp.astype(ma, xp.float64)
+        r = (3 * ma / (4 * math.pi * self._rho_m0)) ** (1 / 3)
+        return self.sigma(r, z)
+
+
+def mass_variance(
+    cosmo: Any,  # noqa: ANN401
+    /,
+    *,
+    sigma8: float,
+    n_s: float,
+    wiggles: bool = True,
+    key: Hashable | None = None,
+) -> MassVariance:
+    """Get the mass variance of a cosmology, reusing a cached table.
+
+    The variance is computed from the
+    :class:`~cosmology.api.utils.EisensteinHuPowerSpectrum` of the cosmology.
+    Tables are cached by the cosmology, and by the parameters of the power
+    spectrum, so that they are computed once, e.g. for every evaluation of a
+    halo mass function. A hashable cosmology shares its tables with all equal
+    cosmologies, and any other cosmology is compared by identity. The table
+    keeps the cosmology for its growth factor, so that cosmologies can share
+    their tables by ``key`` only if they have the same power spectrum today
+    and the same growth factor. The most recently used tables are kept.
+
+    Parameters
+    ----------
+    cosmo : object, positional-only
+        The cosmology, with the attributes needed by
+        :class:`~cosmology.api.utils.EisensteinHuPowerSpectrum` and
+        :class:`MassVariance`.
+    sigma8, n_s, wiggles : keyword-only
+        The parameters of the power spectrum.
+    key : hashable, optional keyword-only
+        The key of the cosmology in the cache, instead of the cosmology. All
+        cosmologies with the same key must have the same tables.
+
+    Returns
+    -------
+    `MassVariance`
+
+    """
+    cache_key = (_cache_key(cosmo) if key is None else key, sigma8, n_s, wiggles)
+    table = _TABLES.get(cache_key)
+    if table is None:
+        power = EisensteinHuPowerSpectrum(
+            cosmo, sigma8=sigma8, n_s=n_s, wiggles=wiggles
+        )
+        table = MassVariance(cosmo, power)
+        _TABLES[cache_key] = table
+        while len(_TABLES) > _MAX_TABLES:
+            _TABLES.popitem(last=False)
+    else:
+        _TABLES.move_to_end(cache_key)
+    return table
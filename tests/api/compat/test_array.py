@@ -0,0 +1,97 @@
+"""Test ``cosmology.api.compat.to_array``."""
+
+from __future__ import annotations
+
+import array
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from cosmology.api.compat import to_array
+
+################################################################################
+# TESTS
+################################################################################
+
+
+class DLPackOnly:
+    """A foreign array type that only supports DLPack."""
+
+    def __init__(self, data):
+        self._data = data
+
+    def __dlpack__(self, **kwargs):
+        return self._data.__dlpack__(**kwargs)
+
+    def __dlpack_device__(self):
+        return self._data.__dlpack_device__()
+
+
+@pytest.mark.skipif(not hasattr(np, "from_dlpack"), reason="requires DLPack")
+def test_dlpack_no_copy():
+    """Test that DLPack-supporting objects are not copied."""
+    data = np.linspace(0, 1, 10)
+
+    x = to_array(DLPackOnly(data), np, copy=False)
+
+    assert np.shares_memory(x, data)
+
+
+def test_buffer_no_copy():
+    """Test that objects supporting the buffer protocol are not copied."""
+    buffer = array.array("d", [1.0, 2.0, 3.0])
+
+    x = to_array(buffer, np)
+    buffer[0] = 10.0
+
+    assert x.dtype == np.float64
+    assert x[0] == buffer[0]
+
+
+def test_readonly_buffer():
+    """Test that read-only buffers are shared, giving read-only arrays."""
+    buffer = np.arange(3.0).tobytes()
+
+    x = to_array(buffer, np, copy=False)
+
+    assert not x.flags.writeable
+
+
+def test_copy_needed():
+    """Test objects without DLPack or buffer support."""
+    obj = [1.0, 2.0, 3.0]
+
+    x = to_array(obj, np)
+    assert np.all(x == np.asarray(obj))
+
+    with pytest.raises(ValueError, match="without copying"):
+        to_array(obj, np, copy=False)
+
+
+def test_copy_true():
+    """Test that ``copy=True`` always copies."""
+    data = np.linspace(0, 1, 10)
+
+    x = to_array(data, np, copy=True)
+
+    assert not np.shares_memory(x, data)
+
+
+def test_buffer_copied_by_namespace():
+    """Test that a namespace that copies buffers cannot give a shared array."""
+
+    def asarray(obj, **kwargs):
+        if "copy" in kwargs:
+            raise TypeError
+        return np.array(obj)
+
+    xp = SimpleNamespace(asarray=asarray)
+    buffer = array.array("d", [1.0, 2.0, 3.0])
+
+    with pytest.raises(ValueError, match="without copying"):
+        to_array(buffer, xp, copy=False)
+
+    x = to_array(buffer, xp)
+    buffer[0] = 10.0
+    assert x[0] == 1.0
@@ -0,0 +1,133 @@
+"""Test ``cosmology.api.compat.InstrumentedCosmology``."""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import pickle
+from types import SimpleNamespace
+
+import pytest
+
+from cosmology.api import StandardCosmology
+from cosmology.api.compat import InstrumentedCosmology, MethodProfile
+
+from ..conftest import np
+
+SIZE = 10
+
+################################################################################
+# TESTS
+################################################################################
+
+
+@pytest.fixture
+def z():
+    return np.linspace(0.1, 1.0, SIZE, dtype=np.float64)
+
+
+def test_forwarding(eds, z):
+    """Test that the instrumented cosmology behaves like the wrapped one."""
+    cosmo = InstrumentedCosmology(eds)
+
+    assert isinstance(cosmo, StandardCosmology)
+    assert cosmo.cosmo is eds
+    assert cosmo.name == eds.name
+    assert cosmo.H0 == eds.H0
+    assert cosmo.__cosmology_namespace__ == eds.__cosmology_namespace__
+    assert np.all(cosmo.comoving_distance(z) == eds.comoving_distance(z))
+    assert cosmo.comoving_distance.__name__ == "comoving_distance"
+
+    with pytest.raises(AttributeError):
+        _ = cosmo.not_an_attribute
+
+
+def test_profile(eds, z):
+    """Test that calls, input sizes and times are recorded."""
+    cosmo = InstrumentedCosmology(eds)
+
+    cosmo.comoving_distance(z)
+    cosmo.comoving_distance(0.5)
+    cosmo.comoving_distance(z[:1], z)
+    cosmo.H0  # noqa: B018
+
+    assert set(cosmo.profile) == {"comoving_distance"}
+    prof = cosmo.profile["comoving_distance"]
+    assert isinstance(prof, MethodProfile)
+    assert prof.calls == 3  # noqa: PLR2004
+    assert prof.elements == 2 * SIZE + 1
+    assert prof.max_elements == SIZE
+    assert prof.time > 0
+    assert prof.mean_time == prof.time / prof.calls
+
+    cosmo.reset_profile()
+    assert cosmo.profile == {}
+
+
+def test_profile_exception(eds):
+    """Test that failing calls are recorded."""
+    cosmo = InstrumentedCosmology(eds)
+
+    with pytest.raises(TypeError):
+        cosmo.comoving_distance()
+
+    assert cosmo.profile["comoving_distance"].calls == 1
+
+
+def test_select_methods(eds, z):
+    """Test that only the selected methods are profiled."""
+    cosmo = InstrumentedCosmology(eds, methods=["lookback_time"])
+
+    cosmo.comoving_distance(z)
+    cosmo.lookback_time(z)
+
+    assert set(cosmo.profile) == {"lookback_time"}
+
+
+def test_disabled(eds, z):
+    """Test that a disabled instrumented cosmology returns the raw methods."""
+    cosmo = InstrumentedCosmology(eds, enabled=False)
+
+    assert cosmo.comoving_distance == eds.comoving_distance
+    cosmo.comoving_distance(z)
+    assert cosmo.profile == {}
+
+    cosmo.enabled = True
+    cosmo.comoving_distance(z)
+    assert cosmo.profile["comoving_distance"].calls == 1
+
+
+def test_export(eds, z):
+    """Test the JSON and CSV exports."""
+    cosmo = InstrumentedCosmology(eds)
+    cosmo.comoving_distance(z)
+    cosmo.lookback_time(z)
+
+    d = json.loads(cosmo.profile_to_json())
+    assert set(d) == {"comoving_distance", "lookback_time"}
+    assert d["comoving_distance"]["calls"] == 1
+    assert d["comoving_distance"]["elements"] == SIZE
+    times = [v["time"] for v in d.values()]
+    assert times == sorted(times, reverse=True)
+
+    rows = list(csv.DictReader(io.StringIO(cosmo.profile_to_csv())))
+    assert [r["method"] for r in rows] == list(d)
+    assert int(rows[0]["calls"]) == 1
+
+
+def _distance(z):
+    return 4_000 * z
+
+
+def test_pickle():
+    """Test that the instrumented cosmology can be pickled."""
+    cosmo = InstrumentedCosmology(SimpleNamespace(comoving_distance=_distance))
+    cosmo.comoving_distance(0.5)
+
+    new = pickle.loads(pickle.dumps(cosmo))  # noqa: S301
+
+    assert type(new) is type(cosmo)
+    assert new.profile["comoving_distance"].calls == 1
+    assert new.comoving_distance(0.5) == 2_000.0  # noqa: PLR2004
+    assert new.profile["comoving_distance"].calls == 2  # noqa: PLR2004
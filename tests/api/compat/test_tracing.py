@@ -0,0 +1,118 @@
+"""Test ``cosmology.api.compat.TracingCosmology``."""
+
+from __future__ import annotations
+
+import pytest
+
+from cosmology.api import StandardCosmology
+from cosmology.api.compat import (
+    InMemorySpanSink,
+    NoOpSpanSink,
+    Span,
+    SpanSink,
+    TracingCosmology,
+)
+
+from ..conftest import np
+
+SIZE = 10
+MAXLEN = 2
+
+################################################################################
+# TESTS
+################################################################################
+
+
+@pytest.fixture
+def z():
+    return np.linspace(0.1, 1.0, SIZE, dtype=np.float64)
+
+
+def test_sinks():
+    """Test that the sinks are span sinks."""
+    assert isinstance(NoOpSpanSink(), SpanSink)
+    assert isinstance(InMemorySpanSink(), SpanSink)
+
+
+def test_in_memory_sink_maxlen():
+    """Test that the in-memory sink keeps the latest spans."""
+    sink = InMemorySpanSink(maxlen=MAXLEN)
+    spans = [Span(name=f"span{i}", start_time_ns=i, duration_ns=1) for i in range(3)]
+    for span in spans:
+        sink.emit(span)
+
+    assert list(sink.spans) == spans[1:]
+    assert sink.spans[-1].end_time_ns == 3  # noqa: PLR2004
+
+    sink.clear()
+    assert not sink.spans
+
+    assert InMemorySpanSink().spans.maxlen is not None
+
+
+def test_forwarding(eds, z):
+    """Test that the tracing cosmology behaves like the wrapped one."""
+    cosmo = TracingCosmology(eds, sink=NoOpSpanSink())
+
+    assert isinstance(cosmo, StandardCosmology)
+    assert cosmo.H0 == eds.H0
+    assert np.all(cosmo.luminosity_distance(z) == eds.luminosity_distance(z))
+
+
+def test_spans(eds, z):
+    """Test that each call emits a span."""
+    cosmo = TracingCosmology(eds)
+    assert isinstance(cosmo.sink, InMemorySpanSink)
+
+    cosmo.luminosity_distance(z)
+    cosmo.growth_factor(z)
+    cosmo.lookback_time(0.5)
+    cosmo.H0  # noqa: B018
+
+    first, second = cosmo.sink.spans
+    assert first.name == "cosmology.luminosity_distance"
+    assert first.attributes == {
+        "cosmology.method": "luminosity_distance",
+        "cosmology.name": "EdS",
+        "array.shape": (SIZE,),
+        "array.dtype": "float64",
+    }
+    assert first.duration_ns > 0
+    assert first.error is None
+    assert first.start_time_ns <= second.start_time_ns
+
+    # ``growth_factor`` is not a standard method, so it is not traced.
+    assert second.name == "cosmology.lookback_time"
+    assert second.attributes["array.shape"] == ()
+
+
+def test_select_methods(eds, z):
+    """Test that selected methods are traced, including non-standard ones."""
+    cosmo = TracingCosmology(eds, methods=["growth_factor"])
+
+    cosmo.luminosity_distance(z)
+    cosmo.growth_factor(np.asarray(z, dtype=np.float32))
+
+    (span,) = cosmo.sink.spans
+    assert span.attributes["cosmology.method"] == "growth_factor"
+    assert span.attributes["array.dtype"] == "float32"
+
+
+def test_error(eds):
+    """Test that failing calls emit a span with the error."""
+    cosmo = TracingCosmology(eds)
+
+    with pytest.raises(TypeError):
+        cosmo.luminosity_distance()
+
+    (span,) = cosmo.sink.spans
+    assert span.error.startswith("TypeError")
+    assert span.attributes["array.shape"] is None
+
+
+def test_disabled(eds, z):
+    """Test that a disabled tracing cosmology emits no spans."""
+    cosmo = TracingCosmology(eds, enabled=False)
+
+    cosmo.luminosity_distance(z)
+    assert not cosmo.sink.spans
@@ -35,6 +35,11 @@ from cosmology.api import (
     TotalComponent,
 )
 from cosmology.api._array_api import Array
+from cosmology.api._standard import (
+    STANDARD_ATTRIBUTES,
+    STANDARD_METHODS,
+    _get_protocol_members,
+)
 
 np_ve = Version(get_version("numpy"))
 if np_ve >= Version("1.23") and np_ve < Version("2.1"):
@@ -42,6 +47,13 @@ if np_ve >= Version("1.23") and np_ve < Version("2.1"):
 else:
     import numpy as np
 
+# The utilities need arrays with ``__array_namespace__``, which plain NumPy
+# arrays only have from NumPy 2.
+requires_array_api = pytest.mark.skipif(
+    not hasattr(np.asarray(0.0), "__array_namespace__"),
+    reason="requires arrays of the array API standard",
+)
+
 CT = TypeVar("CT", bound=Cosmology)
 
 
@@ -57,23 +69,11 @@ def _return_1arg(self, z: Array, /) -> Array:
     return z
 
 
-def _get_attrs_meths(
-    cls: type, comp_cls: type
-) -> tuple[frozenset[str], frozenset[str]]:
-    """Get the set of attributes and methods for a component class."""
-    public_stuff = {
-        k for k in (set(dir(cls)) - set(dir(comp_cls))) if not k.startswith("_")
-    }
-    attrs = frozenset({k for k in public_stuff if not callable(getattr(cls, k))})
-    meths = frozenset({k for k in public_stuff if callable(getattr(cls, k))})
-    return attrs, meths
-
-
 def make_cls(
     comp_api_cls: type, fields: set[str], bases: tuple[type, ...] = ()
 ) -> type:
     """Make a component class."""
-    comp_attrs, comp_meths = _get_attrs_meths(comp_api_cls, Cosmology)
+    comp_attrs, comp_meths = _get_protocol_members(comp_api_cls)
 
     return make_dataclass(
         f"Example{comp_api_cls.__name__}",
@@ -270,7 +270,7 @@ def proper_cls(
 
 # ----------------------------------
 
-DISTANCES_ATTRS, DISTANCES_METHS = _get_attrs_meths(DistanceMeasures, Cosmology)
+DISTANCES_ATTRS, DISTANCES_METHS = _get_protocol_members(DistanceMeasures)
 
 
 @pytest.fixture(scope="session")
@@ -315,7 +315,7 @@ def dists(
 # Standard API
 
 
-STDCOSMO_ATTRS, STDCOSMO_METHS = _get_attrs_meths(StandardCosmology, Cosmology)
+STDCOSMO_ATTRS, STDCOSMO_METHS = STANDARD_ATTRIBUTES, STANDARD_METHODS
 
 
 @pytest.fixture(scope="session")
@@ -376,3 +376,183 @@ def standardcosmo(
 ) -> StandardCosmology:
     """Example FLRW API instance."""
     return standard_cls()
+
+
+# ==============================================================================
+# Analytic cosmology
+#
+# The example classes above only check conformance; their methods return their
+# input. For numerical checks we need a cosmology with known values, so here is
+# the Einstein-de Sitter model (flat, matter only) for which all distances are
+# analytic. Parameters are cast to the floating dtype of the input, so that e.g.
+# ``float32`` input gives ``float32`` output.
+
+C_KMS = 299792.458  # km s-1
+G_PC = 4.30091727003628e-3  # pc km2 s-2 Msol-1
+KMS_MPC_GYR = 977.7922216807891  # 1 / (km s-1 Mpc-1) in Gyr
+
+
+def _astype(x: Array, dtype: object, /) -> Array:
+    # ``astype`` is a function of the namespace in the array API, and a method
+    # of the array in NumPy < 2.
+    return np.astype(x, dtype) if hasattr(np, "astype") else x.astype(dtype)
+
+
+def _asfloat(z, /) -> Array:
+    z = np.asarray(z)
+    if hasattr(np, "isdtype"):
+        floating = np.isdtype(z.dtype, "real floating")
+    else:
+        floating = np.issubdtype(z.dtype, np.floating)
+    return z if floating else _astype(z, np.float64)
+
+
+@pytest.fixture(scope="session")
+def eds_cls() -> type[StandardCosmology]:  # noqa: C901
+    """An analytic Einstein-de Sitter cosmology class."""
+
+    @dataclass(frozen=True)
+    class EinsteinDeSitter:
+        """Flat, matter-only cosmology with analytic distances."""
+
+        name: str | None = "EdS"
+        H0: Array = field(default_factory=lambda: np.asarray(70.0))
+        Omega_b0: Array = field(default_factory=lambda: np.asarray(0.05))
+        T_cmb0: Array = field(default_factory=lambda: np.asarray(2.7255))
+        Neff: Array = field(default_factory=lambda: np.asarray(3.046))
+        m_nu: tuple[Array, ...] = field(
+            default_factory=lambda: (np.asarray(0.0), np.asarray(0.0), np.asarray(0.0))
+        )
+
+        @property
+        def __cosmology_namespace__(self) -> CosmologyNamespace:
+            return SimpleNamespace(constants=self.constants)
+
+        @property
+        def constants(self) -> CosmologyConstantsNamespace:
+            return SimpleNamespace(G=G_PC, c=C_KMS)
+
+        # --- Components ---
+
+        Omega_m0 = property(lambda _: np.asarray(1.0))
+        Omega_dm0 = property(lambda self: 1 - self.Omega_b0)
+        Omega_de0 = property(lambda _: np.asarray(0.0))
+        Omega_k0 = property(lambda _: np.asarray(0.0))
+        Omega_gamma0 = property(lambda _: np.asarray(0.0))
+        Omega_nu0 = property(lambda _: np.asarray(0.0))
+        Omega_tot0 = property(lambda _: np.asarray(1.0))
+
+        def Omega_m(self, z, /):
+            return np.ones_like(_asfloat(z))
+
+        def Omega_b(self, z, /):
+            z = _asfloat(z)
+            return _astype(self.Omega_b0, z.dtype) * self.Omega_m(z)
+
+        def Omega_dm(self, z, /):
+            z = _asfloat(z)
+            return _astype(self.Omega_dm0, z.dtype) * self.Omega_m(z)
+
+        def Omega_tot(self, z, /):
+            return self.Omega_m(z)
+
+        def Omega_de(self, z, /):
+            return np.zeros_like(_asfloat(z))
+
+        Omega_k = Omega_gamma = Omega_nu = Omega_de
+
+        # --- Hubble parameter and critical density ---
+
+        @property
+        def hubble_distance(self) -> Array:
+            return C_KMS / self.H0
+
+        @property
+        def hubble_time(self) -> Array:
+            return KMS_MPC_GYR / self.H0
+
+        @property
+        def critical_density0(self) -> Array:
+            return 3 * self.H0**2 / (8 * np.pi * G_PC * 1e-6)
+
+        def H_over_H0(self, z, /):
+            return (1 + _asfloat(z)) ** 1.5
+
+        def H(self, z, /):
+            z = _asfloat(z)
+            return _astype(self.H0, z.dtype) * self.H_over_H0(z)
+
+        def critical_density(self, z, /):
+            z = _asfloat(z)
+            return _astype(self.critical_density0, z.dtype) * self.H_over_H0(z) ** 2
+
+        # --- Distance measures ---
+
+        scale_factor0 = property(lambda _: np.asarray(1.0))
+
+        def scale_factor(self, z, /):
+            return 1 / (1 + _asfloat(z))
+
+        def T_cmb(self, z, /):
+            z = _asfloat(z)
+            return _astype(self.T_cmb0, z.dtype) * (1 + z)
+
+        def _dc(self, z, /):
+            z = _asfloat(z)
+            return 2 * _astype(self.hubble_distance, z.dtype) * (1 - (1 + z) ** -0.5)
+
+        def comoving_distance(self, z1, z2=None, /):
+            return self._dc(z1) if z2 is None else self._dc(z2) - self._dc(z1)
+
+        transverse_comoving_distance = comoving_distance
+
+        def inv_comoving_distance(self, dc, /):
+            dc = _asfloat(dc)
+            dh = _astype(self.hubble_distance, dc.dtype)
+            return (1 - dc / (2 * dh)) ** -2 - 1
+
+        def comoving_volume(self, z1, z2=None, /):
+            z1, z2 = (0.0 * _asfloat(z1), z1) if z2 is None else (z1, z2)
+            return 4 * np.pi / 3 * (self._dc(z2) ** 3 - self._dc(z1) ** 3)
+
+        def differential_comoving_volume(self, z, /):
+            z = _asfloat(z)
+            dh = _astype(self.hubble_distance, z.dtype)
+            return dh * self._dc(z) ** 2 / self.H_over_H0(z)
+
+        def age(self, z, /):
+            z = _asfloat(z)
+            return 2 / 3 * _astype(self.hubble_time, z.dtype) * (1 + z) ** -1.5
+
+        def lookback_time(self, z1, z2=None, /):
+            z1, z2 = (0.0 * _asfloat(z1), z1) if z2 is None else (z1, z2)
+            return self.age(z1) - self.age(z2)
+
+        proper_time = lookback_time
+
+        def lookback_distance(self, z1, z2=None, /):
+            t = self.lookback_time(z1, z2)
+            return t * _astype(self.hubble_distance / self.hubble_time, t.dtype)
+
+        proper_distance = lookback_distance
+
+        def angular_diameter_distance(self, z1, z2=None, /):
+            z = z1 if z2 is None else z2
+            return self.comoving_distance(z1, z2) / (1 + _asfloat(z))
+
+        def luminosity_distance(self, z1, z2=None, /):
+            z = z1 if z2 is None else z2
+            return self.comoving_distance(z1, z2) * (1 + _asfloat(z))
+
+        # --- Perturbations ---
+
+        def growth_factor(self, z, /):
+            return self.scale_factor(z)
+
+    return EinsteinDeSitter
+
+
+@pytest.fixture(scope="session")
+def eds(eds_cls: type[StandardCosmology]) -> StandardCosmology:
+    """An analytic Einstein-de Sitter cosmology."""
+    return eds_cls()
@@ -0,0 +1,63 @@
+"""Test ``cosmology.api.HasConformalTime`` and ``cosmology.api.HasSoundHorizon``."""
+
+from __future__ import annotations
+
+from dataclasses import make_dataclass
+
+from cosmology.api import HasConformalTime, HasSoundHorizon
+
+from ..conftest import _return_1arg
+
+################################################################################
+# TESTS
+################################################################################
+
+
+def test_noncompliant_conformal_time():
+    """
+    Test that a non-compliant instance is not a
+    `cosmology.api.HasConformalTime`.
+    """
+
+    class ConformalTimeCosmology:
+        pass
+
+    assert not isinstance(ConformalTimeCosmology(), HasConformalTime)
+
+
+def test_compliant_conformal_time(cosmology_cls):
+    """Test that a compliant instance is a `cosmology.api.HasConformalTime`."""
+    ExampleConformalTime = make_dataclass(
+        "ExampleConformalTime",
+        [],
+        bases=(cosmology_cls,),
+        namespace={"conformal_time": _return_1arg},
+        frozen=True,
+    )
+
+    assert isinstance(ExampleConformalTime(), HasConformalTime)
+
+
+def test_noncompliant_sound_horizon():
+    """
+    Test that a non-compliant instance is not a
+    `cosmology.api.HasSoundHorizon`.
+    """
+
+    class SoundHorizonCosmology:
+        pass
+
+    assert not isinstance(SoundHorizonCosmology(), HasSoundHorizon)
+
+
+def test_compliant_sound_horizon(cosmology_cls):
+    """Test that a compliant instance is a `cosmology.api.HasSoundHorizon`."""
+    ExampleSoundHorizon = make_dataclass(
+        "ExampleSoundHorizon",
+        [],
+        bases=(cosmology_cls,),
+        namespace={"sound_horizon": _return_1arg},
+        frozen=True,
+    )
+
+    assert isinstance(ExampleSoundHorizon(), HasSoundHorizon)
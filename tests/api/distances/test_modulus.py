@@ -0,0 +1,38 @@
+"""Test ``cosmology.api.HasDistanceModulus``."""
+
+from __future__ import annotations
+
+from dataclasses import make_dataclass
+
+from cosmology.api import HasDistanceModulus
+
+from ..conftest import _return_1arg
+
+################################################################################
+# TESTS
+################################################################################
+
+
+def test_noncompliant_modulus():
+    """
+    Test that a non-compliant instance is not a
+    `cosmology.api.HasDistanceModulus`.
+    """
+
+    class DistanceModulusCosmology:
+        pass
+
+    assert not isinstance(DistanceModulusCosmology(), HasDistanceModulus)
+
+
+def test_compliant_modulus(cosmology_cls):
+    """Test that a compliant instance is a `cosmology.api.HasDistanceModulus`."""
+    ExampleDistanceModulus = make_dataclass(
+        "ExampleDistanceModulus",
+        [],
+        bases=(cosmology_cls,),
+        namespace={"distance_modulus": _return_1arg},
+        frozen=True,
+    )
+
+    assert isinstance(ExampleDistanceModulus(), HasDistanceModulus)
@@ -0,0 +1,66 @@
+"""Test the Array API functions with fallbacks for older standards."""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from cosmology.api._array_api.fallbacks import (
+    _bisect,
+    _prefix_sum,
+    clip,
+    cumulative_sum,
+    searchsorted,
+)
+
+from .conftest import np, requires_array_api
+
+pytestmark = requires_array_api
+
+################################################################################
+# TESTS
+################################################################################
+
+
+@pytest.mark.parametrize("func", [cumulative_sum, lambda x: _prefix_sum(np, x)])
+@pytest.mark.parametrize("shape", [(1,), (7,), (3, 8)])
+def test_cumulative_sum(func, shape):
+    """Test the cumulative sum along the last axis."""
+    x = np.reshape(np.arange(math.prod(shape), dtype=np.float64), shape)
+    result = func(x)
+
+    # Along the last axis, x[..., j] = x[..., 0] + j.
+    j = np.arange(shape[-1], dtype=np.float64)
+    expected = (j + 1) * x[..., :1] + j * (j + 1) / 2
+    assert result.shape == x.shape
+    assert np.all(result == expected)
+
+
+@pytest.mark.parametrize(
+    "func",
+    [searchsorted, lambda x1, x2, side: _bisect(np, x1, x2, side)],
+    ids=["searchsorted", "bisect"],
+)
+@pytest.mark.parametrize("side", ["left", "right"])
+@pytest.mark.parametrize("n", [1, 2, 5, 8])
+def test_searchsorted(func, side, n):
+    """Test the insertion indices against a linear search."""
+    x1 = np.arange(n, dtype=np.float64)
+    x2 = np.reshape(np.linspace(-1.0, n, 4 * n + 5, dtype=np.float64), (-1, 1))
+    result = func(x1, x2, side=side) if func is searchsorted else func(x1, x2, side)
+
+    below = (x1 < x2) if side == "left" else (x1 <= x2)
+    expected = np.sum(np.astype(below, np.int64), axis=-1, keepdims=True)
+    assert result.shape == x2.shape
+    assert np.all(result == expected)
+
+
+def test_clip():
+    """Test clamping to a range."""
+    x = np.linspace(-2.0, 2.0, 9, dtype=np.float64)
+    result = clip(x, -1.0, 1.0)
+
+    expected = np.asarray([-1.0, -1.0, -1.0, -0.5, 0.0, 0.5, 1.0, 1.0, 1.0])
+    assert result.dtype == x.dtype
+    assert np.all(result == expected)
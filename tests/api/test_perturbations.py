@@ -0,0 +1,39 @@
+"""Test ``cosmology.api.HasLinearPowerSpectrum``."""
+
+from __future__ import annotations
+
+from dataclasses import make_dataclass
+
+from cosmology.api import HasLinearPowerSpectrum
+
+################################################################################
+# TESTS
+################################################################################
+
+
+def test_noncompliant_linear_power_spectrum():
+    """
+    Test that a non-compliant instance is not a
+    `cosmology.api.HasLinearPowerSpectrum`.
+    """
+
+    class LinearPowerSpectrumCosmology:
+        pass
+
+    assert not isinstance(LinearPowerSpectrumCosmology(), HasLinearPowerSpectrum)
+
+
+def test_compliant_linear_power_spectrum(cosmology_cls):
+    """
+    Test that a compliant instance is a
+    `cosmology.api.HasLinearPowerSpectrum`.
+    """
+    ExampleLinearPowerSpectrum = make_dataclass(
+        "ExampleLinearPowerSpectrum",
+        [],
+        bases=(cosmology_cls,),
+        namespace={"linear_power_spectrum": lambda _, k, z, /: k * z},
+        frozen=True,
+    )
+
+    assert isinstance(ExampleLinearPowerSpectrum(), HasLinearPowerSpectrum)
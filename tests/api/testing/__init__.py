@@ -0,0 +1 @@
+"""Test the Cosmology API testing tools."""
@@ -0,0 +1,149 @@
+"""Test ``cosmology.api.testing.benchmark_cosmology``."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+
+import pytest
+
+from cosmology.api._standard import STANDARD_METHODS
+from cosmology.api.testing import (
+    CosmologyReport,
+    MethodTiming,
+    benchmark_cosmology,
+)
+
+from ..conftest import np, requires_array_api
+
+SIZES = (1, 10)
+TWO_REDSHIFTS = {
+    "angular_diameter_distance",
+    "comoving_distance",
+    "comoving_volume",
+    "lookback_distance",
+    "lookback_time",
+    "luminosity_distance",
+    "proper_distance",
+    "proper_time",
+    "transverse_comoving_distance",
+}
+
+pytestmark = requires_array_api
+
+################################################################################
+# TESTS
+################################################################################
+
+
+@pytest.fixture(scope="module")
+def report(eds_cls):
+    return benchmark_cosmology(eds_cls(), sizes=SIZES, repeat=2, min_time=1e-4)
+
+
+def test_report_conformant(report):
+    """Test that a conformant cosmology passes all checks."""
+    assert isinstance(report, CosmologyReport)
+    assert report.conformant
+    assert report.missing == ()
+    assert report.errors == {}
+    assert report.protocols["StandardCosmology"]
+    assert report.cosmology == "EinsteinDeSitter('EdS')"
+
+
+def test_report_timings(report):
+    """Test that every method is timed for every input kind."""
+    assert all(isinstance(t, MethodTiming) for t in report.timings)
+    assert {t.method for t in report.timings} == STANDARD_METHODS
+
+    for name in STANDARD_METHODS:
+        kinds = {(t.nargs, t.size) for t in report.timings if t.method == name}
+        nargs = 2 if name in TWO_REDSHIFTS else 1
+        assert kinds == {
+            (n, size) for n in range(1, nargs + 1) for size in (None, *SIZES)
+        }
+
+    for t in report.timings:
+        assert t.calls >= 1
+        assert 0 < t.best <= t.mean
+        assert t.throughput > 0
+
+
+def test_report_json(report):
+    """Test that the report round-trips through JSON."""
+    d = json.loads(report.to_json())
+
+    assert d["conformant"] is True
+    assert d["cosmology"] == report.cosmology
+    assert len(d["timings"]) == len(report.timings)
+    assert set(d["timings"][0]) == {
+        "method",
+        "nargs",
+        "size",
+        "calls",
+        "best",
+        "mean",
+        "throughput",
+    }
+    assert set(d["environment"]) == {"python", "platform"}
+
+
+def test_report_select_methods(eds):
+    """Test that methods can be selected."""
+    report = benchmark_cosmology(
+        eds, sizes=(), methods=["comoving_distance"], repeat=1, min_time=0
+    )
+
+    assert {t.method for t in report.timings} == {"comoving_distance"}
+    assert {(t.nargs, t.size) for t in report.timings} == {(1, None), (2, None)}
+
+
+def test_report_nonconformant(eds):
+    """Test that missing members and wrong outputs are reported."""
+
+    @dataclass(frozen=True)
+    class Broken:
+        H0: float = 70.0
+
+        def comoving_distance(self, z, /):
+            return eds.comoving_distance(z)
+
+        def lookback_time(self, z, /):
+            return float(np.max(eds.lookback_time(z)))
+
+        def hubble_distance(self):
+            return eds.hubble_distance
+
+    report = benchmark_cosmology(Broken(), sizes=(), repeat=1, min_time=0)
+
+    assert not report.conformant
+    assert not report.protocols["StandardCosmology"]
+    assert "Omega_m0" in report.missing
+    assert "comoving_distance" not in report.missing
+    assert "TypeError" in report.errors["comoving_distance"]
+    assert "TypeError" in report.errors["lookback_time"]
+    assert {t.method for t in report.timings} == set()
+
+
+def test_report_first_method_raises(eds):
+    """Test that a failing method is reported before the namespace is known."""
+
+    @dataclass(frozen=True)
+    class Broken:
+        def H(self, z, /):
+            raise NotImplementedError
+
+        def Omega_m(self, z, /):
+            return eds.Omega_m(z)
+
+    report = benchmark_cosmology(Broken(), sizes=(), repeat=1, min_time=0)
+
+    assert report.errors == {"H": "NotImplementedError: "}
+    assert {t.method for t in report.timings} == {"Omega_m"}
+
+    # Without any callable method, all methods are errors.
+    report = benchmark_cosmology(
+        Broken(), sizes=(), methods=["H"], repeat=1, min_time=0
+    )
+    assert set(report.errors) == {"H"}
+    assert report.timings == ()
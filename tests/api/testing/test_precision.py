@@ -0,0 +1,70 @@
+"""Test ``cosmology.api.testing.precision_report``."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pytest
+
+from cosmology.api._standard import STANDARD_METHODS
+from cosmology.api.testing import PrecisionResult, precision_report
+
+from ..conftest import np, requires_array_api
+
+FLOAT32_RTOL = 1e-5
+FLOAT64_RTOL = 1e-6
+
+pytestmark = requires_array_api
+
+################################################################################
+# TESTS
+################################################################################
+
+
+@pytest.fixture(scope="module")
+def z():
+    return np.linspace(0.0, 10.0, 1001, dtype=np.float64)
+
+
+def test_report_methods(eds, z):
+    """Test that all the methods of the cosmology are in the report."""
+    report = precision_report(eds, z)
+
+    assert set(report) == STANDARD_METHODS
+    assert list(report) == sorted(report)
+    assert all(isinstance(r, PrecisionResult) for r in report.values())
+
+
+def test_report_select_methods(eds, z):
+    """Test that methods can be selected, and missing methods are skipped."""
+    report = precision_report(eds, z, methods=["comoving_distance", "not_a_method"])
+
+    assert set(report) == {"comoving_distance"}
+
+
+def test_float32_envelope(eds, z):
+    """Test the accuracy envelope of a dtype-preserving implementation."""
+    report = precision_report(eds, z, methods=[*STANDARD_METHODS, "growth_factor"])
+
+    for result in report.values():
+        assert result.dtype_preserved, result.method
+        assert result.dtype == np.float32
+        assert result.max_rel_error < FLOAT32_RTOL, result.method
+
+
+def test_dtype_not_preserved(eds_cls, z):
+    """Test that an upcasting implementation is reported."""
+
+    @dataclass(frozen=True)
+    class UpcastingComovingDistance(eds_cls):
+        def comoving_distance(self, z1, z2=None, /):
+            return super().comoving_distance(np.astype(z1, np.float64))
+
+    report = precision_report(
+        UpcastingComovingDistance(), z, methods=["comoving_distance"]
+    )
+    result = report["comoving_distance"]
+
+    assert not result.dtype_preserved
+    assert result.dtype == np.float64
+    assert result.max_rel_error < FLOAT64_RTOL
@@ -0,0 +1,91 @@
+"""Test ``cosmology.api.utils.scale_factor`` and ``T_cmb``."""
+
+from __future__ import annotations
+
+import pytest
+
+from cosmology.api.utils import T_cmb, scale_factor
+
+from ..conftest import np, requires_array_api
+
+RTOL = 1e-15
+
+pytestmark = requires_array_api
+
+################################################################################
+# TESTS
+################################################################################
+
+
+@pytest.fixture
+def z():
+    return np.linspace(0.0, 10.0, 101)
+
+
+def test_scale_factor(eds, z):
+    """Test the scale factor."""
+    a = scale_factor(z)
+
+    assert a.shape == z.shape
+    assert np.all(np.abs(a - eds.scale_factor(z)) <= RTOL * a)
+
+
+def test_T_cmb(eds, z):
+    """Test the CMB temperature."""
+    t = T_cmb(eds, z)
+
+    assert t.shape == z.shape
+    assert np.all(np.abs(t - eds.T_cmb(z)) <= RTOL * t)
+
+
+@pytest.mark.parametrize("func", ["scale_factor", "T_cmb"])
+def test_out(func, eds, z):
+    """Test that results are stored in ``out``, which may be the input."""
+    f = (lambda z, **kw: T_cmb(eds, z, **kw)) if func == "T_cmb" else scale_factor
+    expected = f(z)
+
+    out = np.empty_like(z)
+    assert f(z, out=out) is out
+    assert np.all(out == expected)
+
+    zcopy = np.asarray(z, copy=True)
+    assert f(zcopy, out=zcopy) is zcopy
+    assert np.all(zcopy == expected)
+
+
+@pytest.mark.parametrize("func", ["scale_factor", "T_cmb"])
+def test_dtype(func, eds, z):
+    """Test that the data type of the input is preserved."""
+    z32 = np.astype(z, np.float32)
+    result = T_cmb(eds, z32) if func == "T_cmb" else scale_factor(z32)
+
+    assert result.dtype == np.float32
+
+
+def test_float_input(eds):
+    """Test that Python floats give 0-d results."""
+    a = scale_factor(0.5)
+    t = T_cmb(eds, 0.5)
+
+    assert a.shape == t.shape == ()
+    assert float(a) == pytest.approx(float(eds.scale_factor(0.5)), rel=RTOL)
+    assert float(t) == pytest.approx(float(eds.T_cmb(0.5)), rel=RTOL)
+
+
+@pytest.mark.parametrize("func", ["scale_factor", "T_cmb"])
+def test_integer_input(func, eds):
+    """Test that integer redshifts give floating-point results."""
+    z = np.arange(5)
+    zf = np.astype(z, np.float64)
+    f = (lambda z, **kw: T_cmb(eds, z, **kw)) if func == "T_cmb" else scale_factor
+
+    result = f(z)
+    assert result.dtype == np.float64
+    assert np.all(result == f(zf))
+
+    out = np.empty_like(zf)
+    assert f(z, out=out) is out
+    assert np.all(out == result)
+
+    with pytest.raises(TypeError, match="floating-point"):
+        f(z, out=np.empty_like(z))
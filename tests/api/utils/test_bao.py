@@ -0,0 +1,119 @@
+"""Test ``cosmology.api.utils.bao_observables`` and ``sound_horizon_drag``."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from cosmology.api.compat import InstrumentedCosmology
+from cosmology.api.utils import BAOObservables, bao_observables, sound_horizon_drag
+
+from ..conftest import np, requires_array_api
+
+RTOL = 1e-12
+DH = 4000.0
+R_D = 147.0
+PLANCK_R_D = 147.09
+PLANCK_RTOL = 2e-3
+H0S = (60.0, 70.0, 80.0)
+
+pytestmark = requires_array_api
+
+################################################################################
+# TESTS
+################################################################################
+
+
+@pytest.fixture
+def z():
+    return np.asarray([0.1, 0.5, 1.0, 2.3])
+
+
+def _toy(omega_k):
+    """A toy cosmology with ``D_C = D_H ln(1 + z)`` and given curvature."""
+    return SimpleNamespace(
+        comoving_distance=lambda z: DH * np.log1p(np.asarray(z)),
+        H_over_H0=lambda z: 1 + np.asarray(z),
+        hubble_distance=np.asarray(DH),
+        Omega_k0=np.asarray(omega_k),
+    )
+
+
+def test_bao_observables(eds, z):
+    """Test the observables of a flat cosmology against its methods."""
+    cosmo = InstrumentedCosmology(eds)
+    obs = bao_observables(cosmo, z, r_d=R_D)
+
+    assert isinstance(obs, BAOObservables)
+    d_m = eds.transverse_comoving_distance(z)
+    d_h = eds.hubble_distance / eds.H_over_H0(z)
+    d_v = (z * d_m**2 * d_h) ** (1 / 3)
+    for result, expected in [(obs.D_M, d_m), (obs.D_H, d_h), (obs.D_V, d_v)]:
+        assert np.all(np.abs(result - expected) <= RTOL * expected)
+
+    assert np.all(obs.DM_over_rd == obs.D_M / R_D)
+    assert np.all(obs.DH_over_rd == obs.D_H / R_D)
+    assert np.all(obs.DV_over_rd == obs.D_V / R_D)
+
+    # A single comoving distance evaluation.
+    assert set(cosmo.profile) == {"comoving_distance", "H_over_H0"}
+    assert cosmo.profile["comoving_distance"].calls == 1
+
+
+@pytest.mark.parametrize(
+    ("omega_k", "sinn"), [(0.3, np.sinh), (-0.3, np.sin), (0.0, None)]
+)
+def test_curvature(omega_k, sinn, z):
+    """Test the transverse comoving distance of curved universes."""
+    obs = bao_observables(_toy(omega_k), z)
+
+    d_c = DH * np.log1p(z)
+    if sinn is None:
+        expected = d_c
+    else:
+        sqrt_ok = abs(omega_k) ** 0.5
+        expected = DH / sqrt_ok * sinn(sqrt_ok * d_c / DH)
+    assert np.all(np.abs(obs.D_M - expected) <= RTOL * expected)
+
+
+def test_no_rd(eds, z):
+    """Test that ratios need the sound horizon."""
+    obs = bao_observables(eds, z)
+
+    assert obs.r_d is None
+    with pytest.raises(ValueError, match="sound horizon"):
+        _ = obs.DV_over_rd
+
+
+def test_ensemble(eds_cls, z):
+    """Test that parameter samples are broadcast."""
+    ensemble = eds_cls(H0=np.reshape(np.asarray(H0S), (-1, 1)))
+    obs = bao_observables(ensemble, z)
+
+    assert obs.D_V.shape == (len(H0S), z.shape[0])
+    for i, h0 in enumerate(H0S):
+        expected = bao_observables(eds_cls(H0=np.asarray(h0)), z).D_V
+        assert np.all(np.abs(obs.D_V[i, :] - expected) <= RTOL * expected)
+
+
+def test_sound_horizon_drag():
+    """Test the sound horizon for a Planck 2018 cosmology."""
+    h = np.asarray(0.6736)
+    cosmo = SimpleNamespace(
+        h=h,
+        Omega_b0=0.02237 / h**2,
+        Omega_dm0=0.1200 / h**2,
+        m_nu=(np.asarray(0.06), np.asarray(0.0), np.asarray(0.0)),
+    )
+    r_d = sound_horizon_drag(cosmo)
+
+    assert float(r_d) == pytest.approx(PLANCK_R_D, rel=PLANCK_RTOL)
+
+    # Parameter samples are broadcast.
+    cosmo.h = np.asarray([0.6736, 0.7])
+    cosmo.Omega_b0 = 0.02237 / cosmo.h**2
+    cosmo.Omega_dm0 = 0.1200 / cosmo.h**2
+    r_d = sound_horizon_drag(cosmo)
+    assert r_d.shape == (2,)
+    assert np.all(np.abs(r_d - r_d[0]) <= RTOL * r_d)
@@ -0,0 +1,159 @@
+"""Test ``cosmology.api.utils.TableCache``."""
+
+from __future__ import annotations
+
+import dataclasses
+import os
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from cosmology.api.utils import TableCache
+
+SPEC = {"table": "comoving_distance", "zmax": 10.0, "size": 1000}
+
+
+def compute_tables():
+    z = np.linspace(0, SPEC["zmax"], SPEC["size"])
+    return {"z": z, "dc": 4000 * z / (1 + z)}
+
+
+def _get_or_compute_in_process(directory):
+    cache = TableCache(directory)
+    tables = cache.get_or_compute(SimpleNamespace(H0=70.0), SPEC, compute_tables)
+    return np.asarray(tables["dc"])
+
+
+################################################################################
+# TESTS
+################################################################################
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return TableCache(tmp_path / "cache")
+
+
+def test_put_get(cache, eds):
+    """Test storing and loading tables."""
+    assert cache.get(eds, SPEC) is None
+
+    expected = compute_tables()
+    cache.put(eds, SPEC, expected)
+    tables = cache.get(eds, SPEC)
+
+    assert set(tables) == {"z", "dc"}
+    for name, table in tables.items():
+        assert isinstance(table, np.memmap)
+        assert not table.flags.writeable
+        np.testing.assert_array_equal(table, expected[name])
+
+
+def test_get_or_compute(cache, eds):
+    """Test that tables are only computed if they are not in the cache."""
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return compute_tables()
+
+    first = cache.get_or_compute(eds, SPEC, compute)
+    second = cache.get_or_compute(eds, SPEC, compute)
+
+    assert len(calls) == 1
+    np.testing.assert_array_equal(first["dc"], second["dc"])
+
+    # A new cache on the same directory, e.g. in another process.
+    TableCache(cache.directory).get_or_compute(eds, SPEC, compute)
+    assert len(calls) == 1
+
+
+def test_key(cache, eds):
+    """Test that entries are keyed by cosmology parameters and spec."""
+    other_cosmo = dataclasses.replace(eds, H0=np.asarray(67.0))
+    other_spec = {**SPEC, "size": 100}
+
+    assert cache.key(eds, SPEC) == cache.key(eds, dict(reversed(SPEC.items())))
+    assert cache.key(eds, SPEC) != cache.key(other_cosmo, SPEC)
+    assert cache.key(eds, SPEC) != cache.key(eds, other_spec)
+
+    cache.put(eds, SPEC, compute_tables())
+    assert cache.get(other_cosmo, SPEC) is None
+    assert cache.get(eds, other_spec) is None
+
+
+def test_key_parameters(cache):
+    """Test that keys include all parameters and the type of the cosmology."""
+    lcdm = SimpleNamespace(H0=70.0, Omega_m0=0.3, w0=-1.0, wa=0.0, name="LCDM")
+    w0 = SimpleNamespace(**{**vars(lcdm), "w0": -0.9})
+    wa = SimpleNamespace(**{**vars(lcdm), "wa": 0.1})
+    renamed = SimpleNamespace(**{**vars(lcdm), "name": "other"})
+
+    @dataclasses.dataclass
+    class Other:
+        H0: float = 70.0
+        Omega_m0: float = 0.3
+        w0: float = -1.0
+        wa: float = 0.0
+
+    key = cache.key(lcdm, SPEC)
+    assert cache.key(w0, SPEC) != key
+    assert cache.key(wa, SPEC) != key
+    assert cache.key(Other(), SPEC) != key
+    assert cache.key(renamed, SPEC) == key
+
+
+def test_put_existing(cache, eds):
+    """Test that storing an existing entry keeps the existing tables."""
+    cache.put(eds, SPEC, compute_tables())
+    tables = cache.put(eds, SPEC, {"dc": np.zeros(3)})
+
+    assert set(tables) == {"z", "dc"}
+    assert [p.name for p in cache.directory.iterdir()] == [cache.key(eds, SPEC)]
+
+
+def test_eviction(tmp_path):
+    """Test that the least recently used entries are evicted."""
+    table = {"x": np.zeros(1000)}  # 8 kB
+    cache = TableCache(tmp_path, max_bytes=25_000)
+
+    specs = [{"i": i} for i in range(3)]
+    cosmo = SimpleNamespace(H0=70.0)
+    for i, spec in enumerate(specs):
+        cache.put(cosmo, spec, table)
+        path = cache.directory / cache.key(cosmo, spec)
+        os.utime(path, (i, i))  # deterministic access times
+
+    # Use the oldest entry, which makes the 2nd entry the least recently used.
+    assert cache.get(cosmo, specs[0]) is not None
+
+    cache.put(cosmo, {"i": 3}, table)
+    assert cache.get(cosmo, specs[1]) is None
+    for spec in (specs[0], specs[2], {"i": 3}):
+        assert cache.get(cosmo, spec) is not None
+
+
+def test_clear(cache, eds):
+    """Test removing all entries, but not the writes in progress."""
+    cache.put(eds, SPEC, compute_tables())
+    cache.clear()
+
+    assert cache.get(eds, SPEC) is None
+    assert list(cache.directory.iterdir()) == []
+
+    writing = cache.directory / ".tmp-writing"
+    writing.mkdir()
+    cache.clear()
+    assert list(cache.directory.iterdir()) == [writing]
+
+
+def test_concurrent_processes(tmp_path):
+    """Test that concurrent processes can safely fill the same entry."""
+    with ProcessPoolExecutor(4) as pool:
+        results = list(pool.map(_get_or_compute_in_process, [tmp_path] * 8))
+
+    for result in results:
+        np.testing.assert_array_equal(result, compute_tables()["dc"])
+    assert len(list(tmp_path.iterdir())) == 1
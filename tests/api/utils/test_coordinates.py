@@ -0,0 +1,117 @@
+"""Test ``cosmology.api.utils.sky_to_cartesian`` and ``cartesian_to_sky``."""
+
+from __future__ import annotations
+
+import math
+
+import numpy.testing as npt
+import pytest
+from numpy.random import default_rng
+
+from cosmology.api.compat import InstrumentedCosmology
+from cosmology.api.utils import cartesian_to_sky, sky_to_cartesian
+
+from ..conftest import np, requires_array_api
+
+RTOL = 1e-12
+RTOL_FLOAT32 = 1e-6
+SIZE = 1000
+CHUNK_SIZE = 128
+FULL_CIRCLE = 360
+
+pytestmark = requires_array_api
+
+################################################################################
+# TESTS
+################################################################################
+
+
+@pytest.fixture
+def sky():
+    rng = default_rng(42)
+    ra = np.asarray(rng.uniform(0, 360, SIZE))
+    dec = np.asin(np.asarray(rng.uniform(-1, 1, SIZE))) * (180 / math.pi)
+    z = np.asarray(rng.uniform(0.01, 3, SIZE))
+    return ra, dec, z
+
+
+def test_axes(eds):
+    """Test the directions of the Cartesian axes."""
+    ra = np.asarray([0.0, 90.0, 0.0, 180.0])
+    dec = np.asarray([0.0, 0.0, 90.0, -45.0])
+    z = np.asarray([1.0, 1.0, 1.0, 1.0])
+    d = float(eds.comoving_distance(1.0))
+
+    xyz = sky_to_cartesian(eds, ra, dec, z)
+
+    s = math.sqrt(0.5)
+    expected = d * np.asarray(
+        [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0], [-s, 0.0, -s]]
+    )
+    npt.assert_allclose(xyz, expected, rtol=RTOL, atol=RTOL * d)
+
+
+def test_round_trip(eds, sky):
+    """Test that the inverse recovers the sky coordinates and redshifts."""
+    ra, dec, z = sky
+
+    xyz = sky_to_cartesian(eds, ra, dec, z)
+    npt.assert_allclose(
+        np.sqrt(np.sum(xyz**2, axis=1)), eds.comoving_distance(z), rtol=RTOL
+    )
+
+    back = cartesian_to_sky(eds, xyz)
+    assert back.shape == (SIZE, 3)
+    assert np.all((back[:, 0] >= 0) & (back[:, 0] < FULL_CIRCLE))
+    npt.assert_allclose(back, np.stack([ra, dec, z], axis=1), rtol=RTOL)
+
+
+def test_chunks(eds, sky):
+    """Test that chunks give the same result with one call per chunk."""
+    ra, dec, z = sky
+    cosmo = InstrumentedCosmology(eds)
+
+    xyz = sky_to_cartesian(cosmo, ra, dec, z, chunk_size=CHUNK_SIZE)
+    npt.assert_array_equal(xyz, sky_to_cartesian(eds, ra, dec, z))
+    chunks = -(-SIZE // CHUNK_SIZE)
+    assert cosmo.profile["comoving_distance"].calls == chunks
+
+    back = cartesian_to_sky(cosmo, xyz, chunk_size=CHUNK_SIZE)
+    npt.assert_allclose(back, cartesian_to_sky(eds, xyz), rtol=RTOL)
+    assert cosmo.profile["inv_comoving_distance"].calls == chunks
+
+
+def test_output(eds, sky):
+    """Test the data type of the output and preallocated buffers."""
+    ra, dec, z = sky
+    expected = sky_to_cartesian(eds, ra, dec, z)
+
+    xyz = sky_to_cartesian(eds, ra, dec, z, dtype=np.float32)
+    assert xyz.dtype == np.float32
+    npt.assert_allclose(xyz, expected, rtol=RTOL_FLOAT32, atol=1e-3)
+
+    out = np.empty((SIZE, 3), dtype=np.float32)
+    assert sky_to_cartesian(eds, ra, dec, z, out=out) is out
+    npt.assert_array_equal(out, xyz)
+
+    out = np.empty((SIZE, 3))
+    assert cartesian_to_sky(eds, expected, out=out) is out
+    npt.assert_allclose(out[:, 2], z, rtol=RTOL)
+
+    # Integer coordinates give floating-point positions.
+    xyz = sky_to_cartesian(eds, *(np.ones(3, dtype=np.int64) for _ in range(3)))
+    assert xyz.dtype == np.float64
+
+
+def test_shapes(eds, sky):
+    """Test that mismatched shapes are rejected."""
+    ra, dec, z = sky
+
+    with pytest.raises(ValueError, match="same length"):
+        sky_to_cartesian(eds, ra, dec, z[:-1])
+    with pytest.raises(ValueError, match="same length"):
+        sky_to_cartesian(eds, ra[:, None], dec[:, None], z[:, None])
+    with pytest.raises(ValueError, match="output must have shape"):
+        sky_to_cartesian(eds, ra, dec, z, out=np.empty((SIZE, 2)))
+    with pytest.raises(ValueError, match=r"shape \(n, 3\)"):
+        cartesian_to_sky(eds, np.empty((SIZE, 2)))
@@ -0,0 +1,85 @@
+"""Test ``cosmology.api.utils.parameter_fingerprint``."""
+
+from __future__ import annotations
+
+import dataclasses
+from types import SimpleNamespace
+
+from cosmology.api.utils import FINGERPRINT_PARAMETERS, parameter_fingerprint
+
+from ..conftest import np
+
+################################################################################
+# TESTS
+################################################################################
+
+
+def test_fingerprint():
+    """Test that the fingerprint is a stable hexadecimal string."""
+    cosmo = SimpleNamespace(
+        H0=70.0,
+        Omega_m0=0.3,
+        Omega_b0=0.05,
+        Omega_de0=0.7,
+        Omega_k0=0.0,
+        T_cmb0=2.7255,
+        Neff=3.046,
+        m_nu=(0.06, 0.0, 0.0),
+    )
+    fingerprint = parameter_fingerprint(cosmo)
+
+    assert isinstance(fingerprint, str)
+    int(fingerprint, 16)  # is hexadecimal
+
+    # The fingerprint must not change between processes or versions, since it
+    # is used as the key of persistent caches.
+    assert fingerprint == "0e6a7bc0dea497c220025c421eea38af"
+
+
+def test_fingerprint_parameters(eds):
+    """Test that the fingerprint depends on the parameters, in any order."""
+    assert parameter_fingerprint(eds) == parameter_fingerprint(
+        eds, reversed(FINGERPRINT_PARAMETERS)
+    )
+    assert parameter_fingerprint(eds) != parameter_fingerprint(
+        eds, FINGERPRINT_PARAMETERS[:-1]
+    )
+
+
+def test_fingerprint_values(eds):
+    """Test that different parameter values give different fingerprints."""
+    other = dataclasses.replace(eds, H0=np.asarray(67.0))
+
+    assert parameter_fingerprint(other) != parameter_fingerprint(eds)
+    assert parameter_fingerprint(other) == parameter_fingerprint(
+        dataclasses.replace(eds, H0=np.asarray(67.0))
+    )
+
+
+def test_fingerprint_canonical():
+    """Test that equivalent values give the same fingerprint."""
+    cosmo = SimpleNamespace(H0=70, Omega_k0=0.0, m_nu=(0.06, 0.0, 0.0))
+
+    for equivalent in (
+        SimpleNamespace(H0=70.0, Omega_k0=-0.0, m_nu=(0.0, 0.06, 0.0)),
+        SimpleNamespace(
+            H0=np.asarray(70.0, dtype=np.float32),
+            Omega_k0=np.asarray(0.0),
+            m_nu=np.asarray([0.0, 0.0, 0.06]),
+        ),
+    ):
+        assert parameter_fingerprint(equivalent) == parameter_fingerprint(cosmo)
+
+    nan1 = SimpleNamespace(H0=float("nan"))
+    nan2 = SimpleNamespace(H0=-float("nan"))
+    assert parameter_fingerprint(nan1) == parameter_fingerprint(nan2)
+
+
+def test_fingerprint_missing():
+    """Test that missing parameters are distinct from any value."""
+    assert parameter_fingerprint(SimpleNamespace()) != parameter_fingerprint(
+        SimpleNamespace(m_nu=())
+    )
+    assert parameter_fingerprint(SimpleNamespace()) != parameter_fingerprint(
+        SimpleNamespace(H0=0.0)
+    )
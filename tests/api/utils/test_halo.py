@@ -0,0 +1,110 @@
+"""Test ``cosmology.api.utils.convert_halo_mass`` and ``spherical_overdensity``."""
+
+from __future__ import annotations
+
+import math
+
+import numpy.testing as npt
+import pytest
+from numpy.random import default_rng
+
+from cosmology.api.compat import InstrumentedCosmology
+from cosmology.api.utils import HaloMass, convert_halo_mass, spherical_overdensity
+
+from ..conftest import np, requires_array_api
+
+RTOL = 1e-12
+DELTA_VIR_EDS = 18 * math.pi**2
+
+pytestmark = requires_array_api
+
+################################################################################
+# TESTS
+################################################################################
+
+
+@pytest.fixture
+def halos():
+    rng = default_rng(42)
+    m = np.asarray(10 ** rng.uniform(10, 15, 1000))
+    z = np.asarray(rng.uniform(0, 3, 1000))
+    c = np.asarray(rng.uniform(1, 40, 1000))
+    return m, z, c
+
+
+def _nfw_mass(x):
+    return math.log1p(x) - x / (1 + x)
+
+
+def _convert(m, c, ratio):
+    """Convert one halo by bisection, with the ratio of the densities."""
+    g_c = _nfw_mass(c) / c**3
+    lo, hi = 1e-3, 1e3
+    for _ in range(200):
+        mid = math.sqrt(lo * hi)
+        lo, hi = (mid, hi) if _nfw_mass(mid) / mid**3 > g_c * ratio else (lo, mid)
+    x = math.sqrt(lo * hi)
+    return m * _nfw_mass(x) / _nfw_mass(c), x
+
+
+def test_spherical_overdensity(eds):
+    """Test the mass definitions for Einstein--de Sitter."""
+    z = np.asarray([0.0, 1.0])
+    rho_c = eds.critical_density(z)
+
+    npt.assert_allclose(spherical_overdensity(eds, z, "200c"), 200 * rho_c, rtol=RTOL)
+    npt.assert_allclose(spherical_overdensity(eds, z, "500c"), 500 * rho_c, rtol=RTOL)
+    npt.assert_allclose(spherical_overdensity(eds, z, "200m"), 200 * rho_c, rtol=RTOL)
+    npt.assert_allclose(spherical_overdensity(eds, z, "2.5m"), 2.5 * rho_c, rtol=RTOL)
+    npt.assert_allclose(
+        spherical_overdensity(eds, z, "vir"), DELTA_VIR_EDS * rho_c, rtol=RTOL
+    )
+
+    with pytest.raises(ValueError, match="unknown mass definition"):
+        spherical_overdensity(eds, z, "200x")
+
+
+def test_convert(eds, halos):
+    """Test the conversion against a root-find for each halo."""
+    m, z, c = halos
+    result = convert_halo_mass(eds, m, z, c, mdef_in="200c", mdef_out="500c")
+
+    assert isinstance(result, HaloMass)
+    for i in range(0, m.size, 100):
+        m_i, c_i = _convert(float(m[i]), float(c[i]), 500 / 200)
+        assert abs(result.mass[i] - m_i) <= 1e-10 * m_i
+        assert abs(result.concentration[i] - c_i) <= 1e-10 * c_i
+
+    rho = spherical_overdensity(eds, z, "500c")
+    expected_radius = (3 * result.mass / (4 * np.pi * rho)) ** (1 / 3)
+    npt.assert_allclose(result.radius, expected_radius, rtol=RTOL)
+
+
+def test_round_trip(eds, halos):
+    """Test that converting back recovers the masses and concentrations."""
+    m, z, c = halos
+    vir = convert_halo_mass(eds, m, z, c, mdef_in="200c", mdef_out="vir")
+    back = convert_halo_mass(
+        eds, vir.mass, z, vir.concentration, mdef_in="vir", mdef_out="200c"
+    )
+
+    npt.assert_allclose(back.mass, m, rtol=RTOL)
+    npt.assert_allclose(back.concentration, c, rtol=RTOL)
+    # Lower overdensities enclose more mass.
+    assert np.all(vir.mass > m)
+
+
+def test_broadcast(eds):
+    """Test that masses, redshifts, and concentrations broadcast."""
+    cosmo = InstrumentedCosmology(eds, methods=["critical_density", "Omega_m"])
+    m = 10 ** np.linspace(12.0, 15.0, 4)
+    z = np.asarray([0.0, 1.0, 2.0])
+    result = convert_halo_mass(
+        cosmo, m[:, None], z[None, :], 5.0, mdef_in="200c", mdef_out="vir"
+    )
+
+    assert result.mass.shape == result.radius.shape == (4, 3)
+    assert result.concentration.shape == (4, 3)
+    # One call per definition, and one for the virial overdensity.
+    assert cosmo.profile["critical_density"].calls == 2  # noqa: PLR2004
+    assert cosmo.profile["Omega_m"].calls == 1
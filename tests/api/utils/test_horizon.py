@@ -0,0 +1,159 @@
+"""Test ``cosmology.api.utils.HorizonTable`` and ``horizon_table``."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from types import SimpleNamespace
+
+import pytest
+
+from cosmology.api import HasConformalTime, HasSoundHorizon
+from cosmology.api.compat import InstrumentedCosmology
+from cosmology.api.utils import HorizonTable, horizon_table, parameter_fingerprint
+
+from ..conftest import np, requires_array_api
+
+RTOL = 1e-8
+EARLY_RTOL = 1e-3
+TH = 10.0
+DH = 3000.0
+OMEGA_B = 0.05
+OMEGA_R = 8e-5
+R0 = 1000.0
+
+pytestmark = requires_array_api
+
+################################################################################
+# TESTS
+################################################################################
+
+
+@pytest.fixture
+def z():
+    return np.asarray([0.0, 0.5, 10.0, 1089.0, 1e5, 1e12])
+
+
+def _toy(h_over_h0, *, omega_gamma=OMEGA_B * 3 / (4 * R0)):
+    """A toy cosmology with the given Hubble parameter."""
+    return SimpleNamespace(
+        H_over_H0=h_over_h0,
+        hubble_time=np.asarray(TH),
+        hubble_distance=np.asarray(DH),
+        Omega_b0=np.asarray(OMEGA_B),
+        Omega_gamma0=np.asarray(omega_gamma),
+    )
+
+
+def test_eds(eds, z):
+    """Test the conformal time of Einstein--de Sitter, without photons."""
+    table = HorizonTable(eds)
+
+    assert isinstance(table, HasConformalTime)
+    assert isinstance(table, HasSoundHorizon)
+
+    expected = 2 * eds.hubble_time / np.sqrt(1 + z)
+    assert np.all(np.abs(table.conformal_time(z) - expected) <= RTOL * expected)
+    # Without photons, there is no sound.
+    assert np.all(table.sound_horizon(z) == 0)
+
+
+def test_baryon_loading(z):
+    r"""Test the sound horizon with baryon loading.
+
+    For :math:`E = a^{-3/2}` and :math:`R = R_0 a`, the sound horizon is
+    :math:`r_s = 2 D_H \sinh^{-1}(\sqrt{R_0 a}) / \sqrt{3 R_0}`.
+    """
+    table = HorizonTable(_toy(lambda z: (1 + z) ** 1.5))
+
+    a = 1 / (1 + z)
+    expected = 2 * DH * np.asinh(np.sqrt(R0 * a)) / math.sqrt(3 * R0)
+    result = table.sound_horizon(z)
+    # Within the grid, and in the radiation era before it.
+    assert np.all(np.abs(result - expected)[:-1] <= RTOL * expected[:-1])
+    assert np.abs(result[-1] - expected[-1]) <= EARLY_RTOL * expected[-1]
+
+
+def test_radiation(z):
+    r"""Test the conformal time with radiation and matter.
+
+    For :math:`E^2 = \Omega_r a^{-4} + \Omega_m a^{-3}`, the conformal time is
+    :math:`\eta = 2 t_H (\sqrt{\Omega_r + \Omega_m a} - \sqrt{\Omega_r}) /
+    \Omega_m`.
+    """
+    omega_m = 1 - OMEGA_R
+    table = HorizonTable(
+        _toy(lambda z: np.sqrt(OMEGA_R * (1 + z) ** 4 + omega_m * (1 + z) ** 3))
+    )
+
+    a = 1 / (1 + z)
+    expected = 2 * TH * (np.sqrt(OMEGA_R + omega_m * a) - math.sqrt(OMEGA_R)) / omega_m
+    result = table.conformal_time(z)
+    # Within the grid, and in the radiation era before it.
+    assert np.all(np.abs(result - expected)[:-1] <= RTOL * expected[:-1])
+    assert np.abs(result[-1] - expected[-1]) <= EARLY_RTOL * expected[-1]
+
+
+def test_lookup(eds):
+    """Test that lookups keep the shape and dtype and do not call the cosmology."""
+    cosmo = InstrumentedCosmology(eds)
+    table = HorizonTable(cosmo)
+    cosmo.reset_profile()
+
+    z = np.reshape(np.linspace(0, 100, 12, dtype=np.float32), (3, 4))
+    result = table.conformal_time(z)
+    assert result.shape == z.shape
+    assert result.dtype == np.float32
+    assert table.conformal_time(1).dtype == np.float64
+    assert table.conformal_time(0.0) == table.conformal_time(np.asarray(0.0))
+    assert not cosmo.profile
+
+
+def test_accelerating():
+    """Test that an accelerating universe at ``a_min`` is an error."""
+    with pytest.raises(ValueError, match="not decelerating"):
+        HorizonTable(_toy(np.ones_like))
+
+
+def test_horizon_table(eds_cls):
+    """Test that tables are reused for the same cosmology or key."""
+    cosmo = eds_cls()
+    table = horizon_table(cosmo)
+
+    assert horizon_table(cosmo) is table
+    assert horizon_table(eds_cls()) is not table
+    assert horizon_table(cosmo, size=512) is not table
+
+    key = parameter_fingerprint(cosmo)
+    table = horizon_table(cosmo, key=key)
+    assert horizon_table(eds_cls(), key=key) is table
+
+
+def test_horizon_table_parameters():
+    """Test that tables are not shared by cosmologies with other parameters."""
+    early = horizon_table(_toy(lambda z: (1 + z) ** 1.5))
+    late = horizon_table(_toy(lambda z: (1 + z) ** 1.5, omega_gamma=1e-4))
+
+    assert late is not early
+    assert late.sound_horizon(0.0) != early.sound_horizon(0.0)
+
+
+def test_horizon_table_hashable():
+    """Test that tables are shared by equal hashable cosmologies."""
+
+    @dataclass(frozen=True)
+    class Toy:
+        n: float
+
+        hubble_time = property(lambda _: np.asarray(TH))
+        hubble_distance = property(lambda _: np.asarray(DH))
+        Omega_b0 = property(lambda _: np.asarray(OMEGA_B))
+        Omega_gamma0 = property(lambda _: np.asarray(OMEGA_B * 3 / (4 * R0)))
+
+        def H_over_H0(self, z):
+            return (1 + z) ** self.n
+
+    table = horizon_table(Toy(1.5))
+
+    assert horizon_table(Toy(1.5)) is table
+    assert horizon_table(Toy(1.6)) is not table
@@ -0,0 +1,174 @@
+"""Test ``cosmology.api.utils.comoving_distance`` and ``lookback_time``."""
+
+from __future__ import annotations
+
+import numpy.testing as npt
+import pytest
+from numpy.polynomial.legendre import leggauss
+
+from cosmology.api.compat import InstrumentedCosmology
+from cosmology.api.utils import comoving_distance, lookback_time
+from cosmology.api.utils._integrate import _gauss_legendre
+
+from ..conftest import np, requires_array_api
+
+RTOL = 1e-10
+LOOSE_RTOL = 1e-4
+FLOAT32_RTOL = 1e-6
+
+pytestmark = requires_array_api
+
+################################################################################
+# TESTS
+################################################################################
+
+
+@pytest.fixture
+def z():
+    return np.asarray([0.0, 0.01, 0.5, 1.0, 3.0, 10.0, 1100.0])
+
+
+@pytest.mark.parametrize("func", [comoving_distance, lookback_time])
+def test_integrals(func, eds, z):
+    """Test the integrals against the analytic Einstein--de Sitter results."""
+    expected = getattr(eds, func.__name__)(z)
+    result = func(eds, z, rtol=RTOL)
+
+    assert result.shape == z.shape
+    assert result.dtype == z.dtype
+    assert np.all(np.abs(result - expected) <= RTOL * np.abs(expected))
+
+
+@pytest.mark.parametrize("cumulative", [False, True])
+@pytest.mark.parametrize("func", [comoving_distance, lookback_time])
+def test_error_estimate(func, cumulative, eds, z):
+    """Test that the error estimate bounds the actual error."""
+    expected = getattr(eds, func.__name__)(z)
+    result, error = func(
+        eds, z, rtol=LOOSE_RTOL, cumulative=cumulative, return_error=True
+    )
+
+    assert error.shape == z.shape
+    assert np.all(error <= LOOSE_RTOL * np.abs(result))
+    # Up to rounding, the actual error is bounded by the estimate.
+    assert np.all(np.abs(result - expected) <= error + RTOL * np.abs(expected))
+
+
+def test_float_input(eds):
+    """Test that Python floats give 0-d results."""
+    result = comoving_distance(eds, 0.5)
+
+    assert result.shape == ()
+    assert result.dtype == np.float64
+    assert float(result) == pytest.approx(float(eds.comoving_distance(0.5)))
+
+
+@pytest.mark.parametrize("z", [0.0, 0.5, 3, 1100.0])
+@pytest.mark.parametrize("func", [comoving_distance, lookback_time])
+def test_scalar_fast_path(func, eds, z):
+    """Test that Python scalars give the results of 0-d arrays."""
+    cosmos = [InstrumentedCosmology(eds, methods=["H_over_H0"]) for _ in range(2)]
+    result, error = func(cosmos[0], z, rtol=RTOL, return_error=True)
+    expected = func(cosmos[1], np.asarray(float(z)), rtol=RTOL)
+
+    assert result.shape == error.shape == ()
+    assert float(result) == pytest.approx(float(expected), rel=1e-14, abs=0.0)
+    assert float(error) <= RTOL * float(result)
+    # The same nodes, with the same accuracy.
+    profiles = [c.profile["H_over_H0"] for c in cosmos]
+    assert profiles[0].elements == profiles[1].elements
+
+    with pytest.warns(RuntimeWarning, match="with 4 nodes"):
+        func(eds, z + 1, rtol=0.0, max_nodes=4)
+
+
+def test_float32(eds, z):
+    """Test that the data type of the input is preserved."""
+    z32 = np.astype(z, np.float32)
+    result = comoving_distance(eds, z32, rtol=FLOAT32_RTOL)
+
+    assert result.dtype == np.float32
+    expected = np.astype(eds.comoving_distance(z), np.float32)
+    assert np.all(np.abs(result - expected) <= 10 * FLOAT32_RTOL * expected)
+
+
+def test_not_converged(eds, z):
+    """Test that a warning is emitted if the tolerance is not reached."""
+    with pytest.warns(RuntimeWarning, match="relative tolerance"):
+        comoving_distance(eds, z, rtol=0.0, max_nodes=16)
+
+
+@pytest.mark.parametrize("func", [comoving_distance, lookback_time])
+def test_cumulative(func, eds):
+    """Test that cumulative integration of sorted input is cheaper."""
+    z = np.linspace(0.0, 5.0, 1001)
+    expected = getattr(eds, func.__name__)(z)
+
+    results = {}
+    elements = {}
+    for cumulative in (False, True):
+        cosmo = InstrumentedCosmology(eds)
+        results[cumulative] = func(cosmo, z, rtol=RTOL, cumulative=cumulative)
+        elements[cumulative] = cosmo.profile["H_over_H0"].elements
+
+    for result in results.values():
+        assert np.all(np.abs(result - expected) <= RTOL * np.abs(expected))
+    assert elements[True] < elements[False]
+
+
+def test_cumulative_detect(eds):
+    """Test that sorted one-dimensional input is detected."""
+    z = np.linspace(0.0, 5.0, 101)
+    sorted_cosmo = InstrumentedCosmology(eds)
+    comoving_distance(sorted_cosmo, z, rtol=RTOL)
+
+    reversed_cosmo = InstrumentedCosmology(eds)
+    result = comoving_distance(reversed_cosmo, z[::-1], rtol=RTOL)
+
+    expected = eds.comoving_distance(z[::-1])
+    assert np.all(np.abs(result - expected) <= RTOL * np.abs(expected))
+    elements = [c.profile["H_over_H0"].elements for c in (sorted_cosmo, reversed_cosmo)]
+    assert elements[0] < elements[1]
+
+
+def test_cumulative_not_1d(eds, z):
+    """Test that cumulative integration requires a one-dimensional array."""
+    with pytest.raises(ValueError, match="one-dimensional"):
+        comoving_distance(eds, np.reshape(z, (1, -1)), cumulative=True)
+
+
+def test_max_nodes(eds, z):
+    """Test that the number of nodes never exceeds the maximum."""
+    cosmo = InstrumentedCosmology(eds)
+    with pytest.warns(RuntimeWarning, match="with 4 nodes"):
+        comoving_distance(cosmo, z, rtol=0.0, max_nodes=4)
+    # Two and then four nodes per redshift.
+    assert cosmo.profile["H_over_H0"].elements == 6 * z.shape[0]
+
+    with pytest.raises(ValueError, match="max_nodes"):
+        comoving_distance(eds, z, max_nodes=1)
+
+
+@pytest.mark.parametrize("func", [comoving_distance, lookback_time])
+def test_chunk_size(func, eds):
+    """Test that redshifts are integrated in chunks of bounded size."""
+    z = np.reshape(np.linspace(3.0, 0.0, 12), (3, 4))
+    cosmo = InstrumentedCosmology(eds)
+    got = func(cosmo, z, chunk_size=5, max_nodes=64)
+    # At most five redshifts per call, but the same nodes per redshift.
+    assert cosmo.profile["H_over_H0"].max_elements <= 5 * 64
+    npt.assert_allclose(np.asarray(got), np.asarray(func(eds, z)), rtol=1e-14)
+    assert got.shape == z.shape
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 8, 100])
+def test_gauss_legendre(n):
+    """Test the quadrature nodes against NumPy and on polynomials."""
+    x, w = _gauss_legendre(np, n)
+    x_ref, w_ref = leggauss(n)
+    npt.assert_allclose(np.asarray(x), (x_ref + 1) / 2, rtol=0, atol=1e-15)
+    # The weights of NumPy lose some accuracy for many nodes.
+    npt.assert_allclose(np.asarray(w), w_ref / 2, rtol=1e-10)
+    # Exact for polynomials up to degree 2n - 1.
+    for k in range(2 * n):
+        assert float(np.sum(w * x**k)) == pytest.approx(1 / (k + 1), rel=1e-13)
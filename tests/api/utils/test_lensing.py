@@ -0,0 +1,161 @@
+"""Test ``cosmology.api.utils.critical_surface_density``."""
+
+from __future__ import annotations
+
+import math
+from types import SimpleNamespace
+
+import pytest
+
+from cosmology.api.utils import (
+    LensDistances,
+    critical_surface_density,
+    critical_surface_density_blocks,
+    lens_distances,
+    time_delay_distance,
+)
+
+from ..conftest import C_KMS, G_PC, np, requires_array_api
+
+RTOL = 1e-12
+DH = 4000.0
+NLENS = 50
+NSOURCE = 70
+MAX_ELEMENTS = 1000
+NSAMPLES = 20
+H0S = (60.0, 70.0, 80.0)
+
+pytestmark = requires_array_api
+
+################################################################################
+# TESTS
+################################################################################
+
+
+@pytest.fixture(scope="module")
+def milne():
+    """The empty, open Milne universe, with analytic distances."""
+
+    def dm(z1, z2=None, /):
+        z1, z2 = (0.0 * np.asarray(z1), z1) if z2 is None else (z1, z2)
+        return DH * np.sinh(np.log((1 + np.asarray(z2)) / (1 + np.asarray(z1))))
+
+    def da(z1, z2=None, /):
+        return dm(z1, z2) / (1 + np.asarray(z1 if z2 is None else z2))
+
+    constants = SimpleNamespace(G=G_PC, c=C_KMS)
+    return SimpleNamespace(
+        __cosmology_namespace__=SimpleNamespace(constants=constants),
+        transverse_comoving_distance=dm,
+        angular_diameter_distance=da,
+        Omega_k0=np.asarray(1.0),
+        hubble_distance=np.asarray(DH),
+    )
+
+
+@pytest.fixture(scope="module")
+def z_lens():
+    return np.linspace(0.0, 1.0, NLENS)
+
+
+@pytest.fixture(scope="module")
+def z_source():
+    return np.linspace(0.0, 3.0, NSOURCE)
+
+
+def test_critical_surface_density(eds):
+    """Test the critical surface density of a single pair."""
+    sigma = critical_surface_density(eds, 0.3, 1.0)
+
+    d_l = eds.angular_diameter_distance(0.3)
+    d_s = eds.angular_diameter_distance(1.0)
+    d_ls = eds.angular_diameter_distance(0.3, 1.0)
+    expected = C_KMS**2 / (4 * math.pi * G_PC) * d_s / (d_l * d_ls) / 1e6
+    assert float(sigma) == pytest.approx(float(expected), rel=RTOL)
+
+    inv = critical_surface_density(eds, 0.3, 1.0, inverse=True)
+    assert float(inv) == pytest.approx(1 / float(expected), rel=RTOL)
+
+
+def test_not_behind(eds):
+    """Test sources that are not behind the lens."""
+    z_source = np.asarray([0.0, 0.3, 0.5, 1.0])
+
+    sigma = critical_surface_density(eds, 0.5, z_source)
+    assert np.all(np.isinf(sigma[:3]))
+    assert np.isfinite(sigma[3])
+
+    inv = critical_surface_density(eds, 0.5, z_source, inverse=True)
+    assert np.all(inv[:3] == 0)
+    assert inv[3] > 0
+
+
+@pytest.mark.parametrize("inverse", [False, True])
+@pytest.mark.parametrize("cosmo", ["eds", "milne"])
+def test_blocks(cosmo, inverse, z_lens, z_source, request):
+    """Test that the blocks agree with the broadcast computation."""
+    cosmo = request.getfixturevalue(cosmo)
+    expected = critical_surface_density(
+        cosmo, z_lens[:, None], z_source[None, :], inverse=inverse
+    )
+
+    blocks = list(
+        critical_surface_density_blocks(
+            cosmo, z_lens, z_source, inverse=inverse, max_elements=MAX_ELEMENTS
+        )
+    )
+
+    starts = [start for start, _, _ in blocks]
+    stops = [stop for _, stop, _ in blocks]
+    assert starts == [0, *stops[:-1]]
+    assert stops[-1] == NLENS
+    for start, stop, block in blocks:
+        assert block.shape == (stop - start, NSOURCE)
+        assert block.size <= MAX_ELEMENTS
+
+    result = np.concat([block for _, _, block in blocks])
+    finite = np.isfinite(expected)
+    assert np.all(np.isfinite(result) == finite)
+    assert np.all(
+        np.abs(result[finite] - expected[finite]) <= 1e-10 * np.abs(expected[finite])
+    )
+
+
+def test_lens_distances(eds):
+    """Test that the distances are broadcast."""
+    z_lens = np.asarray([[0.2], [0.5]])
+    z_source = np.asarray([0.3, 1.0, 2.0])
+    dist = lens_distances(eds, z_lens, z_source)
+
+    assert isinstance(dist, LensDistances)
+    assert dist.d_l.shape == z_lens.shape
+    assert dist.d_s.shape == z_source.shape
+    assert dist.d_ls.shape == dist.behind.shape == (2, 3)
+    assert np.all(dist.behind == (z_source > z_lens))
+
+
+def test_time_delay_distance(eds):
+    """Test the time-delay distance of a single lens."""
+    d_dt = time_delay_distance(eds, 0.5, 2.0)
+
+    d_l = eds.angular_diameter_distance(0.5)
+    d_s = eds.angular_diameter_distance(2.0)
+    d_ls = eds.angular_diameter_distance(0.5, 2.0)
+    expected = 1.5 * d_l * d_s / d_ls
+    assert float(d_dt) == pytest.approx(float(expected), rel=RTOL)
+
+    assert np.isnan(time_delay_distance(eds, 2.0, 0.5))
+
+
+def test_time_delay_distance_ensemble(eds_cls):
+    """Test broadcasting over redshift samples and a cosmology ensemble."""
+    z_lens = np.reshape(np.linspace(0.2, 0.8, NSAMPLES), (NSAMPLES, 1))
+    z_source = np.reshape(np.linspace(3.0, 1.0, NSAMPLES), (NSAMPLES, 1))
+
+    ensemble = eds_cls(H0=np.asarray(H0S))
+    d_dt = time_delay_distance(ensemble, z_lens, z_source)
+
+    assert d_dt.shape == (NSAMPLES, len(H0S))
+    for i, h0 in enumerate(H0S):
+        expected = time_delay_distance(eds_cls(H0=np.asarray(h0)), z_lens, z_source)
+        assert np.all(np.abs(d_dt[:, i] - expected[:, 0]) <= RTOL * expected[:, 0])
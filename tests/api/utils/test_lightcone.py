@@ -0,0 +1,105 @@
+"""Test ``cosmology.api.utils.lightcone_shells``."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from cosmology.api.utils import LightconeShells, lightcone_shells
+
+from ..conftest import np, requires_array_api
+
+NSHELLS = 1000
+ZMIN = 0.1
+ZMAX = 3.0
+RTOL = 1e-9
+DH = 1000.0
+
+pytestmark = requires_array_api
+
+################################################################################
+# TESTS
+################################################################################
+
+
+@pytest.fixture(scope="module")
+def toy():
+    """A toy cosmology whose volume is not the cube of the distance."""
+
+    def volume(z1, z2=None, /):
+        z1, z2 = (0.0 * z1, z1) if z2 is None else (z1, z2)
+        return (DH * np.asarray(z2)) ** 2 - (DH * np.asarray(z1)) ** 2
+
+    return SimpleNamespace(
+        comoving_distance=lambda z: DH * np.asarray(z, dtype=np.float64),
+        inv_comoving_distance=lambda d: np.asarray(d) / DH,
+        comoving_volume=volume,
+    )
+
+
+def test_distance_spacing(eds):
+    """Test shells of equal comoving thickness."""
+    shells = lightcone_shells(eds, ZMAX, NSHELLS, zmin=ZMIN)
+
+    assert isinstance(shells, LightconeShells)
+    assert shells.z_edges.shape == (NSHELLS + 1,)
+    assert shells.distance_edges.shape == (NSHELLS + 1,)
+    assert shells.volumes.shape == (NSHELLS,)
+    assert shells.z_mid.shape == (NSHELLS,)
+
+    assert float(shells.z_edges[0]) == ZMIN
+    assert float(shells.z_edges[-1]) == ZMAX
+    assert np.all(shells.z_edges[:-1] < shells.z_mid)
+    assert np.all(shells.z_mid < shells.z_edges[1:])
+
+    width = shells.distance_edges[1:] - shells.distance_edges[:-1]
+    assert np.all(np.abs(width - width[0]) <= RTOL * width[0])
+    assert np.all(
+        np.abs(eds.comoving_distance(shells.z_edges) - shells.distance_edges)
+        <= RTOL * shells.distance_edges
+    )
+
+    total = eds.comoving_volume(ZMIN, ZMAX)
+    assert abs(float(np.sum(shells.volumes) - total)) <= RTOL * float(total)
+
+
+def test_volume_spacing(eds):
+    """Test shells of equal comoving volume."""
+    shells = lightcone_shells(eds, ZMAX, NSHELLS, zmin=ZMIN, spacing="volume")
+
+    v = shells.volumes
+    assert np.all(np.abs(v - v[0]) <= RTOL * v[0])
+    assert float(shells.z_edges[-1]) == ZMAX
+
+
+def test_volume_spacing_bisection(toy):
+    """Test that volumes are matched if the flat-space guess is wrong."""
+    shells = lightcone_shells(toy, ZMAX, NSHELLS, spacing="volume", rtol=RTOL)
+
+    v = shells.volumes
+    assert np.all(np.abs(v - v[0]) <= 10 * RTOL * np.max(v))
+    expected = ZMAX * np.sqrt(np.linspace(0.0, 1.0, NSHELLS + 1))
+    assert np.all(np.abs(shells.z_edges - expected) <= 10 * RTOL * ZMAX)
+    assert np.all(shells.distance_edges == DH * shells.z_edges)
+
+
+def test_volume_spacing_not_converged(toy):
+    """Test that a warning is emitted if bisection does not converge."""
+    with pytest.warns(RuntimeWarning, match="100 bisections"):
+        shells = lightcone_shells(toy, ZMAX, NSHELLS, spacing="volume", rtol=0.0)
+    assert np.all(shells.z_edges[:-1] < shells.z_edges[1:])
+
+
+@pytest.mark.parametrize(
+    ("args", "kwargs", "match"),
+    [
+        ((ZMAX, NSHELLS), {"spacing": "redshift"}, "spacing"),
+        ((ZMAX, 0), {}, "positive"),
+        ((ZMIN, NSHELLS), {"zmin": ZMAX}, "larger"),
+    ],
+)
+def test_invalid(eds, args, kwargs, match):
+    """Test that invalid arguments raise errors."""
+    with pytest.raises(ValueError, match=match):
+        lightcone_shells(eds, *args, **kwargs)
@@ -0,0 +1,102 @@
+"""Test ``cosmology.api.utils.LimberIntegrator``."""
+
+from __future__ import annotations
+
+import math
+
+import numpy.testing as npt
+import pytest
+
+from cosmology.api.compat import InstrumentedCosmology
+from cosmology.api.utils import LimberIntegrator
+
+from ..conftest import np, requires_array_api
+
+RTOL = 1e-4
+AMPLITUDE = 1e4
+MEANS = (0.5, 1.0, 1.5)
+WIDTH = 0.1
+
+pytestmark = requires_array_api
+
+################################################################################
+# TESTS
+################################################################################
+
+
+@pytest.fixture
+def z():
+    return np.linspace(0.01, 3.0, 2000)
+
+
+def _nz(z):
+    return np.stack([np.exp(-(((z - mean) / WIDTH) ** 2) / 2) for mean in MEANS])
+
+
+def test_grid(eds, z):
+    """Test that distances and the Hubble parameter are computed once."""
+    cosmo = InstrumentedCosmology(eds)
+    limber = LimberIntegrator(cosmo, z)
+    limber.galaxy_kernel(_nz(z))
+    limber.lensing_kernel(_nz(z))
+    limber.angular_power(np.asarray([10.0]), _nz(z), lambda k, _: k)
+
+    assert cosmo.profile["comoving_distance"].calls == 1
+    assert cosmo.profile["H_over_H0"].calls == 1
+
+    with pytest.raises(ValueError, match="positive"):
+        LimberIntegrator(eds, np.linspace(0.0, 1.0, 10))
+
+
+def test_galaxy_clustering(eds, z):
+    """Test the angular power of a constant power spectrum."""
+    limber = LimberIntegrator(eds, z)
+    kernels = limber.galaxy_kernel(_nz(z))
+    ell = np.asarray([2.0, 100.0, 1000.0])
+    cl = limber.angular_power(ell, kernels, lambda k, _: AMPLITUDE + 0 * k)
+
+    assert cl.shape == (len(MEANS) * (len(MEANS) + 1) // 2, ell.size)
+
+    # C = A / D_H int n^2 E / chi^2 dz for normalised n.
+    zf = np.linspace(0.01, 3.0, 200_001)
+    dzf = zf[1:] - zf[:-1]
+    nf = _nz(zf)[0, :]
+    nf /= np.sum((nf[1:] + nf[:-1]) / 2 * dzf)
+    f = nf**2 * eds.H_over_H0(zf) / eds.comoving_distance(zf) ** 2
+    expected = AMPLITUDE / eds.hubble_distance * np.sum((f[1:] + f[:-1]) / 2 * dzf)
+    assert np.all(np.abs(cl[0, :] - expected) <= RTOL * expected)
+
+
+def test_lensing_kernel(eds, z):
+    """Test the lensing kernel against the integral for each distance."""
+    limber = LimberIntegrator(eds, z)
+    nz = _nz(z)
+    kernels = limber.lensing_kernel(nz)
+    chi = eds.comoving_distance(z)
+
+    dz = z[1:] - z[:-1]
+    n = nz[-1, :] / np.sum((nz[-1, 1:] + nz[-1, :-1]) / 2 * dz)
+    for a in range(0, z.size, 250):
+        f = n[a:] * (1 - chi[a] / chi[a:])
+        integral = np.sum((f[1:] + f[:-1]) / 2 * dz[a:])
+        expected = 1.5 / eds.hubble_distance**2 * chi[a] * (1 + z[a]) * integral
+        assert abs(kernels[-1, a] - expected) <= 1e-12 * abs(expected)
+
+
+def test_pairs(eds, z):
+    """Test that all multipoles and pairs are computed in one power call."""
+    calls = []
+
+    def power(k, z):
+        calls.append((k.shape, z.shape))
+        return AMPLITUDE / (1 + k)
+
+    limber = LimberIntegrator(eds, z)
+    kernels = limber.galaxy_kernel(_nz(z))
+    ell = np.exp(np.linspace(math.log(2.0), math.log(3000.0), 50))
+    cl = limber.angular_power(ell, kernels, power)
+    assert calls == [((ell.size, z.size), (1, z.size))]
+
+    cross = limber.angular_power(ell, kernels, power, pairs=[(1, 0), (2, 2)])
+    npt.assert_allclose(cross[0, :], cl[1, :], rtol=1e-14)
+    npt.assert_allclose(cross[1, :], cl[-1, :], rtol=1e-14)
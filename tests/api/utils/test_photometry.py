@@ -0,0 +1,58 @@
+"""Test ``cosmology.api.utils.distance_modulus``."""
+
+from __future__ import annotations
+
+import pytest
+
+from cosmology.api.utils import distance_modulus
+
+from ..conftest import np, requires_array_api
+
+RTOL = 1e-12
+FLOAT32_RTOL = 1e-6
+
+pytestmark = requires_array_api
+
+################################################################################
+# TESTS
+################################################################################
+
+
+@pytest.fixture
+def z():
+    return np.linspace(0.01, 5.0, 100)
+
+
+def test_distance_modulus(eds, z):
+    """Test the distance modulus against the luminosity distance."""
+    mu = distance_modulus(eds, z)
+
+    expected = 5 * np.log10(eds.luminosity_distance(z) * 1e6 / 10)
+    assert mu.shape == z.shape
+    assert np.all(np.abs(mu - expected) <= RTOL * np.abs(expected))
+
+
+def test_distance_modulus_two_redshifts(eds, z):
+    """Test the two-redshift overload."""
+    mu = distance_modulus(eds, z[:1], z[1:])
+
+    expected = 5 * np.log10(eds.luminosity_distance(z[:1], z[1:])) + 25
+    assert np.all(np.abs(mu - expected) <= RTOL * np.abs(expected))
+
+
+def test_distance_modulus_dtype(eds, z):
+    """Test that the data type is preserved."""
+    z32 = np.astype(z, np.float32)
+    mu = distance_modulus(eds, z32)
+
+    assert mu.dtype == np.float32
+    expected = distance_modulus(eds, z)
+    assert np.all(np.abs(mu - expected) <= FLOAT32_RTOL * np.abs(expected))
+
+
+def test_distance_modulus_float(eds):
+    """Test that Python floats are supported."""
+    mu = distance_modulus(eds, 0.5)
+    assert float(mu) == pytest.approx(
+        float(distance_modulus(eds, np.asarray([0.5]))[0])
+    )
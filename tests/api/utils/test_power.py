@@ -0,0 +1,121 @@
+"""Test ``cosmology.api.utils.eisenstein_hu_transfer`` and its power spectrum."""
+
+from __future__ import annotations
+
+import math
+from types import SimpleNamespace
+
+import numpy.testing as npt
+import pytest
+
+from cosmology.api import HasLinearPowerSpectrum
+from cosmology.api.compat import InstrumentedCosmology
+from cosmology.api.utils import EisensteinHuPowerSpectrum, eisenstein_hu_transfer
+
+from ..conftest import np, requires_array_api
+
+SIGMA8 = 0.8159
+N_S = 0.9667
+H = 0.6774
+LARGE_SCALE_RTOL = 1e-4
+NOWIGGLE_RTOL = 0.05
+SIGMA8_RTOL = 1e-6
+MIN_CROSSINGS = 4
+FLOAT32_RTOL = 1e-5
+
+pytestmark = requires_array_api
+
+################################################################################
+# TESTS
+################################################################################
+
+
+@pytest.fixture
+def cosmo():
+    """A flat cosmology with the parameters of Planck 2015."""
+    return SimpleNamespace(
+        H0=np.asarray(100 * H),
+        Omega_m0=np.asarray(0.3089),
+        Omega_b0=np.asarray(0.0486),
+        T_cmb0=np.asarray(2.7255),
+        growth_factor=lambda z: 1 / (1 + np.asarray(z)),
+    )
+
+
+@pytest.mark.parametrize("wiggles", [True, False])
+def test_transfer(cosmo, wiggles):
+    """Test the limits and shape of the transfer function."""
+    k = np.exp(np.linspace(math.log(1e-5), math.log(10.0), 100))
+    t = eisenstein_hu_transfer(cosmo, k, wiggles=wiggles)
+
+    assert t.shape == k.shape
+    assert abs(t[0] - 1) < LARGE_SCALE_RTOL
+    assert np.all(t > 0)
+    assert np.all(t[1:] < t[:-1] + 1e-3)
+
+    t2 = eisenstein_hu_transfer(cosmo, np.reshape(k, (10, 10)), wiggles=wiggles)
+    assert np.all(t2 == np.reshape(t, (10, 10)))
+
+
+@pytest.mark.parametrize("wiggles", [True, False])
+def test_transfer_float32(cosmo, wiggles):
+    """Test that the transfer function keeps the dtype of the wavenumbers."""
+    k = np.exp(np.linspace(math.log(1e-5), math.log(10.0), 100))
+    t32 = eisenstein_hu_transfer(cosmo, np.astype(k, np.float32), wiggles=wiggles)
+
+    assert t32.dtype == np.float32
+    t = eisenstein_hu_transfer(cosmo, k, wiggles=wiggles)
+    npt.assert_allclose(np.asarray(t32), np.asarray(t), rtol=FLOAT32_RTOL)
+
+    power = EisensteinHuPowerSpectrum(cosmo, sigma8=SIGMA8, n_s=N_S, wiggles=wiggles)
+    z32 = np.asarray(0.5, dtype=np.float32)
+    assert power.linear_power_spectrum(np.astype(k, np.float32), z32).dtype == (
+        np.float32
+    )
+
+
+def test_wiggles(cosmo):
+    """Test that the wiggles oscillate around the zero-baryon form."""
+    k = np.linspace(0.01, 0.3, 300)
+    ratio = eisenstein_hu_transfer(cosmo, k) / eisenstein_hu_transfer(
+        cosmo, k, wiggles=False
+    )
+
+    assert np.all(np.abs(ratio - 1) < NOWIGGLE_RTOL)
+    # The ratio crosses one several times.
+    sign = np.sign(ratio - 1)
+    crossings = np.sum(np.astype(sign[1:] != sign[:-1], np.int64))
+    assert crossings >= MIN_CROSSINGS
+
+
+def test_sigma8(cosmo):
+    """Test the normalisation by direct integration."""
+    ps = EisensteinHuPowerSpectrum(cosmo, sigma8=SIGMA8, n_s=N_S)
+
+    lnk = np.linspace(math.log(1e-6), math.log(1e3), 200_001)
+    k = np.exp(lnk)
+    x = k * 8 / H
+    w = 3 * (np.sin(x) - x * np.cos(x)) / x**3
+    integrand = k**3 * ps.linear_power_spectrum(k, 0.0) * w**2 / (2 * np.pi**2)
+    sigma8 = np.sqrt(
+        np.sum((integrand[1:] + integrand[:-1]) / 2 * (lnk[1:] - lnk[:-1]))
+    )
+
+    assert abs(sigma8 - SIGMA8) < SIGMA8_RTOL * SIGMA8
+
+
+def test_outer_product(cosmo):
+    """Test the power spectrum on a grid with one call to the growth factor."""
+    instrumented = InstrumentedCosmology(cosmo, methods=["growth_factor"])
+    ps = EisensteinHuPowerSpectrum(instrumented, sigma8=SIGMA8, n_s=N_S, wiggles=False)
+
+    assert isinstance(ps, HasLinearPowerSpectrum)
+
+    k = np.exp(np.linspace(math.log(1e-4), math.log(10.0), 100))
+    z = np.linspace(0.0, 5.0, 20)
+    p = ps.linear_power_spectrum(k[:, None], z[None, :])
+
+    assert p.shape == (k.size, z.size)
+    assert instrumented.profile["growth_factor"].calls == 1
+    expected = ps.linear_power_spectrum(k, 0.0)[:, None] * (1 + z) ** -2
+    npt.assert_allclose(p, expected, rtol=1e-14, atol=0)
@@ -0,0 +1,109 @@
+"""Test ``cosmology.api.utils.RedshiftSampler``."""
+
+from __future__ import annotations
+
+import math
+
+import numpy.testing as npt
+import pytest
+from numpy.random import default_rng
+
+from cosmology.api.compat import InstrumentedCosmology
+from cosmology.api.utils import RedshiftSampler
+
+from ..conftest import np, requires_array_api
+
+RTOL = 1e-6
+Z_MIN = 0.1
+Z_MAX = 2.0
+SIZE = 100_000
+CHUNK_SIZE = 777
+SEED = 42
+
+pytestmark = requires_array_api
+
+################################################################################
+# TESTS
+################################################################################
+
+
+def _volume_cdf(eds, z):
+    """The cumulative distribution of redshifts uniform in comoving volume."""
+    v_min, v_max = eds.comoving_volume(Z_MIN), eds.comoving_volume(Z_MAX)
+    return (eds.comoving_volume(z) - v_min) / (v_max - v_min)
+
+
+def test_table(eds):
+    """Test that the density is tabulated once, on construction."""
+    cosmo = InstrumentedCosmology(eds)
+    sampler = RedshiftSampler(cosmo, Z_MIN, Z_MAX)
+    calls = cosmo.profile["differential_comoving_volume"].calls
+    sampler.sample(SIZE, rng=SEED, chunk_size=CHUNK_SIZE)
+    sampler.cdf(sampler.ppf(0.5))
+
+    assert cosmo.profile["differential_comoving_volume"].calls == calls
+
+    # The effective volume is the comoving volume per steradian.
+    volume = eds.comoving_volume(Z_MAX) - eds.comoving_volume(Z_MIN)
+    npt.assert_allclose(sampler.effective_volume, volume / (4 * math.pi), rtol=RTOL)
+
+
+def test_cdf(eds):
+    """Test the distribution and its inverse against the comoving volume."""
+    sampler = RedshiftSampler(eds, Z_MIN, Z_MAX)
+    z = np.linspace(Z_MIN, Z_MAX, 101)
+    u = _volume_cdf(eds, z)
+
+    npt.assert_allclose(sampler.cdf(z), u, atol=RTOL)
+    npt.assert_allclose(sampler.ppf(u), z, rtol=RTOL)
+    npt.assert_allclose(sampler.cdf(sampler.ppf(u)), u, atol=1e-14)
+    assert sampler.ppf(0.0) == Z_MIN
+    assert sampler.ppf(1.0) == Z_MAX
+
+
+def test_sample(eds):
+    """Test the samples with a selection function."""
+    sampler = RedshiftSampler(
+        eds, Z_MIN, Z_MAX, selection=lambda z: np.astype(z < 1, z.dtype)
+    )
+    z = sampler.sample(SIZE, rng=SEED)
+
+    assert z.shape == (SIZE,)
+    # The selection is linear within the grid interval of the cut.
+    step = sampler.z[1] - sampler.z[0]
+    assert np.all((z >= Z_MIN) & (z <= 1 + step))
+
+    # The empirical distribution is within its statistical fluctuations.
+    z = np.sort(z)
+    v_min, v_max = eds.comoving_volume(Z_MIN), eds.comoving_volume(1.0)
+    expected = (eds.comoving_volume(z) - v_min) / (v_max - v_min)
+    empirical = np.arange(1, SIZE + 1, dtype=np.float64) / SIZE
+    assert np.max(np.abs(empirical - expected)) < 2 / math.sqrt(SIZE)
+
+
+def test_reproducible(eds):
+    """Test that samples depend only on the seed, not on the chunks."""
+    sampler = RedshiftSampler(eds, Z_MIN, Z_MAX)
+    z = sampler.sample(SIZE, rng=SEED)
+
+    npt.assert_array_equal(sampler.sample(SIZE, rng=SEED, chunk_size=CHUNK_SIZE), z)
+    npt.assert_array_equal(sampler.sample(SIZE, rng=default_rng(SEED)), z)
+    assert np.any(sampler.sample(SIZE, rng=SEED + 1) != z)
+
+    out = np.empty(SIZE, dtype=np.float32)
+    assert sampler.sample(SIZE, rng=SEED, out=out) is out
+    npt.assert_array_equal(out, np.astype(z, np.float32))
+    assert sampler.sample(SIZE, rng=SEED, dtype=np.float32).dtype == np.float32
+
+    with pytest.raises(ValueError, match="output must have shape"):
+        sampler.sample(SIZE, out=np.empty(SIZE - 1))
+
+
+def test_invalid(eds):
+    """Test that invalid ranges and selection functions are rejected."""
+    with pytest.raises(ValueError, match="invalid redshift range"):
+        RedshiftSampler(eds, Z_MAX, Z_MIN)
+    with pytest.raises(ValueError, match="non-negative"):
+        RedshiftSampler(eds, Z_MIN, Z_MAX, selection=lambda z: -z)
+    with pytest.raises(ValueError, match="non-negative"):
+        RedshiftSampler(eds, Z_MIN, Z_MAX, selection=lambda z: 0 * z)
@@ -0,0 +1,95 @@
+"""Test ``cosmology.api.utils.SharedTables``."""
+
+from __future__ import annotations
+
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+from cosmology.api.utils import SharedTables, SharedTablesHandle
+
+
+def _sum_in_process(tables):
+    return {name: float(np.sum(table)) for name, table in tables.items()}
+
+
+@pytest.fixture
+def data():
+    z = np.linspace(0, 10, 100_000)
+    return {"z": z, "dc": 4000 * z / (1 + z), "n": np.arange(7, dtype=np.int32)}
+
+
+################################################################################
+# TESTS
+################################################################################
+
+
+def test_publish(data):
+    """Test that published tables are read-only copies of the data."""
+    with SharedTables.publish(data) as tables:
+        assert tables.owner
+        assert isinstance(tables.handle, SharedTablesHandle)
+        assert list(tables) == list(data)
+        assert len(tables) == len(data)
+        for name, table in tables.items():
+            assert table.dtype == data[name].dtype
+            np.testing.assert_array_equal(table, data[name])
+            assert not np.shares_memory(table, data[name])
+            assert not table.flags.writeable
+        del table
+
+
+def test_attach(data):
+    """Test attaching to published tables by handle."""
+    with SharedTables.publish(data) as tables:
+        with SharedTables.attach(tables.handle) as attached:
+            assert not attached.owner
+            for name in data:
+                np.testing.assert_array_equal(attached[name], data[name])
+
+        # closing the attached tables does not destroy them
+        np.testing.assert_array_equal(tables["dc"], data["dc"])
+
+    with pytest.raises(FileNotFoundError):
+        SharedTables.attach(tables.handle)
+
+
+def test_pickle(data):
+    """Test that pickling only sends the handle."""
+    with SharedTables.publish(data) as tables:
+        pickled = pickle.dumps(tables)
+        assert len(pickled) < data["z"].nbytes // 100
+
+        attached = pickle.loads(pickled)  # noqa: S301
+        assert not attached.owner
+        np.testing.assert_array_equal(attached["z"], data["z"])
+        attached.close()
+
+
+def test_process_pool(data):
+    """Test sharing tables with a process pool."""
+    expected = _sum_in_process(data)
+
+    with SharedTables.publish(data) as tables, ProcessPoolExecutor(2) as pool:
+        results = list(pool.map(_sum_in_process, [tables] * 4))
+
+    assert results == [expected] * 4
+
+
+def test_views_outlive_tables(data):
+    """Test that views of the tables remain valid after closing."""
+    tables = SharedTables.publish(data)
+    attached = SharedTables.attach(tables.handle)
+    z = tables["z"]
+    dc = attached["dc"][1:]
+
+    with pytest.warns(ResourceWarning, match="stays mapped"):
+        attached.close()
+    with pytest.warns(ResourceWarning, match="stays mapped"):
+        tables.unlink()
+
+    assert len(tables) == 0
+    np.testing.assert_array_equal(z, data["z"])
+    np.testing.assert_array_equal(dc, data["dc"][1:])
@@ -0,0 +1,134 @@
+"""Test ``cosmology.api.utils.MassVariance`` and ``mass_variance``."""
+
+from __future__ import annotations
+
+import math
+from types import SimpleNamespace
+
+import numpy.testing as npt
+import pytest
+
+from cosmology.api.compat import InstrumentedCosmology
+from cosmology.api.utils import (
+    EisensteinHuPowerSpectrum,
+    MassVariance,
+    mass_variance,
+    parameter_fingerprint,
+)
+
+from ..conftest import np, requires_array_api
+
+SIGMA8 = 0.8159
+N_S = 0.9667
+H = 0.6774
+RHO_CRIT_H2 = 2.775e11  # Msol Mpc-3 h2
+RTOL = 1e-5
+
+pytestmark = [
+    requires_array_api,
+    pytest.mark.skipif(
+        not hasattr(np, "fft"), reason="requires the fft extension of the array API"
+    ),
+]
+
+################################################################################
+# TESTS
+################################################################################
+
+
+@pytest.fixture
+def cosmo():
+    """A flat cosmology with the parameters of Planck 2015."""
+    return SimpleNamespace(
+        H0=np.asarray(100 * H),
+        Omega_m0=np.asarray(0.3089),
+        Omega_b0=np.asarray(0.0486),
+        T_cmb0=np.asarray(2.7255),
+        critical_density0=np.asarray(RHO_CRIT_H2 * H**2),
+        growth_factor=lambda z: 1 / (1 + np.asarray(z)),
+    )
+
+
+@pytest.fixture
+def power(cosmo):
+    return EisensteinHuPowerSpectrum(cosmo, sigma8=SIGMA8, n_s=N_S)
+
+
+def test_sigma(cosmo, power):
+    """Test the variance against direct integration for each radius."""
+    variance = MassVariance(cosmo, power)
+    r = np.exp(np.linspace(0.0, math.log(100.0), 7))
+
+    lnk = np.linspace(math.log(1e-6), math.log(1e4), 400_001)
+    k = np.exp(lnk)
+    x = k * r[:, None]
+    w = 3 * (np.sin(x) - x * np.cos(x)) / x**3
+    integrand = k**3 * power.linear_power_spectrum(k, 0.0) * w**2 / (2 * np.pi**2)
+    expected = np.sqrt(
+        np.sum(
+            (integrand[:, 1:] + integrand[:, :-1]) / 2 * (lnk[1:] - lnk[:-1]), axis=-1
+        )
+    )
+
+    result = variance.sigma(r)
+    assert result.shape == r.shape
+    assert np.all(np.abs(result - expected) <= RTOL * expected)
+    assert abs(variance.sigma(8 / H) - SIGMA8) <= RTOL * SIGMA8
+
+
+def test_redshift_grid(cosmo, power):
+    """Test that radii and redshifts broadcast with the growth factor."""
+    instrumented = InstrumentedCosmology(cosmo, methods=["growth_factor"])
+    variance = MassVariance(instrumented, power)
+
+    r = np.exp(np.linspace(0.0, math.log(100.0), 50))
+    z = np.linspace(0.0, 3.0, 4)
+    result = variance.sigma(r[:, None], z[None, :])
+
+    assert result.shape == (r.size, z.size)
+    assert instrumented.profile["growth_factor"].calls == 1
+    npt.assert_allclose(result, variance.sigma(r)[:, None] / (1 + z), rtol=1e-14)
+
+
+def test_sigma_mass(cosmo, power):
+    """Test that masses are converted to the radii of spheres of that mass."""
+    variance = MassVariance(cosmo, power)
+
+    r = np.exp(np.linspace(0.0, math.log(10.0), 5))
+    m = 4 / 3 * np.pi * float(cosmo.Omega_m0 * cosmo.critical_density0) * r**3
+    npt.assert_allclose(variance.sigma_mass(m), variance.sigma(r), rtol=1e-12)
+
+
+def test_range(cosmo, power):
+    """Test that radii outside the valid range are NaN."""
+    variance = MassVariance(cosmo, power, k_min=1e-4, k_max=1e2)
+
+    assert variance.r_min == pytest.approx(1.0)
+    assert variance.r_max == pytest.approx(100.0)
+    result = variance.sigma(np.asarray([0.5, 1.0, 100.0, 200.0]))
+    assert np.all(np.isnan(result) == np.asarray([True, False, False, True]))
+
+
+def test_mass_variance(eds_cls):
+    """Test that tables are reused for the same cosmology or key."""
+    cosmo = eds_cls()
+    variance = mass_variance(cosmo, sigma8=SIGMA8, n_s=N_S)
+
+    assert isinstance(variance, MassVariance)
+    assert mass_variance(cosmo, sigma8=SIGMA8, n_s=N_S) is variance
+    assert mass_variance(cosmo, sigma8=0.7, n_s=N_S) is not variance
+    assert mass_variance(eds_cls(), sigma8=SIGMA8, n_s=N_S) is not variance
+
+    key = parameter_fingerprint(cosmo)
+    variance = mass_variance(cosmo, sigma8=SIGMA8, n_s=N_S, key=key)
+    assert mass_variance(eds_cls(), sigma8=SIGMA8, n_s=N_S, key=key) is variance
+
+
+def test_mass_variance_growth(cosmo):
+    """Test that tables are not shared by cosmologies with other growth."""
+    other = SimpleNamespace(**{**vars(cosmo), "growth_factor": lambda z: z * 0 + 1})
+    variance = mass_variance(cosmo, sigma8=SIGMA8, n_s=N_S)
+    result = mass_variance(other, sigma8=SIGMA8, n_s=N_S)
+
+    assert result is not variance
+    npt.assert_allclose(result.sigma(8 / H, 1.0), 2 * variance.sigma(8 / H, 1.0))